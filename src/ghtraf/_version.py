@@ -20,6 +20,11 @@ __version__ = "0.3.6-alpha_main_21-20260303-49968de"
 __app_name__ = "ghtraf"
 
 
+# __version__ and PHASE are constants: split and map them once
+_PARTS = __version__.split("_")
+_PHASE_SUFFIX = {"alpha": "a0", "beta": "b0"}.get(PHASE, PHASE or "")
+
+
 def get_version():
     """Return the full version string including branch and build info."""
     return __version__
@@ -27,8 +32,8 @@ def get_version():
 
 def get_base_version():
     """Return the semantic version string (MAJOR.MINOR.PATCH[-PHASE])."""
-    if "_" in __version__:
-        return __version__.split("_")[0]
+    if len(_PARTS) > 1:
+        return _PARTS[0]
     base = f"{MAJOR}.{MINOR}.{PATCH}"
     if PHASE:
         base = f"{base}-{PHASE}"
@@ -43,28 +48,17 @@ def get_pip_version():
     - Main branch: 0.2.0-alpha_main_3-20260226-hash -> 0.2.0a0
     - Dev branch: 0.2.0-alpha_dev_3-20260226-hash -> 0.2.0a0.dev3
     """
-    base = f"{MAJOR}.{MINOR}.{PATCH}"
+    base = f"{MAJOR}.{MINOR}.{PATCH}{_PHASE_SUFFIX}"
 
-    # Map phase to PEP 440 pre-release segment
-    phase_map = {"alpha": "a0", "beta": "b0"}
-    if PHASE:
-        base += phase_map.get(PHASE, PHASE)
-
-    if "_" not in __version__:
+    if len(_PARTS) < 2 or _PARTS[1] == "main":
         return base
 
-    parts = __version__.split("_")
-    branch = parts[1] if len(parts) > 1 else "unknown"
-
-    if branch == "main":
-        return base
-    else:
-        build_info = "_".join(parts[2:]) if len(parts) > 2 else ""
-        build_num = build_info.split("-")[0] if "-" in build_info else "0"
-        return f"{base}.dev{build_num}"
+    build_info = "_".join(_PARTS[2:])
+    build_num = build_info.split("-")[0] if "-" in build_info else "0"
+    return f"{base}.dev{build_num}"
 
 
 # For convenience in imports
-VERSION = get_version()
+VERSION = __version__
 BASE_VERSION = get_base_version()
 PIP_VERSION = get_pip_version()
@@ -13,11 +13,8 @@ Usage:
     from ghtraf.channels import configure_gtt_channels, format_gtt_channel_list
 """
 
-from ghtraf.lib.log_lib import channels as _ch
-
-
-# GTT channel set
-GTT_CHANNELS = {
+# GTT channel set (frozen: these are constants shared with log_lib)
+GTT_CHANNELS = frozenset({
     'api',          # GitHub API calls and responses
     'config',       # Configuration loading and resolution
     'gist',         # Gist operations (create, read, update)
@@ -26,7 +23,10 @@ GTT_CHANNELS = {
     'hint',         # Contextual tips and suggestions
     'error',        # Error messages
     'trace',        # Function tracing (@trace decorator)
-}
+    'trace.entry',  # @trace call entry with arguments
+    'trace.exit',   # @trace return values
+    'trace.exc',    # @trace raised exceptions
+})
 
 GTT_CHANNEL_DESCRIPTIONS = {
     'api':      'GitHub API calls and responses',
@@ -37,11 +37,14 @@ GTT_CHANNEL_DESCRIPTIONS = {
     'hint':     'Contextual tips and suggestions',
     'error':    'Error messages',
     'trace':    'Function call tracing',
+    'trace.entry': 'Traced calls with their arguments',
+    'trace.exit':  'Traced return values',
+    'trace.exc':   'Exceptions raised by traced calls',
 }
 
-GTT_OPT_IN_CHANNELS = {
+GTT_OPT_IN_CHANNELS = frozenset({
     'trace',    # Function call tracing — opt-in (verbose debug output)
-}
+})
 
 # Channel FD defaults: which file handle each channel writes to.
 # general and hint are user-facing → stdout.
@@ -65,18 +68,26 @@ def configure_gtt_channels():
     Returns:
         dict mapping channel names to their default file handles
     """
+    # Imported here so the --show listing doesn't pull in log_lib
+    from ghtraf.lib.log_lib import channels as _ch
+
     _ch.KNOWN_CHANNELS = GTT_CHANNELS
     _ch.CHANNEL_DESCRIPTIONS = GTT_CHANNEL_DESCRIPTIONS
     _ch.OPT_IN_CHANNELS = GTT_OPT_IN_CHANNELS
     return GTT_CHANNEL_FDS
 
 
+# The channel tables are constants, so the --show listing is built once.
+_SORTED_CHANNELS = tuple(sorted(GTT_CHANNELS))
+_MAX_NAME = max(len(name) for name in GTT_CHANNELS)
+_CHANNEL_LIST_STR = "\n".join(
+    ["Available channels:"]
+    + [f"  {name:<{_MAX_NAME}}  {GTT_CHANNEL_DESCRIPTIONS.get(name, '')}"
+       f"{' (opt-in)' if name in GTT_OPT_IN_CHANNELS else ''}"
+       for name in _SORTED_CHANNELS]
+)
+
+
 def format_gtt_channel_list() -> str:
     """Format GTT channels for --show listing."""
-    lines = ["Available channels:"]
-    max_name = max(len(name) for name in GTT_CHANNELS)
-    for name in sorted(GTT_CHANNELS):
-        desc = GTT_CHANNEL_DESCRIPTIONS.get(name, '')
-        opt_in = " (opt-in)" if name in GTT_OPT_IN_CHANNELS else ""
-        lines.append(f"  {name:<{max_name}}  {desc}{opt_in}")
-    return "\n".join(lines)
+    return _CHANNEL_LIST_STR
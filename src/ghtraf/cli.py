@@ -1,17 +1,23 @@
 """Main CLI entry point for ghtraf.
 
-Implements a Docker-style two-pass argument parser:
-  1. First pass: extract global flags (--verbose, --no-color, --config)
-  2. Second pass: dispatch to subcommand with shared parent args
+Global flags (--verbose, --no-color, --config, ...) live on a shared
+parent parser that both the main parser and every subcommand inherit,
+so argv is parsed in a single parse_args() call.
 
 Global flags can appear before OR after the subcommand:
   ghtraf --verbose create --owner X      # works
   ghtraf create --owner X --verbose      # also works
 
-Subcommands self-register via register(subparsers, parents) convention.
+Subcommands self-register via register(subparsers, parents) convention,
+and are imported lazily: only the command named in argv is loaded.
+
+Parsers are built once per process and reused, so repeated in-process
+main() calls (DazzleCMD embedding) skip all add_argument() work. argparse
+itself is imported only when a parser is first built.
 """
 
-import argparse
+import functools
+import importlib
 import sys
 
 from ghtraf._version import BASE_VERSION, VERSION
@@ -34,31 +40,104 @@ GLOBAL_FLAGS = {
 }
 
 
-def _extract_global_flags(argv):
-    """Two-pass parse: pull global flags from anywhere in argv.
+# argparse copies a subparser's namespace over the main one, so if the
+# subcommand's copies of the global flags shared dests with the main
+# parser, `ghtraf -v create` would be reset to the subparser default.
+# They get prefixed dests instead and _merge_global_flags() folds them in.
+_SUBCOMMAND_DEST_PREFIX = "sub_"
+
+
+def _global_dest(flag):
+    """Return the namespace attribute for a GLOBAL_FLAGS key."""
+    return flag.lstrip("-").replace("-", "_")
 
-    Returns (global_namespace, remaining_argv).
+
+@functools.lru_cache(maxsize=None)
+def _build_global_parent(dest_prefix=""):
+    """Build an add_help=False parent parser carrying GLOBAL_FLAGS.
+
+    With a dest_prefix the flags default to SUPPRESS, so they only reach
+    the namespace when actually given after the subcommand. Each variant
+    is built once, on first use — the --version/--show fast paths in
+    main() never need one.
     """
-    global_parser = argparse.ArgumentParser(add_help=False)
+    import argparse  # deferred: the fast paths in main() never need it
+
+    parent = argparse.ArgumentParser(add_help=False)
     for flag, kwargs in GLOBAL_FLAGS.items():
-        aliases = kwargs.pop("aliases", [])
-        global_parser.add_argument(flag, *aliases, **kwargs)
-        if aliases:
-            kwargs["aliases"] = aliases  # restore for reuse
+        kw = {k: v for k, v in kwargs.items() if k != "aliases"}
+        kw["dest"] = dest_prefix + _global_dest(flag)
+        if dest_prefix:
+            kw["default"] = argparse.SUPPRESS
+        parent.add_argument(flag, *kwargs.get("aliases", []), **kw)
+    return parent
+
+
+# Subcommand dest → (main dest, action), for _merge_global_flags()
+_SUBCOMMAND_GLOBAL_DESTS = {
+    _SUBCOMMAND_DEST_PREFIX + _global_dest(flag): (_global_dest(flag),
+                                                   kwargs.get("action"))
+    for flag, kwargs in GLOBAL_FLAGS.items()
+}
+
+
+def _merge_global_flags(args):
+    """Fold global flags given after the subcommand into args.
+
+    Counts add up and --show values accumulate, so `ghtraf -v create -v`
+    means -vv just as it did with the flags side by side. The usual case
+    — no global flags after the subcommand — is a single key intersection.
+    """
+    ns = vars(args)
+    for sub_dest in _SUBCOMMAND_GLOBAL_DESTS.keys() & ns.keys():
+        dest, action = _SUBCOMMAND_GLOBAL_DESTS[sub_dest]
+        value = ns.pop(sub_dest)
+        if action == "count":
+            ns[dest] = (ns[dest] or 0) + value
+        elif action == "append":
+            ns[dest] = (ns[dest] or []) + value
+        else:
+            ns[dest] = value
+    return args
 
-    global_args, remaining = global_parser.parse_known_args(argv)
-    return global_args, remaining
+
+# Global flags whose next token is consumed as a value when it isn't an
+# option (--config PATH, --show CHANNEL[:LEVEL]).
+_GLOBAL_VALUE_FLAGS = ("--show", "--config")
+
+
+def _is_negative_number(arg):
+    """Match argparse's negative-number pattern (-5, -.5, -1.5) without re."""
+    whole, dot, frac = arg[1:].partition(".")
+    if not dot:
+        return whole.isdecimal()
+    return frac.isdecimal() and (not whole or whole.isdecimal())
+
+
+def _is_flag_value(arg):
+    """True if argparse would treat arg as a value rather than an option."""
+    if not arg.startswith("-") or arg == "-":
+        return True
+    return _is_negative_number(arg) or " " in arg
 
 
 # ---------------------------------------------------------------------------
 # Shared parent parser (inherited by all subcommands via parents=[])
 # ---------------------------------------------------------------------------
+@functools.lru_cache(maxsize=1)
 def _build_common_parser():
     """Build the shared argument parser for repo-scoped flags.
 
     These are inherited by every subcommand — defined once, zero duplication.
+    The global flags come along too, so they are accepted after the
+    subcommand name.
     """
-    common = argparse.ArgumentParser(add_help=False)
+    import argparse
+
+    common = argparse.ArgumentParser(
+        add_help=False,
+        parents=[_build_global_parent(_SUBCOMMAND_DEST_PREFIX)],
+    )
     common.add_argument("--owner", metavar="NAME",
                         help="GitHub username or organization")
     common.add_argument("--repo", metavar="NAME",
@@ -75,21 +154,64 @@ def _build_common_parser():
 # ---------------------------------------------------------------------------
 # Subcommand discovery and registration
 # ---------------------------------------------------------------------------
-def _discover_commands():
-    """Import and return all command modules.
+# Command name → (module path, one-line help for the top-level listing).
+# The help text must match the command's own register() call; listing it
+# here lets 'ghtraf --help' show every command without importing any.
+_COMMAND_REGISTRY = {
+    "create": ("ghtraf.commands.create",
+               "Create gists, deploy templates, and configure a repository"),
+    # Future commands added here:
+    # "status": ("ghtraf.commands.status", "..."),
+}
+
+
+def _find_command(argv):
+    """Return the subcommand named in argv, or None.
+
+    The subcommand is the first positional token that isn't the value
+    of a preceding global flag (e.g. the PATH in --config PATH).
+    """
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg in _GLOBAL_VALUE_FLAGS:
+            if i + 1 < len(argv) and _is_flag_value(argv[i + 1]):
+                i += 1
+        elif not arg.startswith("-"):
+            return arg if arg in _COMMAND_REGISTRY else None
+        i += 1
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _discover_commands(name=None):
+    """Import and return the command modules for this invocation.
+
+    Only the selected command is imported (as a 1-tuple, for caching);
+    with no selection nothing is imported and every command is shown
+    via a lightweight help stub in _build_parser().
 
     Each module in ghtraf.commands must export:
       register(subparsers, parents) — add itself to the subparser
       run(args, global_args) — execute the command
     """
-    from ghtraf.commands import create
-    # Future commands added here:
-    # from ghtraf.commands import status, list_cmd, upgrade, verify
-    return [create]
+    if name not in _COMMAND_REGISTRY:
+        return ()
+    module_path, _ = _COMMAND_REGISTRY[name]
+    return (importlib.import_module(module_path),)
 
 
+@functools.lru_cache(maxsize=None)
 def _build_parser(commands, common_parser):
-    """Build the main argparse parser with subcommand dispatch."""
+    """Build the main argparse parser with subcommand dispatch.
+
+    Cached on the identity of (commands, common_parser) — both come from
+    cached builders, so every main() call after the first reuses it.
+    Registered commands that weren't imported get a help-only stub so
+    they still appear in the listing and are valid choices.
+    """
+    import argparse
+
     parser = argparse.ArgumentParser(
         prog="ghtraf",
         description="ghtraf — GitHub Traffic Tracker CLI",
@@ -100,6 +222,7 @@ def _build_parser(commands, common_parser):
             "before or after the subcommand."
         ),
         formatter_class=argparse.RawDescriptionHelpFormatter,
+        parents=[_build_global_parent()],
     )
     parser.add_argument(
         "--version", "-V",
@@ -107,21 +230,20 @@ def _build_parser(commands, common_parser):
         version=f"ghtraf {BASE_VERSION} ({VERSION})",
     )
 
-    # Add global flags to main parser too (for --help display)
-    for flag, kwargs in GLOBAL_FLAGS.items():
-        kw = {k: v for k, v in kwargs.items() if k != "aliases"}
-        aliases = kwargs.get("aliases", [])
-        parser.add_argument(flag, *aliases, **kw)
-
     subparsers = parser.add_subparsers(
         dest="command",
         title="commands",
         metavar="<command>",
     )
 
-    # Let each command register itself
+    # Let each loaded command register itself; stub the rest
+    loaded = set()
     for cmd_module in commands:
         cmd_module.register(subparsers, parents=[common_parser])
+        loaded.add(cmd_module.__name__)
+    for name, (module_path, summary) in _COMMAND_REGISTRY.items():
+        if module_path not in loaded:
+            subparsers.add_parser(name, help=summary)
 
     return parser
 
@@ -142,47 +264,46 @@ def main(argv=None):
     if argv is None:
         argv = sys.argv[1:]
 
-    # Pass 1: extract global flags from anywhere in the arg list
-    global_args, remaining = _extract_global_flags(argv)
+    # Fast paths: answer these before building any parser or loading
+    # log_lib (argparse would reach the same result for each)
+    if not argv or argv[0] in ("--help", "-h"):
+        _build_parser(_discover_commands(), _build_common_parser()).print_help()
+        return 0
+    if argv[0] in ("--version", "-V"):
+        print(f"ghtraf {BASE_VERSION} ({VERSION})")
+        return 0
+    if argv == ["--show"]:
+        from ghtraf.channels import format_gtt_channel_list
+        print(format_gtt_channel_list())
+        return 0
+
+    common_parser = _build_common_parser()
+    commands = _discover_commands(_find_command(argv))
+    parser = _build_parser(commands, common_parser)
+    args = _merge_global_flags(parser.parse_args(argv))
 
     # Handle bare --show (list channels and exit)
-    if global_args.show and None in global_args.show:
+    if args.show and None in args.show:
         from ghtraf.channels import format_gtt_channel_list
         print(format_gtt_channel_list())
         return 0
 
     # Initialize THAC0 output system
-    verbosity = (global_args.verbose or 0) - (global_args.quiet or 0)
-    channels = [s for s in (global_args.show or []) if s is not None]
+    verbosity = (args.verbose or 0) - (args.quiet or 0)
+    channels = [s for s in (args.show or []) if s is not None]
     from ghtraf.channels import configure_gtt_channels
     from ghtraf.lib.log_lib import init_output
     channel_fds = configure_gtt_channels()
     init_output(verbosity=verbosity, channels=channels, channel_fds=channel_fds)
-    import ghtraf.hints  # noqa: F401 — register GTT hints
-
-    # Pass 2: parse subcommand + shared/specific args
-    common_parser = _build_common_parser()
-    commands = _discover_commands()
-    parser = _build_parser(commands, common_parser)
-
-    # If no args at all, print help
-    if not remaining:
-        parser.print_help()
-        return 0
-
-    args = parser.parse_args(remaining)
 
-    # If subcommand selected but no handler, print help
+    # No subcommand selected: print help
     if not hasattr(args, "func"):
         parser.print_help()
         return 0
 
-    # Merge global args into the namespace for convenience
-    for key, value in vars(global_args).items():
-        if key not in vars(args) or getattr(args, key) is None:
-            setattr(args, key, value)
-
-    # Dispatch
+    # Dispatch. args stays an argparse.Namespace: SimpleNamespace reads
+    # attributes through the same __dict__, and a __slots__ class can't
+    # cover the per-command dests that handlers probe with getattr().
     try:
         return args.func(args) or 0
     except KeyboardInterrupt:
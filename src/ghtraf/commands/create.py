@@ -10,23 +10,20 @@ Use --files-only to deploy template files without cloud setup
 Equivalent to the standalone setup-gists.py script.
 """
 
-import html as html_module
-import re
+import functools
 import shutil
 import sys
 from datetime import date
-from importlib.resources import as_file, files
 from pathlib import Path
 
-from ghtraf import gh, gist, configure
-from ghtraf.config import find_project_config, register_repo_globally, save_project_config
+# gh, gist, configure, html, importlib.resources and plan_lib are imported
+# inside the functions that use them, so loading this module for
+# 'ghtraf create --help' stays cheap.
+from ghtraf.config import find_repo_markers, register_repo_globally, save_project_config
 from ghtraf.lib.core_lib.types import (
     Action, ActionResult, ConflictResolution, FileCategory, Plan,
 )
 from ghtraf.lib.log_lib import get_output
-from ghtraf.lib.plan_lib.executor import execute_plan
-from ghtraf.lib.plan_lib.file_ops import scan_destination
-from ghtraf.lib.plan_lib.renderer import DefaultTextRenderer
 from ghtraf.output import (
     print_banner, print_dry, print_error, print_info, print_ok,
     print_skip, print_step, print_warn, prompt,
@@ -90,6 +87,9 @@ def register(subparsers, parents):
     p.add_argument("--gist-token-name", default="TRAFFIC_GIST_TOKEN",
                    help="Name for the gist token secret "
                         "(default: TRAFFIC_GIST_TOKEN)")
+    p.add_argument("--no-cache", action="store_true",
+                   help="Re-check gh auth, scopes and username instead of "
+                        "using cached results")
 
     p.set_defaults(func=run)
 
@@ -111,51 +111,54 @@ def _discover_repo_dir(args):
     if args.repo_dir:
         return Path(args.repo_dir).resolve()
 
-    # 2. Walk up for .ghtraf.json (project-specific — safe, no confirmation)
-    cfg_path = find_project_config()
+    cwd = Path.cwd().resolve()
+
+    # 2. Walk up for .ghtraf.json (project-specific — safe, no confirmation);
+    #    the same walk records the nearest .git for step 3
+    cfg_path, git_dir = find_repo_markers(cwd)
     if cfg_path:
         return cfg_path.parent
 
-    cwd = Path.cwd().resolve()
-
-    # 3. Walk up for .git
-    current = cwd
-    for _ in range(20):
-        if (current / ".git").exists():
-            if current != cwd:
-                # .git found in a parent dir — confirm before using
-                non_interactive = getattr(args, 'non_interactive', False)
-                if not non_interactive:
-                    print_info(
-                                f"\n  No .ghtraf.json found in current directory.\n"
-                                f"  Found git repository at: {current}"
-                    )
-                    response = input(
-                        "  Use this directory? [Y/n]: "
-                    ).strip().lower()
-                    if response in ('n', 'no'):
-                        print_info(f"  Using current directory instead: {cwd}")
-                        return cwd
-                else:
-                    print_warn(
-                        f"Using parent git repo: {current} (no .ghtraf.json in cwd)"
-                    )
-            return current
-        parent = current.parent
-        if parent == current:
-            break
-        current = parent
+    # 3. Nearest .git
+    if git_dir is not None:
+        if git_dir != cwd:
+            # .git found in a parent dir — confirm before using
+            non_interactive = getattr(args, 'non_interactive', False)
+            if not non_interactive:
+                print_info(
+                            f"\n  No .ghtraf.json found in current directory.\n"
+                            f"  Found git repository at: {git_dir}"
+                )
+                response = input(
+                    "  Use this directory? [Y/n]: "
+                ).strip().lower()
+                if response in ('n', 'no'):
+                    print_info(f"  Using current directory instead: {cwd}")
+                    return cwd
+            else:
+                print_warn(
+                    f"Using parent git repo: {git_dir} (no .ghtraf.json in cwd)"
+                )
+        return git_dir
 
     # 4. Fall back to cwd
     return cwd
 
 
+@functools.lru_cache(maxsize=1)
 def _get_template_root():
     """Return the package templates root as a Traversable.
 
     Separated for testability — tests can mock this to provide
     a temporary directory instead of the installed package.
+
+    Memoised, since the package location cannot change within a run.
+    Patching this name replaces the cached function outright; a test
+    that instead patches importlib.resources.files() must call
+    _get_template_root.cache_clear() first.
     """
+    from importlib.resources import files
+
     return files('ghtraf') / 'templates'
 
 
@@ -184,6 +187,28 @@ def _prompt_overwrite(rel_path, non_interactive):
         print_info("  Please enter y, n, a, or s.")
 
 
+def _prompt_conflicts(targets):
+    """Ask once how to handle several conflicting files.
+
+    Returns: 'a' (overwrite all), 's' (skip all),
+             or None (fall back to asking per file).
+    """
+    print_info(f"\n  {len(targets)} template files already exist:")
+    print_info("\n".join(f"    {t}" for t in targets))
+    while True:
+        response = input(
+            f"  Overwrite all {len(targets)}? "
+            "[y/N/e(ach — ask per file)] (default: skip all): "
+        ).strip().lower()
+        if response in ('', 'n'):
+            return 's'
+        if response == 'y':
+            return 'a'
+        if response in ('e', 'each'):
+            return None
+        print_info("  Please enter y, n, or e.")
+
+
 def plan_files(
     repo_dir,
     src_root,
@@ -207,12 +232,20 @@ def plan_files(
     Returns:
         Plan with command="create --files-only" and file actions.
     """
-    # Build source_files mapping for scan_destination
+    from ghtraf.lib.plan_lib.file_ops import scan_destination
+
+    # Resolve every source path once; report a broken install up front
+    # rather than silently planning fewer files.
     source_files = {}
+    missing = []
     for rel_path in TEMPLATE_FILES:
         src_file = src_root / rel_path
         if src_file.is_file():
             source_files[str(rel_path)] = str(src_file)
+        else:
+            missing.append(str(rel_path))
+    if missing:
+        print_warn("Missing packaged template(s): " + ", ".join(missing))
 
     scan_result = scan_destination(source_files, repo_dir, quick=False)
 
@@ -272,16 +305,19 @@ def plan_files(
     return Plan(command="create --files-only", actions=actions)
 
 
-def make_files_executor(template_root, repo_dir):
+def make_files_executor(template_root, repo_dir, conflict_choice=None):
     """Create an executor function for file deployment actions.
 
     Must be called inside as_file() context so template_root is a real Path.
 
     Handles: copy, overwrite, skip operations.
-    For conflict=ASK actions, prompts the user at execution time.
+    For conflict=ASK actions, prompts the user at execution time unless
+    conflict_choice ('a' overwrite all / 's' skip all, as returned by
+    _prompt_conflicts()) already settled them.
     """
-    overwrite_all = False
-    skip_all = False
+    overwrite_all = conflict_choice == 'a'
+    skip_all = conflict_choice == 's'
+    made_dirs = set()  # parents already ensured; templates share docs/stats/
 
     def files_executor(action):
         nonlocal overwrite_all, skip_all
@@ -319,9 +355,13 @@ def make_files_executor(template_root, repo_dir):
                         message=f"Skipped {action.target} (skip all)",
                     )
 
-        # Perform the copy
-        dest_file.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(src_file, dest_file)
+        # Perform the copy. Content only: copyfile() takes the kernel
+        # fast path (sendfile) where available, and template mtimes and
+        # permissions from site-packages mean nothing in the user's repo.
+        if dest_file.parent not in made_dirs:
+            dest_file.parent.mkdir(parents=True, exist_ok=True)
+            made_dirs.add(dest_file.parent)
+        shutil.copyfile(src_file, dest_file)
 
         verb = "Overwrote" if action.operation == "overwrite" else "Copied"
         return ActionResult(
@@ -334,6 +374,11 @@ def make_files_executor(template_root, repo_dir):
 
 def _run_files_only(args):
     """Deploy template files using plan-execute pattern."""
+    from importlib.resources import as_file
+
+    from ghtraf.lib.plan_lib.executor import execute_plan
+    from ghtraf.lib.plan_lib.renderer import DefaultTextRenderer
+
     dry_run = args.dry_run
     force = getattr(args, 'force', False)
     skip_existing = getattr(args, 'skip_existing', False)
@@ -368,8 +413,15 @@ def _run_files_only(args):
             print_info("\nAll template files are up to date.")
             return 0
 
+        # Several conflicts: one question up front instead of one per file
+        conflict_choice = None
+        asks = [a.target for a in plan.actions
+                if a.conflict == ConflictResolution.ASK]
+        if len(asks) > 1 and not dry_run:
+            conflict_choice = _prompt_conflicts(asks)
+
         # Execute plan
-        executor = make_files_executor(src_root, repo_dir)
+        executor = make_files_executor(src_root, repo_dir, conflict_choice)
         results = execute_plan(plan, executor, dry_run=dry_run)
 
     # Summary — in dry_run, execute_plan marks all as skipped, so count by operation
@@ -400,8 +452,26 @@ def _run_files_only(args):
 # ---------------------------------------------------------------------------
 # Cloud setup helpers
 # ---------------------------------------------------------------------------
+# Repo-name separators that become spaces in the default display name.
+_NAME_SEPARATORS = str.maketrans("-_", "  ")
+
+
+def _default_display_name(repo):
+    """Derive a title-cased display name from a repo name (my-repo → My Repo)."""
+    return repo.translate(_NAME_SEPARATORS).title()
+
+
 def _gather_config(args):
-    """Build config dict, prompting for any missing values."""
+    """Build config dict from flags and auto-detected defaults.
+
+    Only owner and repo are prompted for (when missing) since they have
+    no sensible default. Everything else is filled in up front and can
+    be edited afterwards on the single review screen (_review_config).
+    """
+    import html
+
+    from ghtraf import gh
+
     config = {}
     non_interactive = args.non_interactive
 
@@ -430,61 +500,160 @@ def _gather_config(args):
         config["created"] = args.created
     else:
         auto_date = gh.get_repo_created_date(config["gh_repo"])
-        if non_interactive:
-            config["created"] = auto_date or date.today().isoformat()
-        elif auto_date:
-            config["created"] = prompt(
-                "Repository creation date (YYYY-MM-DD)", default=auto_date)
-        else:
-            config["created"] = prompt(
-                "Repository creation date (YYYY-MM-DD)",
-                default=date.today().isoformat())
+        config["created"] = auto_date or date.today().isoformat()
 
     # Display name
     if args.display_name:
         config["display_name"] = args.display_name
-    elif non_interactive:
-        config["display_name"] = (config["repo"]
-                                  .replace("-", " ")
-                                  .replace("_", " ")
-                                  .title())
     else:
-        default_name = (config["repo"]
-                        .replace("-", " ")
-                        .replace("_", " ")
-                        .title())
-        config["display_name"] = prompt(
-            "Display name for dashboard", default=default_name)
+        config["display_name"] = _default_display_name(config["repo"])
 
     # CI workflows
     if args.ci_workflows is not None:
         config["ci_workflows"] = args.ci_workflows
-    elif non_interactive:
-        config["ci_workflows"] = []
     else:
+        config["ci_workflows"] = []
+
+    config["display_name_html"] = html.escape(config["display_name"])
+
+    return config
+
+
+# Fields editable on the review screen: (config key, display label).
+# Users pick a field by typing either the key or the label.
+REVIEW_FIELDS = [
+    ("owner", "Owner"),
+    ("repo", "Repository"),
+    ("created", "Created"),
+    ("display_name", "Display Name"),
+    ("ci_workflows", "CI Workflows"),
+]
+
+
+def _format_review(config, configure_files):
+    """Format the resolved configuration as an aligned summary block."""
+    ci_display = (', '.join(config['ci_workflows'])
+                  if config['ci_workflows'] else '(none)')
+    will_configure = 'yes' if configure_files else 'no'
+    return (    f"\n"
+                f"  Owner:        {config['owner']}\n"
+                f"  Repository:   {config['repo']}\n"
+                f"  Created:      {config['created']}\n"
+                f"  Display Name: {config['display_name']}\n"
+                f"  CI Workflows: {ci_display}\n"
+                f"  Configure:    {will_configure}"
+    )
+
+
+def _resolve_review_field(response):
+    """Map a review-screen response to a REVIEW_FIELDS key, or None."""
+    normalized = response.replace(" ", "_").replace("-", "_")
+    for key, label in REVIEW_FIELDS:
+        if normalized in (key, label.lower().replace(" ", "_")):
+            return key
+    return None
+
+
+def _edit_review_field(config, key, detect_created=False):
+    """Prompt for a new value of one review field and update config.
+
+    With detect_created, editing owner or repo re-runs the created-date
+    lookup for the new repository. An edited date is re-prompted until
+    it is a valid YYYY-MM-DD.
+    """
+    import html
+
+    if key == "ci_workflows":
         ci_input = input(
             "  CI workflow names to trigger after "
-            "(comma-separated, Enter to skip): "
+            "(comma-separated, Enter for none): "
         ).strip()
-        if ci_input:
-            config["ci_workflows"] = [
-                w.strip() for w in ci_input.split(",") if w.strip()
-            ]
-        else:
-            config["ci_workflows"] = []
+        config["ci_workflows"] = [
+            w.strip() for w in ci_input.split(",") if w.strip()
+        ]
+        return
 
-    config["display_name_html"] = html_module.escape(config["display_name"])
+    label = dict(REVIEW_FIELDS)[key]
+    config[key] = prompt(label, default=config[key])
+    if key in ("owner", "repo"):
+        config["gh_repo"] = f"{config['owner']}/{config['repo']}"
+        if detect_created:
+            from ghtraf import gh
+            auto_date = gh.get_repo_created_date(config["gh_repo"])
+            config["created"] = auto_date or date.today().isoformat()
+    elif key == "created":
+        while not _is_iso_date(config["created"]):
+            print_error(f"Invalid date format '{config['created']}'. "
+                        "Expected YYYY-MM-DD.")
+            config["created"] = prompt(label)
+    elif key == "display_name":
+        config["display_name_html"] = html.escape(config["display_name"])
 
-    return config
 
+def _review_config(config, configure_files, detect_created=False):
+    """Show the resolved configuration once and let the user edit it.
+
+    Replaces the former chain of per-field prompts plus "Proceed?" with
+    a single accept-or-edit loop: blank input accepts, a field name edits
+    that field, 'q' cancels. Keeps interactive runs scriptable via heredocs.
 
-def _validate_config(config):
-    """Validate configuration values."""
-    if not re.match(r"^\d{4}-\d{2}-\d{2}$", config["created"]):
+    detect_created (no --created given) keeps the created date tracking
+    owner/repo edits until the user sets the date by hand.
+
+    Returns:
+        True if the configuration was accepted, False if cancelled.
+    """
+    while True:
+        print_info(_format_review(config, configure_files))
+        print_info("")
+        response = input(
+            "  Edit any field? (blank=accept, field=edit, q=cancel): "
+        ).strip().lower()
+        if not response:
+            return True
+        if response in ('q', 'quit'):
+            return False
+        key = _resolve_review_field(response)
+        if key is None:
+            fields = ", ".join(k for k, _ in REVIEW_FIELDS)
+            print_info(f"  Unknown field '{response}'. Choose one of: {fields}")
+            continue
+        _edit_review_field(config, key, detect_created=detect_created)
+        if key == "created":
+            detect_created = False
+
+
+def _is_iso_date(value):
+    """True if value is a real calendar date written as YYYY-MM-DD.
+
+    The shape check keeps out the other forms fromisoformat() accepts
+    on newer Pythons (e.g. 20260101).
+    """
+    if len(value) != 10 or value[4] != "-" or value[7] != "-":
+        return False
+    try:
+        date.fromisoformat(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _validate_config(config, check_repo=True):
+    """Validate configuration values.
+
+    check_repo=False skips the repo-exists round trip; its only effect
+    is a warning about variables/secrets, moot under --skip-variables.
+    """
+    from ghtraf import gh
+
+    if not _is_iso_date(config["created"]):
         print_error(f"Invalid date format '{config['created']}'. "
                     "Expected YYYY-MM-DD.")
         sys.exit(1)
 
+    if not check_repo:
+        return
+
     repo_exists = gh.check_repo_exists(config["gh_repo"])
     if not repo_exists:
         print_warn(f"Repository {config['gh_repo']} not found on GitHub.")
@@ -496,6 +665,8 @@ def _validate_config(config):
 
 def _guide_token_setup(config, dry_run=False):
     """Guide user through PAT creation and offer to set the secret."""
+    from ghtraf import gh
+
     token_name = config.get("gist_token_name", "TRAFFIC_GIST_TOKEN")
     gh_repo = config["gh_repo"]
 
@@ -534,6 +705,10 @@ def _guide_token_setup(config, dry_run=False):
 
 def run(args):
     """Execute the create command."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from ghtraf import configure, gh, gist
+
     # Dispatch to template deployment if --files-only
     if getattr(args, 'files_only', False):
         return _run_files_only(args)
@@ -554,26 +729,42 @@ def run(args):
     version = gh.check_gh_installed()
     print_ok(f"gh CLI found ({version})")
 
-    out.emit(1, "  [api] Checking GitHub authentication...", channel='api')
-    auth_output = gh.check_gh_authenticated()
-    # Extract login line for display
-    for line in auth_output.split("\n"):
-        if "Logged in to" in line and "account" in line:
-            print_ok(line.strip().lstrip("\u2713").strip())
-            break
-
-    has_gist_scope = gh.check_gh_scopes(auth_output)
-    if not has_gist_scope:
-        print_warn("Your gh CLI token may not have 'gist' scope.\n"
-                   "  Run: gh auth refresh -s gist")
-        if not args.non_interactive:
-            resp = input("  Continue anyway? (y/N): ").strip().lower()
-            if resp != "y":
-                sys.exit(1)
-    else:
-        print_ok("Token has gist access")
+    # Each check is a gh round trip, so overlap them: the gist-scope
+    # probe is silent and runs alongside auth status; the username lookup
+    # starts once auth has passed, so a logged-out run reports only the
+    # auth error. Messages are still printed here, in order.
+    # When owner/repo came from flags, the repos/{repo} lookup (memoised
+    # in gh, shared by the created-date default and the existence check)
+    # is warmed alongside; a failed auth check exits before it is used.
+    use_cache = not args.no_cache
+    needs_repo_lookup = not args.created or not args.skip_variables
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        scope_future = pool.submit(gh.check_gh_scopes, use_cache=use_cache)
+        if args.owner and args.repo and needs_repo_lookup:
+            pool.submit(gh.check_repo_exists, f"{args.owner}/{args.repo}")
+
+        out.emit(1, "  [api] Checking GitHub authentication...", channel='api')
+        auth_output = gh.check_gh_authenticated(use_cache=use_cache)
+        username_future = pool.submit(gh.resolve_github_username,
+                                      use_cache=use_cache)
+        # Extract login line for display
+        for line in auth_output.split("\n"):
+            if "Logged in to" in line and "account" in line:
+                print_ok(line.strip().lstrip("\u2713").strip())
+                break
+
+        has_gist_scope = scope_future.result()
+        if not has_gist_scope:
+            print_warn("Your gh CLI token may not have 'gist' scope.\n"
+                       "  Run: gh auth refresh -s gist")
+            if not args.non_interactive:
+                resp = input("  Continue anyway? (y/N): ").strip().lower()
+                if resp != "y":
+                    sys.exit(1)
+        else:
+            print_ok("Token has gist access")
 
-    gh_username = gh.resolve_github_username()
+        gh_username = username_future.result()
     print_ok(f"GitHub username: {gh_username}")
 
     # Configuration
@@ -585,7 +776,14 @@ def run(args):
     config["gist_token_name"] = args.gist_token_name
     config["non_interactive"] = args.non_interactive
 
-    _validate_config(config)
+    if args.non_interactive:
+        print_info(_format_review(config, args.configure_files))
+    elif not _review_config(config, args.configure_files,
+                            detect_created=not args.created):
+        print_info("  Setup cancelled.")
+        return 0
+
+    _validate_config(config, check_repo=not args.skip_variables)
     out.emit(2, "  [config] Resolved: owner={owner}, repo={repo}, created={created}",
              channel='config', owner=config['owner'], repo=config['repo'],
              created=config['created'])
@@ -593,79 +791,44 @@ def run(args):
              channel='config', dn=config['display_name'],
              ci=config['ci_workflows'])
 
-    total_steps = 3
+    total_steps = 1
     if args.configure_files:
         total_steps += 1
     if not args.skip_variables:
-        total_steps += 1
+        total_steps += 2
 
-    ci_display = (', '.join(config['ci_workflows'])
-                   if config['ci_workflows'] else '(none)')
-    will_configure = 'yes' if args.configure_files else 'no'
-    print_info( f"\n"
-                f"  Owner:        {config['owner']}\n"
-                f"  Repository:   {config['repo']}\n"
-                f"  Created:      {config['created']}\n"
-                f"  Display Name: {config['display_name']}\n"
-                f"  CI Workflows: {ci_display}\n"
-                f"  Configure:    {will_configure}"
-    )
-
-    if not args.non_interactive and not dry_run:
-        print_info("")
-        resp = input("  Proceed? (Y/n): ").strip().lower()
-        if resp == "n":
-            print_info("  Setup cancelled.")
-            return 0
-
-    # Step 1: Create badge gist
+    # Step 1: Create badge + archive gists (POSTs overlap; see create_gists)
     step = 1
-    print_step(step, total_steps, "Create badge gist (public)")
-    out.emit(1, "  [gist] Creating public badge gist for {repo}",
+    print_step(step, total_steps, "Create badge gist (public) + archive gist (unlisted)")
+    out.emit(1, "  [gist] Creating badge and archive gists for {repo}",
              channel='gist', repo=config['gh_repo'])
-    badge_gist_id = gist.create_badge_gist(config, dry_run=dry_run)
+    badge_gist_id, archive_gist_id = gist.create_gists(config, dry_run=dry_run)
     out.emit(2, "  [gist] Badge gist ID: {gid}", channel='gist', gid=badge_gist_id)
-    config["badge_gist_id"] = badge_gist_id
-
-    # Step 2: Create archive gist
-    step += 1
-    print_step(step, total_steps, "Create archive gist (unlisted)")
-    out.emit(1, "  [gist] Creating unlisted archive gist for {repo}",
-             channel='gist', repo=config['gh_repo'])
-    archive_gist_id = gist.create_archive_gist(config, dry_run=dry_run)
     out.emit(2, "  [gist] Archive gist ID: {gid}", channel='gist', gid=archive_gist_id)
+    config["badge_gist_id"] = badge_gist_id
     config["archive_gist_id"] = archive_gist_id
 
-    # Step 3: Set repository variables
+    # Step 2: Set repository variables
     if not args.skip_variables:
         step += 1
         print_step(step, total_steps, "Set repository variables")
         out.emit(1, "  [api] Setting repository variables on {repo}",
                  channel='api', repo=config['gh_repo'])
 
-        success = gh.set_repo_variable(
-            "TRAFFIC_GIST_ID", badge_gist_id, config["gh_repo"], dry_run)
-        if dry_run:
-            print_dry(f"Would set variable TRAFFIC_GIST_ID = {badge_gist_id}")
-        elif success:
-            print_ok(f"TRAFFIC_GIST_ID = {badge_gist_id}")
-        else:
-            print_warn("Could not set TRAFFIC_GIST_ID")
-            print_info(f"  Run manually: gh variable set TRAFFIC_GIST_ID "
-                       f"--body \"{badge_gist_id}\" -R {config['gh_repo']}")
-
-        success = gh.set_repo_variable(
-            "TRAFFIC_ARCHIVE_GIST_ID", archive_gist_id,
-            config["gh_repo"], dry_run)
-        if dry_run:
-            print_dry(f"Would set variable TRAFFIC_ARCHIVE_GIST_ID = "
-                      f"{archive_gist_id}")
-        elif success:
-            print_ok(f"TRAFFIC_ARCHIVE_GIST_ID = {archive_gist_id}")
-        else:
-            print_warn("Could not set TRAFFIC_ARCHIVE_GIST_ID")
-            print_info(f"  Run manually: gh variable set TRAFFIC_ARCHIVE_GIST_ID "
-                       f"--body \"{archive_gist_id}\" -R {config['gh_repo']}")
+        variables = {
+            "TRAFFIC_GIST_ID": badge_gist_id,
+            "TRAFFIC_ARCHIVE_GIST_ID": archive_gist_id,
+        }
+        results = gh.set_repo_variables(variables, config["gh_repo"], dry_run)
+        for name, value in variables.items():
+            if dry_run:
+                print_dry(f"Would set variable {name} = {value}")
+            elif results[name]:
+                print_ok(f"{name} = {value}")
+            else:
+                print_warn(f"Could not set {name}")
+                print_info(f"  Run manually: gh variable set {name} "
+                           f"--body \"{value}\" -R {config['gh_repo']}")
 
         # PAT guidance
         step += 1
@@ -674,12 +837,13 @@ def run(args):
         _guide_token_setup(config, dry_run=dry_run)
         out.hint('setup.pat', 'verbose')
 
-    # Step 4: Configure files (optional)
+    repo_dir = Path(args.repo_dir or ".").resolve()
+
+    # Final step: Configure files (optional)
     if args.configure_files:
         step += 1
         print_step(step, total_steps, "Configure project files")
 
-        repo_dir = Path(args.repo_dir or ".").resolve()
         dashboard_path = repo_dir / "docs" / "stats" / "index.html"
         readme_path = repo_dir / "docs" / "stats" / "README.md"
         workflow_path = repo_dir / ".github" / "workflows" / "traffic-badges.yml"
@@ -692,7 +856,6 @@ def run(args):
     # Write config files
     out.emit(1, "  [config] Writing project configuration...", channel='config')
     if not dry_run:
-        repo_dir = Path(args.repo_dir or ".").resolve()
         project_cfg = {
             "owner": config["owner"],
             "repo": config["repo"],
@@ -745,9 +908,11 @@ def run(args):
                 f"  [![Installs]({shield_base}/installs.json)]({stats_url}#installs)"
     )
 
-    print_info("\nNext steps:")
+    # Built as one message so it reaches the terminal in a single write
+    # while still going through print_info()'s verbosity gating.
+    next_steps = ["\nNext steps:"]
     if args.skip_variables:
-        print_info(
+        next_steps.append(
                     f"  1. Set repo variables:\n"
                     f"     gh variable set TRAFFIC_GIST_ID "
                     f"--body \"{badge_gist_id}\" -R {config['gh_repo']}\n"
@@ -758,9 +923,9 @@ def run(args):
                     f"-R {config['gh_repo']}"
         )
     if not args.configure_files:
-        print_info("  - Run again with --configure to update dashboard/workflow files")
-        out.hint('setup.configure', 'result')
-    print_info(
+        next_steps.append(
+            "  - Run again with --configure to update dashboard/workflow files")
+    next_steps.append(
                 f"  - Commit and push your changes\n"
                 f"  - Enable GitHub Pages (Settings > Pages > Deploy from branch "
                 f"> main, /docs)\n"
@@ -768,5 +933,8 @@ def run(args):
                 f"    gh workflow run \"Track Downloads & Clones\" "
                 f"-R {config['gh_repo']}\n"
     )
+    print_info("\n".join(next_steps))
+    if not args.configure_files:
+        out.hint('setup.configure', 'result')
 
     return 0
@@ -9,8 +9,12 @@ This means once you run `ghtraf create --owner myorg --repo myproject`,
 the project config remembers it. Future commands need zero flags.
 """
 
+import copy
+import functools
 import json
 import os
+import shutil
+import tempfile
 from pathlib import Path
 
 
@@ -27,6 +31,16 @@ def get_global_config_path():
     return get_global_config_dir() / "config.json"
 
 
+def get_cache_dir():
+    """Return the ghtraf cache directory ($XDG_CACHE_HOME/ghtraf/).
+
+    Falls back to ~/.cache/ghtraf/ when XDG_CACHE_HOME is unset.
+    Cache files are disposable — deleting the directory is always safe.
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or (Path.home() / ".cache")
+    return Path(base) / "ghtraf"
+
+
 def find_project_config(start_dir=None):
     """Walk up from start_dir looking for .ghtraf.json.
 
@@ -44,11 +58,36 @@ def find_project_config(start_dir=None):
     return None
 
 
+def find_repo_markers(start_dir=None):
+    """Walk up once from start_dir looking for .ghtraf.json and .git.
+
+    The walk stops at the first .ghtraf.json, which takes precedence;
+    the nearest directory containing .git seen on the way is recorded
+    so callers needn't walk the same parents a second time.
+
+    Returns (config_path, git_dir), either of which may be None.
+    """
+    git_dir = None
+    current = Path(start_dir or os.getcwd()).resolve()
+    for _ in range(20):  # safety limit
+        candidate = current / ".ghtraf.json"
+        if candidate.is_file():
+            return candidate, git_dir
+        if git_dir is None and (current / ".git").exists():
+            git_dir = current
+        parent = current.parent
+        if parent == current:
+            break
+        current = parent
+    return None, git_dir
+
+
 # ---------------------------------------------------------------------------
 # Config loading
 # ---------------------------------------------------------------------------
-def load_json(path):
-    """Load a JSON file, returning empty dict on error."""
+@functools.lru_cache(maxsize=32)
+def _load_json_cached(path, mtime_ns, size, ino):
+    """Parse path; the stat fields only serve as the cache key."""
     try:
         with open(path, encoding="utf-8") as f:
             return json.load(f)
@@ -56,6 +95,25 @@ def load_json(path):
         return {}
 
 
+def load_json(path):
+    """Load a JSON file, returning empty dict on error.
+
+    Parsed results are cached per (path, mtime, size, inode), so repeat
+    loads of an unchanged file skip the read and parse. Callers get a
+    copy and may mutate it freely.
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return {}
+    data = _load_json_cached(str(path), st.st_mtime_ns, st.st_size,
+                             st.st_ino)
+    return copy.deepcopy(data)
+
+
+load_json.cache_clear = _load_json_cached.cache_clear
+
+
 def load_global_config():
     """Load the global config file."""
     return load_json(get_global_config_path())
@@ -72,6 +130,11 @@ def load_project_config(start_dir=None):
 # ---------------------------------------------------------------------------
 # Config resolution
 # ---------------------------------------------------------------------------
+def _normalize_keys(cfg):
+    """Return cfg with '-' in its top-level keys replaced by '_'."""
+    return {k.replace("-", "_"): v for k, v in cfg.items()}
+
+
 def resolve_config(args, keys=None):
     """Resolve config values using three-layer precedence.
 
@@ -85,6 +148,14 @@ def resolve_config(args, keys=None):
     if keys is None:
         keys = ["owner", "repo", "repo_dir"]
 
+    # Everything supplied on the command line: skip both config files.
+    cli_vals = {}
+    for key in keys:
+        arg_key = key.replace("-", "_")
+        cli_vals[arg_key] = getattr(args, arg_key, None)
+    if all(v is not None for v in cli_vals.values()):
+        return cli_vals
+
     project_cfg, _ = load_project_config(
         getattr(args, "repo_dir", None)
     )
@@ -101,33 +172,20 @@ def resolve_config(args, keys=None):
     if repo_key:
         global_repo_cfg = global_cfg.get("repos", {}).get(repo_key, {})
 
+    # JSON may spell keys with '-' or '_'; argparse always uses '_'.
+    project_cfg = _normalize_keys(project_cfg)
+    global_repo_cfg = _normalize_keys(global_repo_cfg)
+
     resolved = {}
-    for key in keys:
-        # Normalize key: argparse uses underscores, JSON may use either
-        arg_key = key.replace("-", "_")
-        json_key = key.replace("_", "-") if "_" in key else key
-        alt_json_key = key.replace("-", "_") if "-" in key else key
-
-        # Layer 1: CLI
-        cli_val = getattr(args, arg_key, None)
-        if cli_val is not None:
-            resolved[arg_key] = cli_val
-            continue
-
-        # Layer 2: Project config
-        proj_val = project_cfg.get(json_key) or project_cfg.get(alt_json_key)
-        if proj_val is not None:
-            resolved[arg_key] = proj_val
-            continue
-
-        # Layer 3: Global config (repo-specific section)
-        global_val = (global_repo_cfg.get(json_key)
-                      or global_repo_cfg.get(alt_json_key))
-        if global_val is not None:
-            resolved[arg_key] = global_val
-            continue
-
-        resolved[arg_key] = None
+    for arg_key, val in cli_vals.items():
+        # Layer 1 (CLI) is already in val
+        if val is None:
+            # Layer 2: Project config
+            val = project_cfg.get(arg_key)
+        if val is None:
+            # Layer 3: Global config (repo-specific section)
+            val = global_repo_cfg.get(arg_key)
+        resolved[arg_key] = val
 
     return resolved
 
@@ -135,12 +193,58 @@ def resolve_config(args, keys=None):
 # ---------------------------------------------------------------------------
 # Config writing
 # ---------------------------------------------------------------------------
+# Read once at import (before any worker threads exist): os.umask() can
+# only be queried by setting it, which would race with other threads.
+_UMASK = os.umask(0o022)
+os.umask(_UMASK)
+
+
+def atomic_write_bytes(path, payload, mode=None):
+    """Write payload to path via a temp file and os.replace().
+
+    The payload is written in one call, so an interrupted run leaves
+    either the old file or the new one — never a truncated one. The temp
+    file gets a unique name next to the target, so it never clobbers a
+    user's file and concurrent writers don't share it. A symlinked path
+    is resolved first, so the link is kept and its target is updated.
+
+    Args:
+        path: File to write.
+        payload: Bytes to write.
+        mode: Permission bits for the result. Default: keep the existing
+              file's mode, or the umask default for a new file.
+    """
+    path = Path(os.path.realpath(path))
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".",
+                               suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        if mode is not None:
+            os.chmod(tmp, mode)
+        elif path.exists():
+            shutil.copymode(path, tmp)
+        else:
+            os.chmod(tmp, 0o666 & ~_UMASK)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def _atomic_write_json(path, data):
+    """Write data as indented JSON to path atomically."""
+    payload = (json.dumps(data, indent=2) + "\n").encode("utf-8")
+    atomic_write_bytes(path, payload)
+
+
 def save_project_config(data, repo_dir=None):
     """Write .ghtraf.json to the repo directory."""
     target = Path(repo_dir or os.getcwd()) / ".ghtraf.json"
-    with open(target, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
-        f.write("\n")
+    _atomic_write_json(target, data)
     return target
 
 
@@ -149,9 +253,7 @@ def save_global_config(data):
     config_dir = get_global_config_dir()
     config_dir.mkdir(parents=True, exist_ok=True)
     config_path = get_global_config_path()
-    with open(config_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
-        f.write("\n")
+    _atomic_write_json(config_path, data)
     return config_path
 
 
@@ -1,23 +1,88 @@
 """File configuration for ghtraf.
 
 Handles updating dashboard HTML, README, and workflow YAML files
-with project-specific values via regex replacement.
+with project-specific values. Anchored JS constants in the dashboard
+(`const NAME = '...';`) are rewritten with a single line scan; the
+remaining HTML/Markdown/YAML patterns use regex replacement.
 """
 
+import functools
 import json
 import re
 from pathlib import Path
 
+from ghtraf.config import atomic_write_bytes
 from ghtraf.output import print_info, print_ok, print_skip, print_warn
 
 
-def apply_replacements(filepath, replacements, config):
+def rewrite_js_constants(content, values):
+    """Rewrite anchored `const NAME = '...';` lines in one pass.
+
+    Scans content line by line; the first line whose stripped text is
+    `const NAME = '<value>'...` for a NAME in `values` has its quoted
+    value replaced. Indentation and anything after the closing quote
+    (e.g. a trailing `// comment`) are preserved.
+
+    Args:
+        content: File content to scan.
+        values: Dict mapping constant name to its new (unquoted) value.
+
+    Returns:
+        (new_content, found) where found is the set of rewritten names.
+    """
+    found = set()
+    lines = content.splitlines(keepends=True)
+    for i, line in enumerate(lines):
+        stripped = line.lstrip()
+        if not stripped.startswith("const "):
+            continue
+        eq = stripped.find(" = '", 6)
+        if eq == -1:
+            continue
+        name = stripped[6:eq]
+        if name not in values or name in found:
+            continue
+        start = eq + 4
+        end = stripped.find("'", start)
+        if end <= start:
+            continue  # empty or unterminated value — not a placeholder
+        indent = line[:len(line) - len(stripped)]
+        lines[i] = f"{indent}const {name} = '{values[name]}{stripped[end:]}"
+        found.add(name)
+    return "".join(lines), found
+
+
+@functools.lru_cache(maxsize=16)
+def _combine_patterns(patterns):
+    """Join patterns into one alternation, group r<i> for patterns[i].
+
+    Patterns are combined by source text, so any flags must be inline
+    and backreferences must be named.
+    """
+    return re.compile("|".join(
+        f"(?P<r{i}>{getattr(p, 'pattern', p)})"
+        for i, p in enumerate(patterns)))
+
+
+def apply_replacements(filepath, replacements, config, js_constants=None):
     """Apply a list of (pattern, template, description) replacements to a file.
 
+    All patterns are matched in a single scan of the file; each replaces
+    only its first match, and templates are inserted literally (no
+    backslash or group-reference processing). Patterns in one list
+    should not overlap. A file containing none of the required literals
+    or constant names is never decoded or rewritten.
+
     Args:
         filepath: Path to the file to modify.
-        replacements: List of (regex_pattern, format_template, description) tuples.
+        replacements: List of (regex_pattern, format_template, description)
+            tuples, optionally with a fourth required_literal element: a
+            substring every match contains, checked with `in` before the
+            pattern joins the scan. Patterns may be strings or precompiled
+            re.Pattern objects.
         config: Dict of values to substitute into templates.
+        js_constants: Optional list of (const_name, format_template, description)
+            tuples, rewritten via rewrite_js_constants() in the same pass.
 
     Returns:
         Count of successful replacements.
@@ -27,26 +92,116 @@ def apply_replacements(filepath, replacements, config):
         print_warn(f"File not found: {filepath}")
         return 0
 
-    content = filepath.read_text(encoding="utf-8")
-    original = content
+    data = filepath.read_bytes()
     success = 0
 
-    for pattern, template, desc in replacements:
-        formatted = template.format(**config)
-        new_content, count = re.subn(pattern, formatted, content, count=1)
-        if count > 0:
-            content = new_content
+    # Patterns whose required literal is absent cannot match; leave
+    # them out of the scan entirely. The check runs on the raw bytes so
+    # a file with nothing to rewrite is never decoded.
+    active = [i for i, entry in enumerate(replacements)
+              if len(entry) < 4 or entry[3].encode("utf-8") in data]
+    js_present = bool(js_constants) and any(
+        name.encode("utf-8") in data for name, _, _ in js_constants)
+    if not active and not js_present:
+        for entry in replacements:
+            print_skip(f"{entry[2]} (pattern not found)")
+        for _, _, desc in js_constants or ():
+            print_skip(f"{desc} (pattern not found)")
+        return 0
+
+    content = data.decode("utf-8")
+    original = content
+    matched = set()  # indexes into replacements
+    if active:
+        combined = _combine_patterns(
+            tuple(replacements[i][0] for i in active))
+        formatted = [replacements[i][1].format(**config) for i in active]
+
+        # Splice by hand rather than sub(): the scan can stop as soon as
+        # every pattern has had its (single) replacement.
+        pieces = []
+        pos = 0
+        for m in combined.finditer(content):
+            j = int(m.lastgroup[1:])
+            if active[j] in matched:
+                continue  # only the first match of each pattern
+            matched.add(active[j])
+            pieces.append(content[pos:m.start()])
+            pieces.append(formatted[j])
+            pos = m.end()
+            if len(matched) == len(active):
+                break
+        if matched:
+            pieces.append(content[pos:])
+            content = "".join(pieces)
+
+    for i, entry in enumerate(replacements):
+        desc = entry[2]
+        if i in matched:
             success += 1
             print_ok(f"{desc}")
         else:
             print_skip(f"{desc} (pattern not found)")
 
+    if js_present:
+        values = {name: template.format(**config)
+                  for name, template, _ in js_constants}
+        content, found = rewrite_js_constants(content, values)
+        for name, _, desc in js_constants:
+            if name in found:
+                success += 1
+                print_ok(f"{desc}")
+            else:
+                print_skip(f"{desc} (pattern not found)")
+    else:
+        for _, _, desc in js_constants or ():
+            print_skip(f"{desc} (pattern not found)")
+
     if content != original:
-        filepath.write_text(content, encoding="utf-8")
+        atomic_write_bytes(filepath, content.encode("utf-8"))
 
     return success
 
 
+# Dashboard JS config constants: (const name, value template, description).
+# Each is an anchored, unique `const NAME = '...';` line in index.html.
+DASHBOARD_JS_CONSTANTS = [
+    ("GIST_RAW_BASE",
+     "https://gist.githubusercontent.com/{gh_username}/{badge_gist_id}/raw",
+     "Gist raw base URL"),
+    ("ARCHIVE_GIST_ID", "{archive_gist_id}", "Archive gist ID"),
+    ("REPO_OWNER", "{owner}", "Repo owner"),
+    ("REPO_NAME", "{repo}", "Repo name"),
+    ("REPO_CREATED", "{created}", "Repo creation date"),
+]
+
+
+# Dashboard HTML patterns:
+# (compiled regex, replacement template, description, required literal).
+DASHBOARD_REPLACEMENTS = [
+    # HTML title
+    (re.compile(r'<title>.*?- Project Statistics</title>'),
+     '<title>{display_name_html} - Project Statistics</title>',
+     "HTML title", "- Project Statistics</title>"),
+    # Banner link href
+    (re.compile(r'href="https://github\.com/[^"]+?" class="banner-link"'),
+     'href="https://github.com/{owner}/{repo}" class="banner-link"',
+     "Banner link URL", '" class="banner-link"'),
+    # Banner title text
+    (re.compile(r'<p class="banner-title">.*?</p>'),
+     '<p class="banner-title">{display_name_html}</p>',
+     "Banner title", '<p class="banner-title">'),
+    # Footer repository link
+    (re.compile(r'<a href="https://github\.com/[^"]+?">Repository</a>'),
+     '<a href="https://github.com/{owner}/{repo}">Repository</a>',
+     "Footer repo link", '">Repository</a>'),
+    # Footer releases link
+    (re.compile(r'<a href="https://github\.com/[^"]+?/releases">Releases</a>'),
+     '<a href="https://github.com/{owner}/{repo}/releases">Releases</a>',
+     "Footer releases link", '/releases">Releases</a>'),
+]
+
+
 def configure_dashboard(config, dashboard_path):
     """Update the dashboard HTML file with project-specific values.
 
@@ -60,51 +215,25 @@ def configure_dashboard(config, dashboard_path):
     """
     print_info(f"  Updating {dashboard_path}...")
 
-    replacements = [
-        # HTML title
-        (r'<title>.*?- Project Statistics</title>',
-         '<title>{display_name_html} - Project Statistics</title>',
-         "HTML title"),
-        # Banner link href
-        (r'href="https://github\.com/[^"]+?" class="banner-link"',
-         'href="https://github.com/{owner}/{repo}" class="banner-link"',
-         "Banner link URL"),
-        # Banner title text
-        (r'<p class="banner-title">.*?</p>',
-         '<p class="banner-title">{display_name_html}</p>',
-         "Banner title"),
-        # Footer repository link
-        (r'<a href="https://github\.com/[^"]+?">Repository</a>',
-         '<a href="https://github.com/{owner}/{repo}">Repository</a>',
-         "Footer repo link"),
-        # Footer releases link
-        (r'<a href="https://github\.com/[^"]+?/releases">Releases</a>',
-         '<a href="https://github.com/{owner}/{repo}/releases">Releases</a>',
-         "Footer releases link"),
-        # JS config: GIST_RAW_BASE
-        (r"const GIST_RAW_BASE = '[^']+';",
-         "const GIST_RAW_BASE = 'https://gist.githubusercontent.com/"
-         "{gh_username}/{badge_gist_id}/raw';",
-         "Gist raw base URL"),
-        # JS config: ARCHIVE_GIST_ID
-        (r"const ARCHIVE_GIST_ID = '[^']+';",
-         "const ARCHIVE_GIST_ID = '{archive_gist_id}';",
-         "Archive gist ID"),
-        # JS config: REPO_OWNER
-        (r"const REPO_OWNER = '[^']+';",
-         "const REPO_OWNER = '{owner}';",
-         "Repo owner"),
-        # JS config: REPO_NAME
-        (r"const REPO_NAME = '[^']+';",
-         "const REPO_NAME = '{repo}';",
-         "Repo name"),
-        # JS config: REPO_CREATED
-        (r"const REPO_CREATED = '[^']+';",
-         "const REPO_CREATED = '{created}';",
-         "Repo creation date"),
-    ]
-
-    return apply_replacements(dashboard_path, replacements, config)
+    return apply_replacements(dashboard_path, DASHBOARD_REPLACEMENTS, config,
+                              js_constants=DASHBOARD_JS_CONSTANTS)
+
+
+# Dashboard README patterns, same shape as DASHBOARD_REPLACEMENTS.
+README_REPLACEMENTS = [
+    # Project name and link
+    (re.compile(r'\[.*?\]\(https://github\.com/[^)]+\)\.'),
+     '[{display_name}](https://github.com/{owner}/{repo}).',
+     "Project link", "](https://github.com/"),
+    # Badge gist link
+    (re.compile(r'\[Badge Gist\]\(https://gist\.github\.com/[^)]+\)'),
+     '[Badge Gist](https://gist.github.com/{gh_username}/{badge_gist_id})',
+     "Badge gist link", "[Badge Gist](https://gist.github.com/"),
+    # Dashboard URL
+    (re.compile(r'\*\*https://[^*]+/stats/\*\*'),
+     '**https://{owner_lower}.github.io/{repo}/stats/**',
+     "Dashboard URL", "/stats/**"),
+]
 
 
 def configure_readme(config, readme_path):
@@ -123,22 +252,18 @@ def configure_readme(config, readme_path):
     config = dict(config)  # copy to avoid mutating caller's dict
     config["owner_lower"] = config["owner"].lower()
 
-    replacements = [
-        # Project name and link
-        (r'\[.*?\]\(https://github\.com/[^)]+\)\.',
-         '[{display_name}](https://github.com/{owner}/{repo}).',
-         "Project link"),
-        # Badge gist link
-        (r'\[Badge Gist\]\(https://gist\.github\.com/[^)]+\)',
-         '[Badge Gist](https://gist.github.com/{gh_username}/{badge_gist_id})',
-         "Badge gist link"),
-        # Dashboard URL
-        (r'\*\*https://[^*]+/stats/\*\*',
-         '**https://{owner_lower}.github.io/{repo}/stats/**',
-         "Dashboard URL"),
-    ]
+    return apply_replacements(readme_path, README_REPLACEMENTS, config)
+
 
-    return apply_replacements(readme_path, replacements, config)
+# Workflow YAML patterns. Line-bounded [^\n]* classes instead of lazy .*?
+# keep each match a single forward pass with nothing to backtrack into.
+_WORKFLOW_RUN_LIST_RE = re.compile(r'workflows: \[[^\]\n]*\]')
+_WORKFLOW_RUN_BLOCK_RE = re.compile(
+    r'^  workflow_run:[^\n]*\n    workflows:[^\n]*\n    types:[^\n]*\n',
+    re.MULTILINE)
+# The lookbehind keeps keys that merely end in "version" (python-version,
+# node-version) out of the match.
+_ARCHIVE_VERSION_RE = re.compile(r'(?<![\w-])version: "[^"\n]+",')
 
 
 def configure_workflow(config, workflow_path):
@@ -158,15 +283,17 @@ def configure_workflow(config, workflow_path):
         print_warn(f"File not found: {workflow_path}")
         return 0
 
-    content = workflow_path.read_text(encoding="utf-8")
+    # Decode the raw bytes rather than read_text(), whose universal
+    # newlines would turn a CRLF checkout into LF on write-back.
+    content = workflow_path.read_bytes().decode("utf-8")
     original = content
     changes = 0
+    newline = "\r\n" if "\r\n" in content else "\n"
 
     # Handle workflow_run trigger
     if config.get("ci_workflows"):
         names = json.dumps(config["ci_workflows"])
-        new_content = re.sub(
-            r'workflows: \[.*?\]',
+        new_content = _WORKFLOW_RUN_LIST_RE.sub(
             f'workflows: {names}',
             content
         )
@@ -175,12 +302,11 @@ def configure_workflow(config, workflow_path):
             changes += 1
             print_ok(f"workflow_run trigger: {names}")
     else:
-        new_content = re.sub(
-            r'  workflow_run:.*?\n    workflows:.*?\n    types:.*?\n',
+        new_content = _WORKFLOW_RUN_BLOCK_RE.sub(
             '  # workflow_run:            # Uncomment and set your CI workflow'
-            ' name to run after CI\n'
-            '  #   workflows: ["CI"]\n'
-            '  #   types: [completed]\n',
+            ' name to run after CI' + newline +
+            '  #   workflows: ["CI"]' + newline +
+            '  #   types: [completed]' + newline,
             content
         )
         if new_content != content:
@@ -189,17 +315,13 @@ def configure_workflow(config, workflow_path):
             print_ok("workflow_run trigger: commented out (no CI workflows specified)")
 
     # Update archive version string
-    new_content = re.sub(
-        r'version: "[^"]+",',
-        'version: "0.1.0",',
-        content
-    )
+    new_content = _ARCHIVE_VERSION_RE.sub('version: "0.1.0",', content)
     if new_content != content:
         content = new_content
         changes += 1
         print_ok("Archive version: 0.1.0")
 
     if content != original:
-        workflow_path.write_text(content, encoding="utf-8")
+        atomic_write_bytes(workflow_path, content.encode("utf-8"))
 
     return changes
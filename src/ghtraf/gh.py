@@ -4,13 +4,34 @@ Provides authenticated access to the GitHub API via the gh CLI tool.
 All ghtraf operations that touch GitHub go through this module.
 """
 
+import functools
+import hashlib
+import json
+import os
+import re
 import shutil
 import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
 
+from ghtraf.config import atomic_write_bytes, get_cache_dir
 from ghtraf.output import print_error, print_info
 
 
+# Auth lookups are cached per host in $XDG_CACHE_HOME/ghtraf/auth.json,
+# keyed by a sha256 fingerprint of the gh token, so any token change
+# (re-login, refresh) invalidates them. The username rarely changes and
+# is kept for 30 days; auth status and gist scope are rechecked hourly.
+USERNAME_CACHE_TTL = 30 * 24 * 60 * 60
+AUTH_CACHE_TTL = 60 * 60
+
+_auth_cache_lock = threading.Lock()
+_fingerprint_lock = threading.Lock()
+
+
 def run_gh(args, input_data=None, check=True):
     """Run a gh CLI command, return stdout.
 
@@ -25,10 +46,15 @@ def run_gh(args, input_data=None, check=True):
     Raises:
         SystemExit: If check=True and the command fails.
     """
+    # Without piped input, close stdin so gh doesn't inherit the TTY
+    if input_data is None:
+        stdin_kwargs = {"stdin": subprocess.DEVNULL}
+    else:
+        stdin_kwargs = {"input": input_data}
     result = subprocess.run(
         ["gh"] + args,
         capture_output=True, text=True, encoding="utf-8",
-        input=input_data
+        **stdin_kwargs
     )
     if check and result.returncode != 0:
         print_error(f"gh {' '.join(args[:3])}...")
@@ -58,53 +84,207 @@ def check_gh_installed():
         sys.exit(1)
 
     version = subprocess.run(
-        ["gh", "--version"], capture_output=True, text=True, encoding="utf-8"
+        ["gh", "--version"], capture_output=True, text=True, encoding="utf-8",
+        stdin=subprocess.DEVNULL
     ).stdout.strip().split("\n")[0]
     return version
 
 
-def check_gh_authenticated():
+def _get_auth_cache_path():
+    """Return the path of the cached auth lookups."""
+    return get_cache_dir() / "auth.json"
+
+
+@functools.lru_cache(maxsize=1)
+def _token_fingerprint():
+    """Run `gh auth token` and hash it (memoised; see below)."""
+    result = subprocess.run(
+        ["gh", "auth", "token"],
+        capture_output=True, text=True, encoding="utf-8",
+        stdin=subprocess.DEVNULL
+    )
+    token = result.stdout.strip()
+    if result.returncode != 0 or not token:
+        return None
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def _get_token_fingerprint():
+    """Return a sha256 hex digest of the current gh token, or None.
+
+    `gh auth token` is a local keyring read — no network round trip —
+    and runs once per process: the auth, scope and username lookups all
+    share the result. The lock keeps create's concurrent checks from
+    each spawning it on a cold cache. _forget_auth_cache() clears it.
+    """
+    with _fingerprint_lock:
+        return _token_fingerprint()
+
+
+_get_token_fingerprint.cache_clear = _token_fingerprint.cache_clear
+
+
+def _load_auth_cache():
+    """Return the whole auth cache dict ({} if missing or malformed)."""
+    try:
+        with open(_get_auth_cache_path(), encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _read_auth_cache(fingerprint):
+    """Return this host's cache entry if it matches the token, else {}."""
+    if not fingerprint:
+        return {}
+    host = os.environ.get("GH_HOST", "github.com")
+    entry = _load_auth_cache().get(host)
+    if isinstance(entry, dict) and entry.get("token_sha256") == fingerprint:
+        return entry
+    return {}
+
+
+def _is_fresh(entry, stamp_key, ttl):
+    """True if entry[stamp_key] is within ttl seconds of now."""
+    return time.time() - entry.get(stamp_key, 0) < ttl
+
+
+def _write_auth_cache(cache):
+    """Write the auth cache atomically (best-effort; errors are ignored).
+
+    Owner-only (0600): it holds raw `gh auth status` output.
+    """
+    cache_path = _get_auth_cache_path()
+    payload = (json.dumps(cache, indent=2) + "\n").encode("utf-8")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_bytes(cache_path, payload, mode=0o600)
+    except OSError:
+        pass  # cache is best-effort
+
+
+def _update_auth_cache(fingerprint, **fields):
+    """Merge fields into this host's cache entry.
+
+    An entry for a different token is replaced, not merged. Serialized
+    with a lock since create runs some lookups in worker threads.
+    """
+    if not fingerprint:
+        return
+    host = os.environ.get("GH_HOST", "github.com")
+    with _auth_cache_lock:
+        cache = _load_auth_cache()
+        entry = cache.get(host)
+        if not isinstance(entry, dict) or entry.get("token_sha256") != fingerprint:
+            entry = {"token_sha256": fingerprint}
+        entry.update(fields)
+        cache[host] = entry
+        _write_auth_cache(cache)
+
+
+def _forget_auth_cache():
+    """Drop this host's cache entry and the memoised token fingerprint.
+
+    Called after an auth failure, so a re-login is picked up.
+    """
+    host = os.environ.get("GH_HOST", "github.com")
+    _get_token_fingerprint.cache_clear()
+    with _auth_cache_lock:
+        cache = _load_auth_cache()
+        if cache.pop(host, None) is not None:
+            _write_auth_cache(cache)
+
+
+def check_gh_authenticated(use_cache=True):
     """Verify gh auth status.
 
+    A successful result is cached for AUTH_CACHE_TTL seconds; pass
+    use_cache=False to force a fresh `gh auth status`.
+
     Returns:
         Raw auth output string (for scope checking).
 
     Raises:
         SystemExit: If not authenticated.
     """
+    fingerprint = _get_token_fingerprint()
+    if use_cache:
+        entry = _read_auth_cache(fingerprint)
+        if entry.get("auth_status") and _is_fresh(
+                entry, "auth_checked_at", AUTH_CACHE_TTL):
+            return entry["auth_status"]
+
     result = subprocess.run(
         ["gh", "auth", "status"],
-        capture_output=True, text=True, encoding="utf-8"
+        capture_output=True, text=True, encoding="utf-8",
+        stdin=subprocess.DEVNULL
     )
     output = result.stdout + result.stderr
     if result.returncode != 0:
+        _forget_auth_cache()
         print_error("Not authenticated with GitHub CLI.")
         print_info( "\n"
                     "  Run: gh auth login\n"
                     "  Then re-run this command."
         )
         sys.exit(1)
+    _update_auth_cache(fingerprint, auth_status=output,
+                       auth_checked_at=time.time())
     return output
 
 
-def check_gh_scopes(auth_output):
+def check_gh_scopes(auth_output=None, use_cache=True):
     """Check if the gh token has gist scope.
 
+    Probes the gists API directly, so auth_output is not needed and the
+    check can run alongside check_gh_authenticated(). Prints nothing.
+    Only a confirmed scope is cached (for AUTH_CACHE_TTL seconds), so a
+    missing scope is rechecked after `gh auth refresh -s gist`.
+
     Returns:
         True if gist scope is available.
     """
+    fingerprint = _get_token_fingerprint()
+    if use_cache:
+        entry = _read_auth_cache(fingerprint)
+        if entry.get("gist_scope") and _is_fresh(
+                entry, "scope_checked_at", AUTH_CACHE_TTL):
+            return True
+
     result = subprocess.run(
         ["gh", "api", "gists", "--method", "GET", "-q", ".[0].id"],
-        capture_output=True, text=True, encoding="utf-8"
+        capture_output=True, text=True, encoding="utf-8",
+        stdin=subprocess.DEVNULL
     )
     if result.returncode != 0 and "403" in result.stderr:
+        _update_auth_cache(fingerprint, gist_scope=False)
         return False
+    if result.returncode == 0:
+        _update_auth_cache(fingerprint, gist_scope=True,
+                           scope_checked_at=time.time())
     return True
 
 
-def resolve_github_username():
-    """Get the authenticated user's GitHub username."""
-    return run_gh(["api", "user", "--jq", ".login"])
+def resolve_github_username(use_cache=True):
+    """Get the authenticated user's GitHub username.
+
+    The result is cached for USERNAME_CACHE_TTL seconds, keyed by the gh
+    token fingerprint, so repeat runs skip the `gh api user` HTTPS call.
+    use_cache=False forces a fresh lookup (and refreshes the cache).
+    """
+    fingerprint = _get_token_fingerprint()
+    if use_cache:
+        entry = _read_auth_cache(fingerprint)
+        if entry.get("username") and _is_fresh(
+                entry, "username_checked_at", USERNAME_CACHE_TTL):
+            return entry["username"]
+
+    username = run_gh(["api", "user", "--jq", ".login"])
+    if username:
+        _update_auth_cache(fingerprint, username=username,
+                           username_checked_at=time.time())
+    return username
 
 
 def set_repo_variable(name, value, gh_repo, dry_run=False):
@@ -124,13 +304,54 @@ def set_repo_variable(name, value, gh_repo, dry_run=False):
 
     result = subprocess.run(
         ["gh", "variable", "set", name, "--body", value, "-R", gh_repo],
-        capture_output=True, text=True, encoding="utf-8"
+        capture_output=True, text=True, encoding="utf-8",
+        stdin=subprocess.DEVNULL
     )
     if result.returncode != 0:
         return False
     return True
 
 
+# Values that survive a bare NAME=value dotenv line unquoted.
+_DOTENV_PLAIN_RE = re.compile(r"[\w./:@+-]*\Z")
+
+
+def set_repo_variables(variables, gh_repo, dry_run=False):
+    """Set several repository variables, in one gh call where possible.
+
+    Plain values are piped as a dotenv body to a single
+    `gh variable set -f -`, so one process and one auth handshake cover
+    the whole batch. If any value would need dotenv quoting, or the
+    batch call fails, the variables are set one concurrent gh call each
+    so every name still gets its own result.
+
+    Args:
+        variables: Mapping of variable name to value.
+        gh_repo: Repository in owner/repo format.
+        dry_run: If True, only report success.
+
+    Returns:
+        Dict mapping each name to True on success, False on failure.
+    """
+    if dry_run or len(variables) < 2:
+        return {name: set_repo_variable(name, value, gh_repo, dry_run)
+                for name, value in variables.items()}
+    if all(_DOTENV_PLAIN_RE.match(value) for value in variables.values()):
+        body = "".join(f"{name}={value}\n"
+                       for name, value in variables.items())
+        result = subprocess.run(
+            ["gh", "variable", "set", "-f", "-", "-R", gh_repo],
+            capture_output=True, text=True, encoding="utf-8",
+            input=body,
+        )
+        if result.returncode == 0:
+            return dict.fromkeys(variables, True)
+    with ThreadPoolExecutor(max_workers=len(variables)) as pool:
+        futures = {name: pool.submit(set_repo_variable, name, value, gh_repo)
+                   for name, value in variables.items()}
+        return {name: future.result() for name, future in futures.items()}
+
+
 def set_repo_secret(name, value, gh_repo):
     """Set a GitHub repository secret.
 
@@ -150,19 +371,56 @@ def set_repo_secret(name, value, gh_repo):
     return result.returncode == 0
 
 
-def check_repo_exists(gh_repo):
-    """Check if a repository exists on GitHub.
+# gh_repo → (full_name, created_at); successful lookups only
+_repo_summaries = {}
+
+
+def _get_repo_summary(gh_repo):
+    """Fetch (full_name, created_at) for a repository in one gh call.
+
+    check_repo_exists() and get_repo_created_date() both read
+    repos/{gh_repo}; memoising per repo lets create's date lookup and
+    its existence check share a single round trip. Failures are not
+    memoised, so a transient error during create's prefetch is retried
+    by the next caller instead of sticking for the whole run.
 
     Returns:
-        The repo full_name if it exists, None otherwise.
+        (full_name, created_at) tuple, or None if the lookup failed.
     """
+    summary = _repo_summaries.get(gh_repo)
+    if summary is None:
+        summary = _fetch_repo_summary(gh_repo)
+        if summary is not None:
+            _repo_summaries[gh_repo] = summary
+    return summary
+
+
+_get_repo_summary.cache_clear = _repo_summaries.clear
+
+
+def _fetch_repo_summary(gh_repo):
+    """Run the repos/{gh_repo} lookup behind _get_repo_summary()."""
     result = subprocess.run(
-        ["gh", "api", f"repos/{gh_repo}", "--jq", ".full_name"],
-        capture_output=True, text=True, encoding="utf-8"
+        ["gh", "api", f"repos/{gh_repo}", "--jq", ".full_name, .created_at"],
+        capture_output=True, text=True, encoding="utf-8",
+        stdin=subprocess.DEVNULL,
     )
     if result.returncode != 0:
         return None
-    return result.stdout.strip()
+    lines = result.stdout.splitlines()
+    if len(lines) < 2:
+        return None
+    return lines[0].strip(), lines[1].strip()
+
+
+def check_repo_exists(gh_repo):
+    """Check if a repository exists on GitHub.
+
+    Returns:
+        The repo full_name if it exists, None otherwise.
+    """
+    summary = _get_repo_summary(gh_repo)
+    return summary[0] if summary else None
 
 
 def get_repo_created_date(gh_repo):
@@ -172,16 +430,12 @@ def get_repo_created_date(gh_repo):
         Date string (YYYY-MM-DD) or None.
     """
     try:
-        result = subprocess.run(
-            ["gh", "api", f"repos/{gh_repo}", "--jq", ".created_at"],
-            capture_output=True, text=True, encoding="utf-8",
-        )
-        if result.returncode != 0:
+        summary = _get_repo_summary(gh_repo)
+        if summary is None:
             return None
-        raw = result.stdout.strip()
-        # Validate it looks like a date (YYYY-MM-DD...)
-        if raw and len(raw) >= 10 and raw[4] == "-" and raw[7] == "-":
-            return raw[:10]
+        # created_at is an ISO timestamp; keep and validate the date part
+        day = summary[1][:10]
+        date.fromisoformat(day)
+        return day
     except Exception:
-        pass
-    return None
+        return None
@@ -5,9 +5,10 @@ that back the traffic tracking system.
 """
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 
 from ghtraf.gh import run_gh
-from ghtraf.output import print_dry, print_info, print_ok
+from ghtraf.output import print_dry, print_info, print_ok, print_warn
 
 
 # ---------------------------------------------------------------------------
@@ -48,9 +49,63 @@ def build_badge(label, message="0", color="blue"):
     }
 
 
+# The badge gist starts out identical for every repo, so its file contents
+# are serialized once at import instead of rebuilt on every create call.
+# The builders above remain the schema definition (and are what tests use).
+BADGE_LABELS = ("installs", "downloads", "clones", "views")
+
+BADGE_GIST_FILES = {
+    "state.json": json.dumps(build_initial_state(), indent=2),
+    **{f"{label}.json": json.dumps(build_badge(label), indent=2)
+       for label in BADGE_LABELS},
+}
+
+# Request bodies are only read by the API, so they use compact separators;
+# the indented file contents above are what users see in the gist.
+_COMPACT = (",", ":")
+
+# The payload's "files" member is constant too; only the description varies,
+# so the escaped file contents are encoded once rather than per request.
+_BADGE_GIST_FILES_JSON = json.dumps(
+    {name: {"content": content} for name, content in BADGE_GIST_FILES.items()},
+    separators=_COMPACT)
+
+
 # ---------------------------------------------------------------------------
 # Gist creation
 # ---------------------------------------------------------------------------
+def _badge_gist_payload(config):
+    """Return (description, JSON payload) for the public badge gist."""
+    description = f"[GTT] {config['gh_repo']} \u00b7 badges"
+    # Same bytes json.dumps(..., separators=_COMPACT) gives for the full dict.
+    payload = (f'{{"description":{json.dumps(description)},'
+               f'"public":true,"files":{_BADGE_GIST_FILES_JSON}}}')
+    return description, payload
+
+
+def _archive_gist_payload(config):
+    """Return (description, JSON payload) for the unlisted archive gist."""
+    archive_content = json.dumps({
+        "repo": config["gh_repo"],
+        "description": f"Monthly traffic archive for {config['gh_repo']}",
+        "archives": [],
+    }, indent=2)
+    description = f"[GTT] {config['gh_repo']} \u00b7 archive"
+    payload = json.dumps({
+        "description": description,
+        "public": False,
+        "files": {"archive.json": {"content": archive_content}},
+    }, separators=_COMPACT)
+    return description, payload
+
+
+def _post_gist(payload):
+    """POST a gist payload via gh and return the parsed API response."""
+    result = run_gh(["api", "gists", "--method", "POST", "--input", "-"],
+                    input_data=payload)
+    return json.loads(result)
+
+
 def create_badge_gist(config, dry_run=False):
     """Create the public badge gist with initial state + badge files.
 
@@ -61,32 +116,16 @@ def create_badge_gist(config, dry_run=False):
     Returns:
         Gist ID string (or placeholder in dry-run mode).
     """
-    files = {
-        "state.json": json.dumps(build_initial_state(), indent=2),
-        "installs.json": json.dumps(build_badge("installs"), indent=2),
-        "downloads.json": json.dumps(build_badge("downloads"), indent=2),
-        "clones.json": json.dumps(build_badge("clones"), indent=2),
-        "views.json": json.dumps(build_badge("views"), indent=2),
-    }
-
-    description = f"[GTT] {config['gh_repo']} \u00b7 badges"
+    description, payload = _badge_gist_payload(config)
 
     if dry_run:
         print_dry(     f"Would create PUBLIC gist: \"{description}\"")
-        for name in files:
+        for name in BADGE_GIST_FILES:
             print_info(f"    - {name}")
         return "<DRY_RUN_BADGE_GIST_ID>"
 
-    payload = json.dumps({
-        "description": description,
-        "public": True,
-        "files": {name: {"content": content} for name, content in files.items()},
-    })
-
     print_info("  Creating gist with 5 files...")
-    result = run_gh(["api", "gists", "--method", "POST", "--input", "-"],
-                    input_data=payload)
-    gist_data = json.loads(result)
+    gist_data = _post_gist(payload)
     gist_id = gist_data["id"]
     gist_url = gist_data["html_url"]
     print_ok(f"Badge gist created: {gist_id}")
@@ -104,29 +143,60 @@ def create_archive_gist(config, dry_run=False):
     Returns:
         Gist ID string (or placeholder in dry-run mode).
     """
-    archive_content = json.dumps({
-        "repo": config["gh_repo"],
-        "description": f"Monthly traffic archive for {config['gh_repo']}",
-        "archives": [],
-    }, indent=2)
-
-    description = f"[GTT] {config['gh_repo']} \u00b7 archive"
+    description, payload = _archive_gist_payload(config)
 
     if dry_run:
         print_dry( f"Would create UNLISTED gist: \"{description}\"")
         print_info("    - archive.json")
         return "<DRY_RUN_ARCHIVE_GIST_ID>"
 
-    payload = json.dumps({
-        "description": description,
-        "public": False,
-        "files": {"archive.json": {"content": archive_content}},
-    })
-
     print_info("  Creating unlisted gist...")
-    result = run_gh(["api", "gists", "--method", "POST", "--input", "-"],
-                    input_data=payload)
-    gist_data = json.loads(result)
+    gist_data = _post_gist(payload)
     gist_id = gist_data["id"]
     print_ok(f"Archive gist created: {gist_id}")
     return gist_id
+
+
+def create_gists(config, dry_run=False):
+    """Create the badge and archive gists with overlapping round trips.
+
+    The two gists are independent, so both `gh api` POSTs run in worker
+    threads at once (each thread just waits on its subprocess) and the
+    results are reported in a fixed order afterwards. If one POST fails,
+    the gist that did get created is named before the error propagates,
+    so it can be deleted before retrying.
+
+    Args:
+        config: Dict with 'gh_repo' key (owner/repo).
+        dry_run: If True, only print what would happen.
+
+    Returns:
+        (badge_gist_id, archive_gist_id) tuple (placeholders in dry-run).
+    """
+    if dry_run:
+        return (create_badge_gist(config, dry_run=True),
+                create_archive_gist(config, dry_run=True))
+
+    _, badge_payload = _badge_gist_payload(config)
+    _, archive_payload = _archive_gist_payload(config)
+
+    print_info("  Creating badge gist (5 files) and unlisted archive gist...")
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        badge_future = pool.submit(_post_gist, badge_payload)
+        archive_future = pool.submit(_post_gist, archive_payload)
+
+    futures = (("Badge", badge_future), ("Archive", archive_future))
+    errors = [f.exception() for _, f in futures if f.exception() is not None]
+    if errors:
+        for label, future in futures:
+            if future.exception() is None:
+                print_warn(f"{label} gist {future.result()['id']} was created "
+                           "but the other gist failed \u2014 delete it before retrying.")
+        raise errors[0]
+
+    badge_data = badge_future.result()
+    archive_data = archive_future.result()
+    print_ok(f"Badge gist created: {badge_data['id']}")
+    print_info(f"       {badge_data['html_url']}")
+    print_ok(f"Archive gist created: {archive_data['id']}")
+    return badge_data["id"], archive_data["id"]
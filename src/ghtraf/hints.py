@@ -5,6 +5,8 @@ based on context ('result', 'error', 'verbose') and the THAC0
 threshold. Each hint shows at most once per session.
 
 Import this module to register all GTT hints with the global registry.
+Commands import it just before they emit hints, so paths that never
+show one (--version, --help, parse errors) skip the registration.
 """
 
 from ghtraf.lib.log_lib import Hint, register_hints
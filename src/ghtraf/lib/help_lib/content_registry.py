@@ -5,13 +5,18 @@ This aggregates content defined in section files and provides
 a unified interface to access all help content.
 """
 
-from typing import Dict, Optional
+from collections import defaultdict
+from typing import Dict, List, Optional
 from .core import HelpContent
 
 
 # Registry that will be populated from section files
 HELP_CONTENT: Dict[str, HelpContent] = {}
 
+# Inverted indexes maintained by register_content(), in registration order
+_BY_CATEGORY: Dict[str, List[HelpContent]] = defaultdict(list)
+_BY_CONTEXT: Dict[str, List[HelpContent]] = defaultdict(list)
+
 
 def register_content(content: HelpContent) -> None:
     """Register a help content item in the global registry.
@@ -22,6 +27,9 @@ def register_content(content: HelpContent) -> None:
     if content.id in HELP_CONTENT:
         raise ValueError(f"Duplicate help content ID: {content.id}")
     HELP_CONTENT[content.id] = content
+    _BY_CATEGORY[content.category].append(content)
+    for context in content.contexts:
+        _BY_CONTEXT[context].append(content)
 
 
 def register_section_content(items: Dict[str, HelpContent]) -> None:
@@ -60,10 +68,7 @@ def get_content_by_category(category: str) -> list:
     Returns:
         List of HelpContent items in that category
     """
-    return [
-        content for content in HELP_CONTENT.values()
-        if content.category == category
-    ]
+    return list(_BY_CATEGORY.get(category, ()))
 
 
 def get_content_by_context(context: str) -> list:
@@ -75,10 +80,7 @@ def get_content_by_context(context: str) -> list:
     Returns:
         List of HelpContent items that include that context
     """
-    return [
-        content for content in HELP_CONTENT.values()
-        if context in content.contexts
-    ]
+    return list(_BY_CONTEXT.get(context, ()))
 
 
 def get_all_content() -> Dict[str, HelpContent]:
@@ -2,11 +2,32 @@
 Core help system components.
 """
 
+import bisect
+import functools
+import re
+import sys
+from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import List, Set, Dict, Optional
+from typing import List, Set, Dict, Optional, Tuple
 
+# Splits "{prog} {path} -r" into ['', 'prog', ' ', 'path', ' -r'].
+_PLACEHOLDER_RE = re.compile(r'\{([^{}]*)\}')
 
-@dataclass
+# Whitespace-only lines, and the start of lines with visible text
+_BLANK_LINE_RE = re.compile(r'^[^\S\n]+$', re.MULTILINE)
+_TEXT_LINE_RE = re.compile(r'^(?=[^\n]*\S)', re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_template(template: str) -> Tuple[str, ...]:
+    """Split a template into alternating literal / placeholder-name parts.
+
+    Cached because many help items share the same command template.
+    """
+    return tuple(_PLACEHOLDER_RE.split(template))
+
+
+@dataclass(slots=True)
 class HelpContent:
     """
     A single help item that can be formatted in different ways.
@@ -21,6 +42,19 @@ class HelpContent:
     contexts: Set[str] = field(default_factory=lambda: {'minimal', 'standard'})
     priority: int = 50               # Lower = higher priority
     variables: Dict[str, str] = field(default_factory=dict)  # Default variable values
+    # Command split once into alternating literal / placeholder-name parts
+    _segments: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    # Description-derived pieces of the example and tip formats
+    _comment: str = field(init=False, repr=False, compare=False)
+    _tip_prefix: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Interned so index and displayed_ids lookups can match by identity
+        self.id = sys.intern(self.id)
+        self.category = sys.intern(self.category)
+        self._segments = _compile_template(self.command)
+        self._comment = f"# {self.description}"
+        self._tip_prefix = f"TIP: {self.description}: "
 
     def get_command(self, prog: str = 'app', **kwargs) -> str:
         """
@@ -33,42 +67,42 @@ class HelpContent:
         Returns:
             Formatted command string
         """
-        # Start with default variables
-        vars = dict(self.variables)
-        vars.update(kwargs)
-        vars['prog'] = prog
-
-        # Replace all variables
-        result = self.command
-        for key, value in vars.items():
-            result = result.replace(f'{{{key}}}', str(value))
-
-        return result
-
-    def format_as_example(self, prog: str = 'app', comment_column: int = 50, **kwargs) -> str:
+        segments = self._segments
+        if len(segments) == 1:
+            return self.command  # no placeholders
+        parts = list(segments)
+        # Odd indexes are placeholder names; unknown ones stay verbatim
+        for i in range(1, len(segments), 2):
+            name = segments[i]
+            if name == 'prog':
+                parts[i] = str(prog)
+            elif name in kwargs:
+                parts[i] = str(kwargs[name])
+            elif name in self.variables:
+                parts[i] = str(self.variables[name])
+            else:
+                parts[i] = f'{{{name}}}'
+        return ''.join(parts)
+
+    def format_as_example(self, prog: str = 'app', comment_column: int = 50,
+                          cmd: Optional[str] = None, **kwargs) -> str:
         """
         Format as an example line with aligned comment.
 
         Args:
             prog: Program name
             comment_column: Column where comment should start
+            cmd: Already-rendered command, to skip calling get_command again
             **kwargs: Additional variables
 
         Returns:
             Formatted example like: "app file.txt -o out.txt    # Process file"
         """
-        cmd = self.get_command(prog, **kwargs)
-        comment = f"# {self.description}"
-
-        # Calculate padding to reach the comment column
-        padding_needed = comment_column - len(cmd)
-
-        if padding_needed > 2:
-            # Normal case - add padding to reach comment column
-            return f"{cmd}{' ' * padding_needed}{comment}"
-        else:
-            # Command is too long, just use 2 spaces
-            return f"{cmd}  {comment}"
+        if cmd is None:
+            cmd = self.get_command(prog, **kwargs)
+        # Pad out to the comment column; a command too long to fit gets
+        # just 2 spaces before the comment
+        return cmd.ljust(max(comment_column, len(cmd) + 2)) + self._comment
 
     def format_as_tip(self, prog: str = 'app', **kwargs) -> str:
         """
@@ -77,8 +111,7 @@ class HelpContent:
         Returns:
             Formatted tip like: "TIP: Process file recursively: app file.txt -r"
         """
-        cmd = self.get_command(prog, **kwargs)
-        return f"TIP: {self.description}: {cmd}"
+        return self._tip_prefix + self.get_command(prog, **kwargs)
 
 
 @dataclass
@@ -134,11 +167,10 @@ class DetailedHelpContent:
         if level == 'detailed' and self.examples:
             content += "\n\nEXAMPLES:\n" + "\n".join(self.examples)
 
-        # Apply padding
+        # Apply padding to lines with text; whitespace-only lines become empty
         if padding:
-            lines = content.split('\n')
-            padded_lines = [padding + line if line.strip() else "" for line in lines]
-            return '\n'.join(padded_lines)
+            content = _BLANK_LINE_RE.sub('', content)
+            return _TEXT_LINE_RE.sub(padding.replace('\\', '\\\\'), content)
 
         return content
 
@@ -149,10 +181,11 @@ class DetailedHelpContent:
         Returns:
             Dict mapping validation test names to pass/fail status
         """
-        results = {}
-        for test in self.validation_tests:
-            results[test] = True
-        return results
+        return dict.fromkeys(self.validation_tests, True)
+
+
+def _priority(item: HelpContent) -> int:
+    return item.priority
 
 
 class HelpSection:
@@ -173,15 +206,25 @@ class HelpSection:
         """
         self.id = id
         self.title = title
+        # Kept sorted by priority (ties in insertion order), as are the
+        # indexes maintained by add_item()
         self.items: List[HelpContent] = []
+        self._by_id: Dict[str, List[HelpContent]] = defaultdict(list)
+        self._by_context: Dict[str, List[HelpContent]] = defaultdict(list)
+        self._by_category: Dict[str, List[HelpContent]] = defaultdict(list)
 
     def add_item(self, item: HelpContent):
         """Add a help content item to this section."""
-        self.items.append(item)
+        for bucket in (self.items, self._by_id[item.id],
+                       self._by_category[item.category],
+                       *(self._by_context[c] for c in item.contexts)):
+            bucket.insert(bisect.bisect_right(bucket, item.priority,
+                                              key=_priority), item)
 
     def add_items(self, *items: HelpContent):
         """Add multiple help content items."""
-        self.items.extend(items)
+        for item in items:
+            self.add_item(item)
 
     def get_items_for_context(self, context: str) -> List[HelpContent]:
         """
@@ -193,7 +236,7 @@ class HelpSection:
         Returns:
             List of items that include this context
         """
-        return [item for item in self.items if context in item.contexts]
+        return list(self._by_context.get(context, ()))
 
     def get_items_by_ids(self, ids: List[str]) -> List[HelpContent]:
         """
@@ -203,20 +246,22 @@ class HelpSection:
             ids: List of item IDs to retrieve
 
         Returns:
-            List of matching items
+            List of matching items, in the order of ids
         """
-        id_set = set(ids)
-        return [item for item in self.items if item.id in id_set]
+        by_id = self._by_id
+        return [item for item_id in dict.fromkeys(ids)
+                for item in by_id.get(item_id, ())]
 
     def get_items_by_category(self, category: str) -> List[HelpContent]:
         """Get items in a specific category."""
-        return [item for item in self.items if item.category == category]
+        return list(self._by_category.get(category, ()))
 
     def format_section(self,
                       context: str = 'standard',
                       prog: str = 'app',
                       max_items: Optional[int] = None,
-                      item_ids: Optional[List[str]] = None) -> str:
+                      item_ids: Optional[List[str]] = None,
+                      displayed: Optional[Set[str]] = None) -> str:
         """
         Format the entire section for display.
 
@@ -225,19 +270,19 @@ class HelpSection:
             prog: Program name
             max_items: Maximum number of items to show
             item_ids: Specific item IDs to show (overrides context)
+            displayed: Optional set that receives the IDs of the items shown
 
         Returns:
             Formatted section with title and examples
         """
-        # Get items based on parameters
+        # Get items based on parameters; context lookups are already in
+        # priority order
         if item_ids:
             items = self.get_items_by_ids(item_ids)
+            items.sort(key=_priority)
         else:
             items = self.get_items_for_context(context)
 
-        # Sort by priority
-        items.sort(key=lambda x: x.priority)
-
         # Apply limit
         if max_items:
             items = items[:max_items]
@@ -247,9 +292,10 @@ class HelpSection:
 
         # Calculate the longest command to determine comment column
         # Add 2 for the indent
+        cmds = [item.get_command(prog) for item in items]
         max_cmd_length = 2
-        for item in items:
-            cmd_length = len(item.get_command(prog)) + 2  # +2 for indent
+        for cmd in cmds:
+            cmd_length = len(cmd) + 2  # +2 for indent
             max_cmd_length = max(max_cmd_length, cmd_length)
 
         # Set comment column with some padding
@@ -257,11 +303,15 @@ class HelpSection:
 
         # Build output
         lines = [f"{self.title}:"]
-        for item in items:
+        for item, cmd in zip(items, cmds):
             # Pass comment_column minus indent length
-            example = item.format_as_example(prog, comment_column=comment_column - 2)
+            example = item.format_as_example(prog, comment_column=comment_column - 2,
+                                             cmd=cmd)
             lines.append(f"  {example}")
 
+        if displayed is not None:
+            displayed.update(item.id for item in items)
+
         return "\n".join(lines)
 
 
@@ -306,33 +356,32 @@ class HelpBuilder:
 
         sections_to_show = section_ids or list(self.sections.keys())
 
-        # First pass: calculate the maximum command length across all sections
+        # Render every selected command once, tracking the widest
+        rendered = []  # (section, [(item, cmd), ...])
         max_cmd_length = 0
         for section_id in sections_to_show:
             if section_id in self.sections:
                 section = self.sections[section_id]
                 items = section.get_items_for_context('minimal')[:max_per_section]
-                for item in items:
-                    cmd_length = len(item.get_command(self.prog))
-                    max_cmd_length = max(max_cmd_length, cmd_length)
+                if items:
+                    pairs = [(item, item.get_command(self.prog)) for item in items]
+                    max_cmd_length = max(max_cmd_length,
+                                         max(len(cmd) for _, cmd in pairs))
+                    rendered.append((section, pairs))
 
         # Set global comment column (with indent)
         comment_column = min(max_cmd_length + 4, 52)  # +4 for indent and padding
 
-        # Second pass: format sections with consistent comment column
-        for section_id in sections_to_show:
-            if section_id in self.sections:
-                section = self.sections[section_id]
-                items = section.get_items_for_context('minimal')[:max_per_section]
-
-                if items:
-                    lines = [f"{section.title}:"]
-                    for item in sorted(items, key=lambda x: x.priority):
-                        example = item.format_as_example(self.prog, comment_column=comment_column - 2)
-                        lines.append(f"  {example}")
-                        self.displayed_ids.add(item.id)
+        # Lay out the buffered commands against that column
+        for section, pairs in rendered:
+            lines = [f"{section.title}:"]
+            for item, cmd in pairs:
+                example = item.format_as_example(self.prog, comment_column=comment_column - 2,
+                                                 cmd=cmd)
+                lines.append(f"  {example}")
+                self.displayed_ids.add(item.id)
 
-                    output.append("\n".join(lines))
+            output.append("\n".join(lines))
 
         return "\n\n".join(output)
 
@@ -349,13 +398,11 @@ class HelpBuilder:
         for section in self.sections.values():
             section_text = section.format_section(
                 context='standard',
-                prog=self.prog
+                prog=self.prog,
+                displayed=self.displayed_ids
             )
             if section_text:
                 output.append(section_text)
-                # Track displayed items
-                for item in section.get_items_for_context('standard'):
-                    self.displayed_ids.add(item.id)
 
         return "\n\n".join(output)
 
@@ -371,17 +418,13 @@ class HelpBuilder:
         """
         import random
 
-        # Collect all items
-        all_items = []
-        for section in self.sections.values():
-            all_items.extend(section.items)
-
-        # Filter out displayed if requested
-        if exclude_displayed:
-            available = [item for item in all_items
-                        if item.id not in self.displayed_ids]
-        else:
-            available = all_items
+        # Collect candidates in one pass, filtering out displayed items if
+        # requested. Sections stay mutable after add_section(), so the pool
+        # is gathered per call rather than cached.
+        displayed = self.displayed_ids if exclude_displayed else ()
+        available = [item for section in self.sections.values()
+                     for item in section.items
+                     if item.id not in displayed]
 
         if not available:
             return ""
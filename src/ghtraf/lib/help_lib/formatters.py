@@ -42,11 +42,9 @@ class ExampleFormatter:
         Returns:
             List of formatted lines
         """
-        lines = []
-        for item in items:
-            example = item.format_as_example(prog, width - len(indent))
-            lines.append(f"{indent}{example}")
-        return lines
+        column = width - len(indent)
+        return [f"{indent}{item.format_as_example(prog, column)}"
+                for item in items]
 
 
 class TipFormatter:
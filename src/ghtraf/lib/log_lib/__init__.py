@@ -17,7 +17,7 @@ Public API:
     get_hint         — look up hint by ID
     ChannelConfig    — channel configuration
     parse_channel_spec — parse CLI channel spec
-    KNOWN_CHANNELS   — set of recognized channel names
+    KNOWN_CHANNELS   — frozenset of recognized channel names
     trace            — function tracing decorator
 """
 
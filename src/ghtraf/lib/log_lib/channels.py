@@ -21,12 +21,14 @@ Expanded flags (like --iter-* pattern):
     --chan-file timing:perf.log
 """
 
+import re
 from dataclasses import dataclass, field
 from typing import Dict, Optional, TextIO
 
 
-# Channels currently used in the codebase
-KNOWN_CHANNELS = {
+# Channels currently used in the codebase (frozen: projects replace the
+# table rather than mutating it)
+KNOWN_CHANNELS = frozenset({
     'config',       # Configuration loading and overrides
     'parse',        # Expression parsing
     'eval',         # Expression evaluation
@@ -37,9 +39,12 @@ KNOWN_CHANNELS = {
     'hint',         # Hint messages
     'error',        # Error messages
     'trace',        # Function tracing (@trace decorator)
+    'trace.entry',  # @trace call entry with arguments
+    'trace.exit',   # @trace return values
+    'trace.exc',    # @trace raised exceptions
     'vals',         # Computed LHS/RHS values on match output
     'general',      # Default channel
-}
+})
 
 # Channel descriptions for --show listing
 CHANNEL_DESCRIPTIONS = {
@@ -53,17 +58,24 @@ CHANNEL_DESCRIPTIONS = {
     'hint':      'Contextual tips and suggestions',
     'error':     'Error messages',
     'trace':     'Function call tracing',
+    'trace.entry': 'Traced calls with their arguments',
+    'trace.exit':  'Traced return values',
+    'trace.exc':   'Exceptions raised by traced calls',
     'vals':      'Computed LHS/RHS values on matches',
     'general':   'General output',
 }
 
+# Parts of the trace channel that can be pinned separately, in the order
+# of OutputManager.trace_flags (entry, exit, exception)
+TRACE_SUBCHANNELS = ('trace.entry', 'trace.exit', 'trace.exc')
+
 # Channels that are OFF by default (require explicit --show to activate).
 # These get a default override of -1, so channel_active() returns False
 # unless the user explicitly enables them.
-OPT_IN_CHANNELS = {
+OPT_IN_CHANNELS = frozenset({
     'vals',     # Annotates stdout match lines — opt-in to avoid noise
     'trace',    # Function call tracing — opt-in (verbose debug output)
-}
+})
 
 
 @dataclass
@@ -87,6 +99,17 @@ class ChannelConfig:
     format: Optional[str] = None         # 'text', 'json', 'csv'
 
 
+# CHANNEL:LEVEL:DEST:LOCATION:FORMAT. A LOCATION starting with a single
+# letter and a colon is a Windows drive letter, so that colon is kept.
+_SPEC_RE = re.compile(
+    r'([^:]*)'
+    r'(?::([^:]*)'
+    r'(?::([^:]*)'
+    r'(?::([A-Za-z]:[^:]*|[^:]*)'
+    r'(?::([^:]*))?)?)?)?'
+)
+
+
 def parse_channel_spec(spec: str) -> ChannelConfig:
     """Parse a channel spec string into a ChannelConfig.
 
@@ -94,7 +117,7 @@ def parse_channel_spec(spec: str) -> ChannelConfig:
         CHANNEL:LEVEL:DEST:LOCATION:FORMAT
 
     Empty slots use :: (empty between colons).
-    Windows drive letters (e.g., C:\\path) are detected and rejoined.
+    Windows drive letters (e.g., C:\\path) in LOCATION are kept intact.
 
     Args:
         spec: Channel spec string like "timing:2" or "timing::file:C:\\logs\\out.log"
@@ -102,49 +125,40 @@ def parse_channel_spec(spec: str) -> ChannelConfig:
     Returns:
         ChannelConfig with parsed values
     """
-    parts = spec.split(':')
-
-    # Handle Windows drive letters: rejoin 'C' + 'path' into 'C:path'
-    # A single alpha character followed by another part is likely a drive letter
-    rejoined = []
-    i = 0
-    while i < len(parts):
-        if (len(parts[i]) == 1 and parts[i].isalpha()
-                and i + 1 < len(parts)
-                and i >= 3):  # Only in LOCATION slot (position 3+)
-            rejoined.append(f"{parts[i]}:{parts[i+1]}")
-            i += 2
-        else:
-            rejoined.append(parts[i])
-            i += 1
-    parts = rejoined
-
-    name = parts[0] if len(parts) > 0 else ''
-    level = 0
-    dest = location = fmt = None
-
-    if len(parts) > 1 and parts[1]:
-        level = int(parts[1])
-    if len(parts) > 2 and parts[2]:
-        dest = parts[2]
-    if len(parts) > 3 and parts[3]:
-        location = parts[3]
-    if len(parts) > 4 and parts[4]:
-        fmt = parts[4]
-
-    return ChannelConfig(name=name, level=level, destination=dest,
-                         location=location, format=fmt)
+    # match() never fails: every slot after the name is optional, and
+    # anything past FORMAT is ignored
+    m = _SPEC_RE.match(spec)
+    name, level_str, dest, location, fmt = m.groups()
+
+    level = int(level_str) if level_str else 0
+
+    return ChannelConfig(name=name, level=level, destination=dest or None,
+                         location=location or None, format=fmt or None)
+
+
+# (KNOWN_CHANNELS, CHANNEL_DESCRIPTIONS, listing) for the last tables seen
+_channel_list_cache = None
 
 
 def format_channel_list() -> str:
     """Format the list of known channels for display.
 
+    The listing is rebuilt only when the channel tables have been
+    replaced (e.g. by a project's channel configuration).
+
     Returns:
         Formatted string listing all channels with descriptions.
     """
+    global _channel_list_cache
+    cached = _channel_list_cache
+    if (cached is not None and cached[0] is KNOWN_CHANNELS
+            and cached[1] is CHANNEL_DESCRIPTIONS):
+        return cached[2]
     lines = ["Available channels:"]
     max_name = max(len(name) for name in KNOWN_CHANNELS)
     for name in sorted(KNOWN_CHANNELS):
         desc = CHANNEL_DESCRIPTIONS.get(name, '')
         lines.append(f"  {name:<{max_name}}  {desc}")
-    return "\n".join(lines)
+    listing = "\n".join(lines)
+    _channel_list_cache = (KNOWN_CHANNELS, CHANNEL_DESCRIPTIONS, listing)
+    return listing
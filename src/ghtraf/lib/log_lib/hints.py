@@ -6,8 +6,10 @@ The hint registry is a global dictionary populated by domain modules
 at import time via register_hint()/register_hints().
 """
 
+import sys
+from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional, Set
+from typing import Any, Dict, List, Optional, Set
 
 
 @dataclass
@@ -34,9 +36,18 @@ class Hint:
     min_level: int = 1
     category: str = 'general'
 
+    def __post_init__(self):
+        # Interned so registry and shown-hint lookups can match by identity
+        self.id = sys.intern(self.id)
+        self.category = sys.intern(self.category)
+
 
 # Global hint registry — populated by modules at import time
 _HINTS: Dict[str, Hint] = {}
+# Category index over _HINTS, kept in registry order by register_hint()
+_HINTS_BY_CATEGORY: Dict[str, List[Hint]] = defaultdict(list)
+# Bumped on every registration so lookup caches can tell they are stale
+_registry_version = 0
 
 
 def register_hint(hint: Hint) -> None:
@@ -46,7 +57,17 @@ def register_hint(hint: Hint) -> None:
     the module is imported. Duplicate IDs overwrite silently (allows
     reloading during development).
     """
+    global _registry_version
+    _registry_version += 1
+    replaced = hint.id in _HINTS
     _HINTS[hint.id] = hint
+    if not replaced:
+        _HINTS_BY_CATEGORY[hint.category].append(hint)
+        return
+    # An overwrite keeps the old registry slot; rebuild the index to match
+    _HINTS_BY_CATEGORY.clear()
+    for h in _HINTS.values():
+        _HINTS_BY_CATEGORY[h.category].append(h)
 
 
 def register_hints(*hints: Hint) -> None:
@@ -62,4 +83,4 @@ def get_hint(hint_id: str) -> Optional[Hint]:
 
 def get_hints_by_category(category: str) -> list:
     """Get all registered hints in a category."""
-    return [h for h in _HINTS.values() if h.category == category]
+    return list(_HINTS_BY_CATEGORY.get(category, ()))
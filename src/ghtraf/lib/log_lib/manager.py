@@ -21,10 +21,12 @@ Issue refs: #31 (multi-level verbosity), #57 (structured hints),
 """
 
 import sys
-from typing import Any, Dict, Optional, Set, TextIO
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Set, TextIO, Tuple
 
-from .hints import get_hint
-from .channels import parse_channel_spec, OPT_IN_CHANNELS
+from . import hints as _hints
+from .hints import Hint, get_hint
+from .channels import parse_channel_spec, OPT_IN_CHANNELS, TRACE_SUBCHANNELS
 
 
 class OutputManager:
@@ -43,6 +45,12 @@ class OutputManager:
         out.error("Something went wrong")
     """
 
+    __slots__ = (
+        '_verbosity', '_channel_overrides', 'file', 'channel_fds',
+        '_shown_hints', '_hint_cache', '_hint_cache_version',
+        '_max_threshold', 'trace_flags', 'trace_enabled',
+    )
+
     def __init__(
         self,
         verbosity: int = 0,
@@ -53,11 +61,71 @@ class OutputManager:
         # Backward compat: quiet=True forces verbosity negative
         if quiet and verbosity >= 0:
             verbosity = -1
-        self.verbosity = verbosity
-        self.channel_overrides: Dict[str, int] = dict(channel_overrides or {})
+        self._verbosity = verbosity
+        self._channel_overrides: Dict[str, int] = dict(channel_overrides or {})
         self.file = file if file is not None else sys.stderr
         self.channel_fds: Dict[str, TextIO] = {}
         self._shown_hints: Set[str] = set()
+        # (hint_id, context) -> hint if registered and relevant there, else
+        # None; valid for one hint registry version
+        self._hint_cache: Dict[Tuple[str, str], Optional[Hint]] = {}
+        self._hint_cache_version = _hints._registry_version
+        self._refresh_gate()
+
+    def _refresh_gate(self) -> None:
+        """Recompute the cached gates derived from the thresholds.
+
+        emit() rejects anything above the highest threshold any channel
+        can have with a single compare, before looking up the channel;
+        @trace wrappers read trace_flags / trace_enabled the same way.
+        Must run whenever verbosity or the overrides change.
+        """
+        overrides = self._channel_overrides
+        self._max_threshold = max(
+            self._verbosity, max(overrides.values(), default=self._verbosity))
+        # trace.entry / trace.exit / trace.exc follow 'trace' unless pinned
+        trace = overrides.get('trace', self._verbosity)
+        self.trace_flags = tuple(overrides.get(name, trace) >= 3
+                                 for name in TRACE_SUBCHANNELS)
+        self.trace_enabled = any(self.trace_flags)
+
+    @property
+    def verbosity(self) -> int:
+        """Global THAC0 threshold for channels without an override."""
+        return self._verbosity
+
+    @verbosity.setter
+    def verbosity(self, value: int) -> None:
+        self._verbosity = value
+        self._refresh_gate()
+
+    @property
+    def channel_overrides(self) -> Mapping[str, int]:
+        """Per-channel thresholds, as a read-only view.
+
+        Writes must go through set_channel_override() or this property's
+        setter so the emit gate is recomputed; item assignment on the
+        view raises TypeError.
+        """
+        return MappingProxyType(self._channel_overrides)
+
+    @channel_overrides.setter
+    def channel_overrides(self, overrides: Dict[str, int]) -> None:
+        self._channel_overrides = dict(overrides)
+        self._refresh_gate()
+
+    def set_channel_override(self, channel: str, level: Optional[int]) -> None:
+        """Pin a channel to its own threshold, or clear it with None.
+
+        Args:
+            channel: Channel name
+            level: Threshold for the channel, or None to follow verbosity
+        """
+        if level is None:
+            self._channel_overrides.pop(channel, None)
+        else:
+            self._channel_overrides[channel] = level
+        self._refresh_gate()
 
     def set_channel_fd(self, channel: str, fd: TextIO) -> None:
         """Set the output file handle for a channel at runtime.
@@ -99,6 +167,24 @@ class OutputManager:
             return sys.stderr
         return fd
 
+    def would_emit(self, level: int, channel: str = 'general') -> bool:
+        """Check whether emit() would show a message at level on channel.
+
+        Lets callers skip building message text (or expensive arguments)
+        that would only be thrown away.
+
+        Args:
+            level: Message level (higher = more verbose)
+            channel: Output channel name
+
+        Returns:
+            True if the message would pass the THAC0 gate
+        """
+        if level > self._max_threshold:
+            return False
+        threshold = self._channel_overrides.get(channel, self._verbosity)
+        return threshold > -4 and level <= threshold
+
     def emit(self, level: int, message: str, *,
              channel: str = 'general', file: TextIO = None,
              **kwargs: Any) -> None:
@@ -115,14 +201,19 @@ class OutputManager:
             file: Per-message output override (highest priority FD)
             **kwargs: Values for template placeholders
         """
-        threshold = self.channel_overrides.get(channel, self.verbosity)
+        # Fast reject: too verbose for every channel (the common case for
+        # debug/trace calls)
+        if level > self._max_threshold:
+            return
+        threshold = self._channel_overrides.get(channel, self._verbosity)
         if threshold <= -4:
             return
         if level > threshold:
             return
         text = message.format(**kwargs) if kwargs else message
         dest = self._resolve_fd(channel, file)
-        print(text, file=dest)
+        # One write per line (print() issues two: text, then newline)
+        dest.write(f"{text}\n")
 
     def hint(self, hint_id: str, context: str = 'result', **kwargs: Any) -> None:
         """Show a hint if appropriate for context, level, and not yet shown.
@@ -138,30 +229,40 @@ class OutputManager:
         """
         if hint_id in self._shown_hints:
             return
-        h = get_hint(hint_id)
+        if self._hint_cache_version != _hints._registry_version:
+            self._hint_cache.clear()
+            self._hint_cache_version = _hints._registry_version
+        key = (hint_id, context)
+        try:
+            h = self._hint_cache[key]
+        except KeyError:
+            h = get_hint(hint_id)
+            if h is not None and context not in h.context:
+                h = None
+            self._hint_cache[key] = h
         if h is None:
             return
-        if context not in h.context:
-            return
 
         # Build the text before checking threshold (needed for dedup tracking)
         text = h.message.format(**kwargs) if kwargs else h.message
 
         # Level check via THAC0 threshold
-        threshold = self.channel_overrides.get('hint', self.verbosity)
+        threshold = self._channel_overrides.get('hint', self._verbosity)
         if threshold <= -4:
             return
         if h.min_level > threshold:
             return
 
         dest = self._resolve_fd('hint')
-        print(text, file=dest)
+        dest.write(f"{text}\n")
         self._shown_hints.add(hint_id)
 
     def progress(self, count: int, elapsed: float) -> None:
         """Emit a progress update (level 1, progress channel)."""
-        self.emit(1, "  ... {count} results ({elapsed:.1f}s)",
-                  channel='progress', count=count, elapsed=elapsed)
+        if not self.would_emit(1, 'progress'):
+            return
+        self._resolve_fd('progress').write(
+            f"  ... {count} results ({elapsed:.1f}s)\n")
 
     def error(self, message: str, *, file: TextIO = None) -> None:
         """Emit an error message (level -3, shown unless at hard wall).
@@ -187,7 +288,7 @@ class OutputManager:
         Returns:
             True if the channel is active
         """
-        threshold = self.channel_overrides.get(channel, self.verbosity)
+        threshold = self._channel_overrides.get(channel, self._verbosity)
         return threshold > -4 and 0 <= threshold
 
     @property
@@ -197,9 +298,16 @@ class OutputManager:
 
     @property
     def shown_hints(self) -> Set[str]:
-        """Set of hint IDs that have been displayed this session."""
+        """Set of hint IDs that have been displayed this session.
+
+        Returns a copy; use hint_shown() to test a single ID.
+        """
         return self._shown_hints.copy()
 
+    def hint_shown(self, hint_id: str) -> bool:
+        """Check whether a hint has been displayed this session."""
+        return hint_id in self._shown_hints
+
 
 # =============================================================================
 # Module-level singleton
@@ -9,28 +9,43 @@ import functools
 import inspect
 from pathlib import Path
 
+# manager.get_output, bound on the first traced call (a module-level
+# import would be circular)
+_get_output = None
+
 
 def trace(func):
     """Decorator to trace function calls via the OutputManager.
 
     Shows function entry/exit with arguments and return values
     when the 'trace' channel is active (verbosity >= 3 or
-    --show trace enables it).
+    --show trace enables it). The trace.entry, trace.exit and
+    trace.exc sub-channels follow 'trace' unless pinned on their own,
+    e.g. --show trace:3 --show trace.entry:-1 to see only results.
     """
+    # Function signature info never changes, so resolve it once here
+    module = inspect.getmodule(func)
+    module_name = module.__name__ if module else "unknown"
+    func_name = func.__name__
+
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        # Lazy import to avoid circular dependency
-        from .manager import get_output
+        global _get_output
+        if _get_output is None:
+            from .manager import get_output as _get_output
 
-        out = get_output()
-        threshold = out.channel_overrides.get('trace', out.verbosity)
+        out = _get_output()
+
+        if not out.trace_enabled:
+            return func(*args, **kwargs)
 
-        if threshold >= 3:
-            # Get function signature info
-            module = inspect.getmodule(func)
-            module_name = module.__name__ if module else "unknown"
-            func_name = func.__name__
+        # Each part is built only if its sub-channel is on. The flags
+        # already apply the threshold, so lines go straight to the trace
+        # channel's file handle rather than back through emit().
+        entry_on, exit_on, exc_on = out.trace_flags
+        dest = out._resolve_fd('trace')
 
+        if entry_on:
             # Format arguments
             args_repr = []
 
@@ -67,31 +82,27 @@ def trace(func):
             args_str = ', '.join(args_repr)
 
             # Print entry
-            out.emit(3, "[TRACE] >> {mod}.{fn}({args})",
-                     channel='trace', mod=module_name, fn=func_name, args=args_str)
-
-            try:
-                result = func(*args, **kwargs)
-
-                # Print exit with return value (if not None)
-                if result is not None:
-                    if isinstance(result, list) and len(result) > 3:
-                        result_repr = f"[...{len(result)} items...]"
-                    elif isinstance(result, str) and len(result) > 50:
-                        result_repr = f"'{result[:47]}...'"
-                    else:
-                        result_repr = repr(result)
-                    out.emit(3, "[TRACE] << {mod}.{fn} returned: {val}",
-                             channel='trace', mod=module_name, fn=func_name, val=result_repr)
-
-                return result
-
-            except Exception as e:
-                out.emit(3, "[TRACE] !! {mod}.{fn} raised: {exc}: {msg}",
-                         channel='trace', mod=module_name, fn=func_name,
-                         exc=type(e).__name__, msg=str(e))
-                raise
-        else:
-            return func(*args, **kwargs)
+            dest.write(f"[TRACE] >> {module_name}.{func_name}({args_str})\n")
+
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            if exc_on:
+                dest.write(f"[TRACE] !! {module_name}.{func_name} raised: "
+                           f"{type(e).__name__}: {e}\n")
+            raise
+
+        # Print exit with return value (if not None)
+        if exit_on and result is not None:
+            if isinstance(result, list) and len(result) > 3:
+                result_repr = f"[...{len(result)} items...]"
+            elif isinstance(result, str) and len(result) > 50:
+                result_repr = f"'{result[:47]}...'"
+            else:
+                result_repr = repr(result)
+            dest.write(f"[TRACE] << {module_name}.{func_name} returned: "
+                       f"{result_repr}\n")
+
+        return result
 
     return wrapper
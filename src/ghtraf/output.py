@@ -2,7 +2,9 @@
 
 Consistent message formatting across all commands.  Each print_*()
 function routes through OutputManager.emit() with an appropriate level
-and channel, participating fully in THAC0 verbosity gating.
+and channel, participating fully in THAC0 verbosity gating.  Functions
+that decorate their message check would_emit() first, so suppressed
+messages are never formatted.
 
 Graduated quiet axis:
     -Q  (-1)  hides hints (level 0)
@@ -39,8 +41,9 @@ def print_step(n, total, msg, *, level=-1, channel='general', file=None):
     """
     try:
         out = get_output()
-        out.emit(level, f"\n== Step {n}/{total}: {msg} ==",
-                 channel=channel, file=file)
+        if out.would_emit(level, channel):
+            out.emit(level, f"\n== Step {n}/{total}: {msg} ==",
+                     channel=channel, file=file)
     except Exception:
         print(f"\n== Step {n}/{total}: {msg} ==", file=file or sys.stdout)
 
@@ -54,7 +57,8 @@ def print_ok(msg, *, level=-1, channel='general', file=None):
     """
     try:
         out = get_output()
-        out.emit(level, f"  [OK] {msg}", channel=channel, file=file)
+        if out.would_emit(level, channel):
+            out.emit(level, f"  [OK] {msg}", channel=channel, file=file)
     except Exception:
         print(f"  [OK] {msg}", file=file or sys.stdout)
 
@@ -67,7 +71,8 @@ def print_dry(msg, *, level=-1, channel='general', file=None):
     """
     try:
         out = get_output()
-        out.emit(level, f"  [DRY RUN] {msg}", channel=channel, file=file)
+        if out.would_emit(level, channel):
+            out.emit(level, f"  [DRY RUN] {msg}", channel=channel, file=file)
     except Exception:
         print(f"  [DRY RUN] {msg}", file=file or sys.stdout)
 
@@ -80,7 +85,8 @@ def print_warn(msg, *, level=-2, channel='general', file=None):
     """
     try:
         out = get_output()
-        out.emit(level, f"  [WARN] {msg}", channel=channel, file=file)
+        if out.would_emit(level, channel):
+            out.emit(level, f"  [WARN] {msg}", channel=channel, file=file)
     except Exception:
         print(f"  [WARN] {msg}", file=file or sys.stdout)
 
@@ -93,7 +99,8 @@ def print_skip(msg, *, level=-1, channel='general', file=None):
     """
     try:
         out = get_output()
-        out.emit(level, f"  [SKIP] {msg}", channel=channel, file=file)
+        if out.would_emit(level, channel):
+            out.emit(level, f"  [SKIP] {msg}", channel=channel, file=file)
     except Exception:
         print(f"  [SKIP] {msg}", file=file or sys.stdout)
 
@@ -107,7 +114,8 @@ def print_error(msg, *, level=-3, channel='error', file=None):
     """
     try:
         out = get_output()
-        out.emit(level, f"  ERROR: {msg}", channel=channel, file=file)
+        if out.would_emit(level, channel):
+            out.emit(level, f"  ERROR: {msg}", channel=channel, file=file)
     except Exception:
         print(f"  ERROR: {msg}", file=file or sys.stderr)
 
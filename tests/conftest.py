@@ -222,13 +222,13 @@ def mock_gh(monkeypatch):
     def fake_check_gh_installed():
         return "gh version 2.78.0 (mock)"
 
-    def fake_check_gh_authenticated():
+    def fake_check_gh_authenticated(use_cache=True):
         return "Logged in to github.com account testuser (mock)"
 
-    def fake_check_gh_scopes(auth_output):
+    def fake_check_gh_scopes(auth_output=None, use_cache=True):
         return True
 
-    def fake_resolve_github_username():
+    def fake_resolve_github_username(use_cache=True):
         return "testuser"
 
     def fake_run_gh(args, input_data=None, check=True):
@@ -248,6 +248,10 @@ def mock_gh(monkeypatch):
         })
         return True
 
+    def fake_set_repo_variables(variables, gh_repo, dry_run=False):
+        return {name: fake_set_repo_variable(name, value, gh_repo, dry_run)
+                for name, value in variables.items()}
+
     def fake_set_repo_secret(name, value, gh_repo):
         calls["secrets_set"].append({
             "name": name, "gh_repo": gh_repo,
@@ -268,6 +272,7 @@ def mock_gh(monkeypatch):
     monkeypatch.setattr(gh_mod, "resolve_github_username", fake_resolve_github_username)
     monkeypatch.setattr(gh_mod, "run_gh", fake_run_gh)
     monkeypatch.setattr(gh_mod, "set_repo_variable", fake_set_repo_variable)
+    monkeypatch.setattr(gh_mod, "set_repo_variables", fake_set_repo_variables)
     monkeypatch.setattr(gh_mod, "set_repo_secret", fake_set_repo_secret)
     monkeypatch.setattr(gh_mod, "check_repo_exists", fake_check_repo_exists)
     monkeypatch.setattr(gh_mod, "get_repo_created_date", fake_get_repo_created_date)
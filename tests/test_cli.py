@@ -1,103 +1,119 @@
 """Tests for ghtraf.cli — CLI argument parsing and dispatch."""
 
+import argparse
+import re
 import subprocess
 import sys
 
 import pytest
 
-from ghtraf.cli import _build_common_parser, _extract_global_flags, main
+from ghtraf.cli import (
+    GLOBAL_FLAGS, _COMMAND_REGISTRY, _build_common_parser, _build_parser,
+    _discover_commands, _find_command, _is_negative_number,
+    _merge_global_flags, main,
+)
 
 
-class TestGlobalFlagExtraction:
-    """Test the Docker-style two-pass global flag parsing."""
+def _parse(argv):
+    """Parse argv the way main() does, without dispatching."""
+    parser = _build_parser(_discover_commands(_find_command(argv)),
+                           _build_common_parser())
+    return _merge_global_flags(parser.parse_args(argv))
+
+
+class TestGlobalFlags:
+    """Test global flags parsed alongside the subcommand in one pass."""
 
     def test_verbose_before_subcommand(self):
-        """--verbose before subcommand should be extracted."""
-        global_args, remaining = _extract_global_flags(
-            ["--verbose", "create", "--owner", "x"]
-        )
-        assert global_args.verbose == 1
-        assert "create" in remaining
-        assert "--verbose" not in remaining
+        """--verbose before subcommand should be parsed."""
+        args = _parse(["--verbose", "create", "--owner", "x"])
+        assert args.verbose == 1
+        assert args.command == "create"
+        assert args.owner == "x"
 
     def test_verbose_after_subcommand(self):
-        """--verbose after subcommand args should also be extracted."""
-        global_args, remaining = _extract_global_flags(
-            ["create", "--owner", "x", "--verbose"]
-        )
-        assert global_args.verbose == 1
-        assert "--verbose" not in remaining
+        """--verbose after subcommand args should also be parsed."""
+        args = _parse(["create", "--owner", "x", "--verbose"])
+        assert args.verbose == 1
+        assert args.owner == "x"
 
     def test_verbose_stacks(self):
         """-vv should give verbose count of 2."""
-        global_args, remaining = _extract_global_flags(
-            ["-vv", "create"]
-        )
-        assert global_args.verbose == 2
+        args = _parse(["-vv", "create"])
+        assert args.verbose == 2
 
-    def test_quiet_extracted(self):
-        """-Q should be extracted as quiet count."""
-        global_args, remaining = _extract_global_flags(
-            ["-Q", "create"]
-        )
-        assert global_args.quiet == 1
+    def test_verbose_stacks_across_subcommand(self):
+        """Counts before and after the subcommand should add up."""
+        args = _parse(["-v", "create", "-v"])
+        assert args.verbose == 2
+
+    def test_quiet_parsed(self):
+        """-Q should be parsed as quiet count."""
+        args = _parse(["-Q", "create"])
+        assert args.quiet == 1
 
     def test_quiet_stacks(self):
         """-QQQ should give quiet count of 3."""
-        global_args, remaining = _extract_global_flags(
-            ["-QQQ", "create"]
-        )
-        assert global_args.quiet == 3
+        args = _parse(["-QQQ", "create"])
+        assert args.quiet == 3
 
     def test_show_with_channel(self):
-        """--show api:2 should be extracted."""
-        global_args, remaining = _extract_global_flags(
-            ["--show", "api:2", "create"]
-        )
-        assert global_args.show == ["api:2"]
+        """--show api:2 should be parsed."""
+        args = _parse(["--show", "api:2", "create"])
+        assert args.show == ["api:2"]
+        assert args.command == "create"
+
+    def test_show_accumulates_across_subcommand(self):
+        """--show before and after the subcommand should both be kept."""
+        args = _parse(["--show", "api", "create", "--show", "gist:2"])
+        assert args.show == ["api", "gist:2"]
 
     def test_show_bare_lists_channels(self):
         """Bare --show at end of args should give None in the list."""
-        global_args, remaining = _extract_global_flags(
-            ["create", "--show"]
-        )
+        args = _parse(["create", "--show"])
         # --show at the end (no following arg) produces None in the list
-        assert global_args.show is not None
-        assert None in global_args.show
+        assert args.show is not None
+        assert None in args.show
 
-    def test_no_color_extracted(self):
-        """--no-color should be extracted as a global flag."""
-        global_args, remaining = _extract_global_flags(
-            ["--no-color", "create"]
-        )
-        assert global_args.no_color is True
+    def test_no_color_parsed(self):
+        """--no-color should be parsed as a global flag."""
+        args = _parse(["--no-color", "create"])
+        assert args.no_color is True
 
     def test_config_with_value(self):
-        """--config PATH should be extracted with its value."""
-        global_args, remaining = _extract_global_flags(
-            ["--config", "/tmp/my.json", "create"]
-        )
-        assert global_args.config == "/tmp/my.json"
-        assert "/tmp/my.json" not in remaining
+        """--config PATH should be parsed with its value."""
+        args = _parse(["--config", "/tmp/my.json", "create"])
+        assert args.config == "/tmp/my.json"
+        assert args.command == "create"
+
+    def test_config_after_subcommand(self):
+        """--config after the subcommand should override the default."""
+        args = _parse(["create", "--config", "/tmp/my.json"])
+        assert args.config == "/tmp/my.json"
 
     def test_no_global_flags(self):
-        """When no global flags, all args pass through."""
-        global_args, remaining = _extract_global_flags(
-            ["create", "--owner", "x"]
-        )
-        assert global_args.verbose == 0
-        assert global_args.quiet == 0
-        assert global_args.show is None
-        assert global_args.no_color is False
-        assert global_args.config is None
-        assert remaining == ["create", "--owner", "x"]
+        """When no global flags, defaults apply and no copies leak."""
+        args = _parse(["create", "--owner", "x"])
+        assert args.verbose == 0
+        assert args.quiet == 0
+        assert args.show is None
+        assert args.no_color is False
+        assert args.config is None
+        assert args.owner == "x"
+        assert not [k for k in vars(args) if k.startswith("sub_")]
 
     def test_empty_argv(self):
         """Empty argv should produce default global args."""
-        global_args, remaining = _extract_global_flags([])
-        assert global_args.verbose == 0
-        assert global_args.quiet == 0
-        assert remaining == []
+        args = _parse([])
+        assert args.verbose == 0
+        assert args.quiet == 0
+        assert args.command is None
+
+    def test_abbreviation(self):
+        """Unambiguous abbreviations should still be honored."""
+        args = _parse(["--verb", "create"])
+        assert args.verbose == 1
+        assert args.command == "create"
 
 
 class TestCommonParser:
@@ -132,22 +148,144 @@ class TestCommonParser:
         assert args.non_interactive is False
 
 
+class TestParserCaching:
+    """Parsers are built once per process and reused across main() calls."""
+
+    def test_common_parser_cached(self):
+        """_build_common_parser() should return the same instance."""
+        assert _build_common_parser() is _build_common_parser()
+
+    def test_main_parser_cached(self):
+        """_build_parser() should reuse the parser for the same inputs."""
+        commands = _discover_commands()
+        common = _build_common_parser()
+        assert _build_parser(commands, common) is _build_parser(commands, common)
+
+    def test_global_flags_table_not_mutated(self):
+        """Building the global parents must leave GLOBAL_FLAGS intact."""
+        _parse(["-v", "create", "-Q"])
+        assert GLOBAL_FLAGS["--verbose"]["aliases"] == ["-v"]
+        assert GLOBAL_FLAGS["--quiet"]["aliases"] == ["-Q"]
+        assert "dest" not in GLOBAL_FLAGS["--config"]
+
+    def test_repeated_parses_are_independent(self):
+        """Reusing the cached parser must not leak state between calls."""
+        first = _parse(["--show", "api:2", "-vv"])
+        second = _parse([])
+        assert first.show == ["api:2"]
+        assert second.show is None
+        assert second.verbose == 0
+
+
+class TestLazyCommands:
+    """Command modules are imported only when their subcommand is used."""
+
+    def test_find_command_first_positional(self):
+        """The first non-option token names the subcommand."""
+        assert _find_command(["--dry-run", "create", "--owner", "x"]) == "create"
+
+    def test_find_command_unknown(self):
+        """Unknown or missing subcommands give None."""
+        assert _find_command(["nonexistent"]) is None
+        assert _find_command(["--help"]) is None
+        assert _find_command([]) is None
+
+    def test_find_command_skips_global_values(self):
+        """Values of --config and --show are not taken as the subcommand."""
+        assert _find_command(["--config", "create", "create"]) == "create"
+        assert _find_command(["--config", "/tmp/c.json", "create"]) == "create"
+        assert _find_command(["--show", "--dry-run", "create"]) == "create"
+
+    def test_registry_help_matches_register(self):
+        """Stub help text must match what each command registers."""
+        for name, (module_path, summary) in _COMMAND_REGISTRY.items():
+            commands = _discover_commands(name)
+            parser = _build_parser(commands, _build_common_parser())
+            subparsers = next(a for a in parser._actions
+                              if isinstance(a, argparse._SubParsersAction))
+            help_by_name = {c.dest: c.help for c in subparsers._choices_actions}
+            assert help_by_name[name] == summary
+
+    @pytest.mark.parametrize("argv", [["--version"], ["--help"], [],
+                                      ["--show"]])
+    def test_top_level_does_not_import_commands(self, argv):
+        """--version, --help, --show, and bare ghtraf import no commands."""
+        code = (
+            "import sys\n"
+            "from ghtraf.cli import main\n"
+            "try:\n"
+            f"    main({argv!r})\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "assert 'ghtraf.commands.create' not in sys.modules\n"
+            "assert 'ghtraf.hints' not in sys.modules\n"
+            "assert 'ghtraf.lib.log_lib' not in sys.modules\n"
+        )
+        result = subprocess.run([sys.executable, "-c", code],
+                                capture_output=True, text=True, timeout=10)
+        assert result.returncode == 0, result.stderr
+
+    def test_dispatch_without_hints_skips_registration(self, tmp_path):
+        """A command run that emits no hint never imports ghtraf.hints."""
+        argv = ["create", "--files-only", "--dry-run", "--non-interactive",
+                "--repo-dir", str(tmp_path)]
+        code = (
+            "import sys\n"
+            "from ghtraf.cli import main\n"
+            f"assert main({argv!r}) == 0\n"
+            "assert 'ghtraf.hints' not in sys.modules\n"
+        )
+        result = subprocess.run([sys.executable, "-c", code],
+                                capture_output=True, text=True, timeout=10)
+        assert result.returncode == 0, result.stderr
+
+    @pytest.mark.parametrize("argv", [["--version"], ["--show"]])
+    def test_fast_paths_skip_argparse(self, argv):
+        """--version and bare --show should not import argparse at all."""
+        code = (
+            "import sys\n"
+            "from ghtraf.cli import main\n"
+            f"main({argv!r})\n"
+            "assert 'argparse' not in sys.modules\n"
+        )
+        result = subprocess.run([sys.executable, "-c", code],
+                                capture_output=True, text=True, timeout=10)
+        assert result.returncode == 0, result.stderr
+
+
+class TestNegativeNumbers:
+    """_is_negative_number() must agree with argparse's (3.10-3.12) pattern."""
+
+    @pytest.mark.parametrize("arg", [
+        "-5", "-42", "-.5", "-1.5", "-", "-.", "-5.", "-1.2.3",
+        "-v", "--5", "-5a", "-١٢",
+    ])
+    def test_matches_argparse(self, arg):
+        """Each candidate should classify the same way argparse does."""
+        matcher = re.compile(r'^-\d+$|^-\d*\.\d+$')
+        assert _is_negative_number(arg) == bool(matcher.match(arg))
+
+
 class TestMainEntryPoint:
     """Test the main() function with various argv inputs."""
 
     def test_version_flag(self, capsys):
-        """--version should print version and exit 0."""
-        with pytest.raises(SystemExit) as exc_info:
-            main(["--version"])
-        assert exc_info.value.code == 0
+        """--version should print version and return 0."""
+        assert main(["--version"]) == 0
         captured = capsys.readouterr()
         assert "ghtraf" in captured.out
 
+    def test_version_matches_argparse(self, capsys):
+        """The --version fast path should print what argparse would."""
+        main(["-V"])
+        fast = capsys.readouterr().out
+        with pytest.raises(SystemExit):
+            main(["-v", "--version"])
+        assert capsys.readouterr().out == fast
+
     def test_help_flag(self, capsys):
-        """--help should print help and exit 0."""
-        with pytest.raises(SystemExit) as exc_info:
-            main(["--help"])
-        assert exc_info.value.code == 0
+        """--help should print help and return 0."""
+        assert main(["--help"]) == 0
         captured = capsys.readouterr()
         assert "create" in captured.out
 
@@ -185,14 +323,22 @@ class TestMainEntryPoint:
 
     def test_init_not_in_help_listing(self, capsys):
         """'ghtraf --help' should NOT list 'init' (merged into create)."""
-        with pytest.raises(SystemExit) as exc_info:
-            main(["--help"])
-        assert exc_info.value.code == 0
+        assert main(["--help"]) == 0
         captured = capsys.readouterr()
         # 'init' should not appear as a subcommand
         # (it may appear in description text like "ghtraf init" references)
         assert "create" in captured.out
 
+    def test_bare_show_lists_channels(self, capsys):
+        """Bare --show should print the sorted channel listing and exit 0."""
+        result = main(["--show"])
+        assert result == 0
+        out = capsys.readouterr().out
+        assert out.startswith("Available channels:")
+        assert "trace" in out and "(opt-in)" in out
+        names = [line.split()[0] for line in out.splitlines()[1:]]
+        assert names == sorted(names)
+
     def test_unknown_subcommand_fails(self):
         """Unknown subcommand should exit non-zero."""
         with pytest.raises(SystemExit) as exc_info:
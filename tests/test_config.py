@@ -8,8 +8,10 @@ from unittest.mock import patch
 
 import pytest
 
+import ghtraf.config as config_mod
 from ghtraf.config import (
     find_project_config,
+    find_repo_markers,
     load_json,
     load_project_config,
     resolve_config,
@@ -44,6 +46,34 @@ class TestFindProjectConfig:
         assert result is None
 
 
+class TestFindRepoMarkers:
+    """Test the combined .ghtraf.json / .git walk-up."""
+
+    def test_config_in_parent_wins_over_git(self, tmp_path):
+        """.ghtraf.json further up should still be returned."""
+        cfg_file = tmp_path / ".ghtraf.json"
+        cfg_file.write_text('{"owner": "test"}')
+        child = tmp_path / "repo"
+        (child / ".git").mkdir(parents=True)
+        cfg, git_dir = find_repo_markers(child)
+        assert cfg == cfg_file
+        assert git_dir == child
+
+    def test_records_nearest_git_dir(self, tmp_path):
+        """Without a config, the closest .git ancestor is reported."""
+        (tmp_path / ".git").mkdir()
+        inner = tmp_path / "a" / "b"
+        (inner.parent / ".git").mkdir(parents=True)
+        inner.mkdir()
+        cfg, git_dir = find_repo_markers(inner)
+        assert cfg is None
+        assert git_dir == inner.parent
+
+    def test_returns_none_pair_when_missing(self, tmp_path):
+        """Neither marker present should give (None, None)."""
+        assert find_repo_markers(tmp_path) == (None, None)
+
+
 class TestLoadJson:
     """Test JSON file loading with error handling."""
 
@@ -63,6 +93,28 @@ class TestLoadJson:
         f.write_text("{not valid json")
         assert load_json(f) == {}
 
+    def test_unchanged_file_is_parsed_once(self, tmp_path):
+        """A second load of an unchanged file should not reopen it."""
+        f = tmp_path / "test.json"
+        f.write_text('{"key": "value"}')
+        load_json(f)
+        with patch("builtins.open", side_effect=AssertionError("reread")):
+            assert load_json(f) == {"key": "value"}
+
+    def test_rewrite_invalidates_cache(self, tmp_path):
+        """Saving over a file should be picked up by the next load."""
+        path = save_project_config({"owner": "old"}, str(tmp_path))
+        assert load_json(path)["owner"] == "old"
+        save_project_config({"owner": "newer"}, str(tmp_path))
+        assert load_json(path)["owner"] == "newer"
+
+    def test_mutating_result_does_not_touch_cache(self, tmp_path):
+        """Callers own the returned dict."""
+        f = tmp_path / "test.json"
+        f.write_text('{"repos": {}}')
+        load_json(f)["repos"]["x/y"] = {}
+        assert load_json(f) == {"repos": {}}
+
 
 class TestSaveConfig:
     """Test config file writing."""
@@ -90,6 +142,54 @@ class TestSaveConfig:
         save_global_config({"version": 1})
         assert ghtraf_dir.exists()
 
+    def test_save_leaves_no_temp_file(self, tmp_path):
+        """The temp file should be renamed over the target."""
+        save_project_config({"owner": "a"}, str(tmp_path))
+        assert sorted(p.name for p in tmp_path.iterdir()) == [".ghtraf.json"]
+
+    def test_failed_write_keeps_old_config(self, tmp_path):
+        """A failure before the rename should leave the old file intact."""
+        path = save_project_config({"owner": "old"}, str(tmp_path))
+        with patch("ghtraf.config.os.replace", side_effect=OSError("boom")):
+            with pytest.raises(OSError):
+                save_project_config({"owner": "new"}, str(tmp_path))
+        assert json.loads(path.read_text())["owner"] == "old"
+        assert sorted(p.name for p in tmp_path.iterdir()) == [".ghtraf.json"]
+
+    def test_existing_tmp_file_untouched(self, tmp_path):
+        """A user's own .tmp file next to the target is left alone."""
+        user_tmp = tmp_path / ".ghtraf.json.tmp"
+        user_tmp.write_text("mine")
+        with patch("ghtraf.config.os.replace", side_effect=OSError("boom")):
+            with pytest.raises(OSError):
+                save_project_config({"owner": "a"}, str(tmp_path))
+        save_project_config({"owner": "a"}, str(tmp_path))
+        assert user_tmp.read_text() == "mine"
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX permission bits")
+    def test_mode_preserved(self, tmp_path):
+        """Rewriting a file keeps its permission bits."""
+        path = save_project_config({"owner": "a"}, str(tmp_path))
+        path.chmod(0o600)
+        save_project_config({"owner": "b"}, str(tmp_path))
+        assert path.stat().st_mode & 0o777 == 0o600
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX permission bits")
+    def test_new_file_follows_umask(self, tmp_path):
+        """A new file gets the usual umask-derived mode, not mkstemp's 0600."""
+        path = save_project_config({"owner": "a"}, str(tmp_path))
+        assert path.stat().st_mode & 0o777 == 0o666 & ~config_mod._UMASK
+
+    @pytest.mark.skipif(os.name == "nt", reason="symlinks need privileges")
+    def test_symlink_kept(self, tmp_path):
+        """Writing through a symlink updates its target, keeping the link."""
+        real = tmp_path / "real.json"
+        real.write_text("{}")
+        (tmp_path / ".ghtraf.json").symlink_to(real)
+        save_project_config({"owner": "a"}, str(tmp_path))
+        assert (tmp_path / ".ghtraf.json").is_symlink()
+        assert json.loads(real.read_text()) == {"owner": "a"}
+
 
 class TestResolveConfig:
     """Test three-layer config resolution (CLI > project > global)."""
@@ -117,6 +217,24 @@ class TestResolveConfig:
         assert resolved["owner"] == "testorg"
         assert resolved["repo"] == "testrepo"
 
+    def test_all_cli_values_skip_config_files(self, tmp_path):
+        """No config file is consulted when CLI supplies every key."""
+        args = Namespace(owner="o", repo="r", repo_dir=str(tmp_path))
+        with patch("ghtraf.config.load_project_config") as mock_proj, \
+                patch("ghtraf.config.load_global_config") as mock_glob:
+            resolved = resolve_config(args)
+        assert resolved == {"owner": "o", "repo": "r",
+                            "repo_dir": str(tmp_path)}
+        mock_proj.assert_not_called()
+        mock_glob.assert_not_called()
+
+    def test_hyphenated_json_keys_match(self, tmp_path):
+        """A 'display-name' key in .ghtraf.json resolves as display_name."""
+        (tmp_path / ".ghtraf.json").write_text('{"display-name": "Demo"}')
+        args = Namespace(repo_dir=str(tmp_path))
+        resolved = resolve_config(args, keys=["display_name"])
+        assert resolved == {"display_name": "Demo"}
+
     def test_returns_none_when_no_config(self, tmp_path):
         """Should return None values when no config exists anywhere."""
         args = Namespace(owner=None, repo=None, repo_dir=None)
@@ -5,6 +5,7 @@ from ghtraf.configure import (
     configure_dashboard,
     configure_readme,
     configure_workflow,
+    rewrite_js_constants,
 )
 
 
@@ -67,6 +68,88 @@ class TestApplyReplacements:
         assert "222" not in content  # CCC never matched
 
 
+    def test_only_first_match_replaced(self, tmp_path):
+        """Each pattern replaces its first match, as with count=1."""
+        f = tmp_path / "test.txt"
+        f.write_text("AAA AAA BBB")
+        replacements = [
+            (r"AAA", "{x}", "first"),
+            (r"BBB", "{y}", "second"),
+        ]
+        count = apply_replacements(f, replacements, {"x": "1", "y": "2"})
+        assert count == 2
+        assert f.read_text() == "1 AAA 2"
+
+    def test_template_inserted_literally(self, tmp_path):
+        """Backslashes in substituted values are not treated as escapes."""
+        f = tmp_path / "test.txt"
+        f.write_text("name: PLACEHOLDER")
+        replacements = [(r"PLACEHOLDER", "{name}", "name")]
+        apply_replacements(f, replacements, {"name": r"C:\new\1"})
+        assert f.read_text() == r"name: C:\new\1"
+
+
+    def test_required_literal_absent_skips_pattern(self, tmp_path):
+        """A missing required literal reports the entry as not found."""
+        f = tmp_path / "test.txt"
+        f.write_text("AAA")
+        replacements = [
+            (r"A+", "{x}", "first", "AAA"),
+            (r"B+", "{y}", "second", "BBB"),
+        ]
+        count = apply_replacements(f, replacements, {"x": "1", "y": "2"})
+        assert count == 1
+        assert f.read_text() == "1"
+
+    def test_nothing_to_rewrite_is_not_decoded(self, tmp_path):
+        """With no literal present the file is left undecoded and intact."""
+        f = tmp_path / "test.bin"
+        f.write_bytes(b"\xff\xfe not utf-8")
+        replacements = [(r"A+", "{x}", "first", "AAA")]
+        assert apply_replacements(f, replacements, {"x": "1"}) == 0
+        assert f.read_bytes() == b"\xff\xfe not utf-8"
+
+    def test_empty_file_returns_zero(self, tmp_path):
+        """An empty file reports every entry as not found."""
+        f = tmp_path / "empty.txt"
+        f.write_text("")
+        replacements = [(r"A+", "{x}", "first", "A")]
+        js = [("GIST", "{x}", "gist const")]
+        assert apply_replacements(f, replacements, {"x": "1"},
+                                  js_constants=js) == 0
+
+
+class TestRewriteJsConstants:
+    """Test the line-scan rewrite of anchored `const NAME = '...';` lines."""
+
+    def test_rewrites_value_preserving_indent_and_comment(self):
+        """Indentation and trailing text after the value should survive."""
+        content = "    const REPO_CREATED = '2025-01-01'; // age calc\n"
+        new, found = rewrite_js_constants(content, {"REPO_CREATED": "2026-06-15"})
+        assert new == "    const REPO_CREATED = '2026-06-15'; // age calc\n"
+        assert found == {"REPO_CREATED"}
+
+    def test_only_first_occurrence(self):
+        """Only the first matching line per name should be rewritten."""
+        content = "const A = 'x';\nconst A = 'y';\n"
+        new, found = rewrite_js_constants(content, {"A": "z"})
+        assert new == "const A = 'z';\nconst A = 'y';\n"
+
+    def test_unlisted_and_similar_names_untouched(self):
+        """Names not in values (including prefixes) should be left alone."""
+        content = "const REPO = 'a';\nconst REPO_NAME_X = 'b';\nlet REPO_NAME = 'c';\n"
+        new, found = rewrite_js_constants(content, {"REPO_NAME": "new"})
+        assert new == content
+        assert found == set()
+
+    def test_empty_value_not_rewritten(self):
+        """An empty quoted value is not treated as a placeholder."""
+        content = "const A = '';\n"
+        new, found = rewrite_js_constants(content, {"A": "z"})
+        assert new == content
+        assert found == set()
+
+
 class TestConfigureDashboard:
     """Test dashboard HTML configuration."""
 
@@ -110,6 +193,53 @@ class TestConfigureWorkflow:
         assert "# workflow_run:" in content
         assert count >= 1
 
+    def test_commented_out_block_left_alone(self, tmp_path):
+        """An already commented-out trigger should not match again."""
+        wf = tmp_path / "wf.yml"
+        text = ("on:\n"
+                "  # workflow_run:\n"
+                "  #   workflows: [\"CI\"]\n"
+                "  #   types: [completed]\n")
+        wf.write_text(text)
+        assert configure_workflow({"ci_workflows": []}, wf) == 0
+        assert wf.read_text() == text
+
+    def test_archive_version_reset(self, tmp_path):
+        """The archive version string should be reset to 0.1.0."""
+        wf = tmp_path / "wf.yml"
+        wf.write_text('meta = { version: "2.3.4", schema: 1 }\n')
+        count = configure_workflow({"ci_workflows": ["CI"]}, wf)
+        assert count == 1
+        assert wf.read_text() == 'meta = { version: "0.1.0", schema: 1 }\n'
+
+    def test_archive_version_skips_other_version_keys(self, tmp_path):
+        """Keys ending in 'version' ahead of the archive line are untouched."""
+        wf = tmp_path / "wf.yml"
+        wf.write_text('      python-version: "3.12",\n'
+                      '    steps: run\n'
+                      'meta = { version: "2.3.4", schema: 1 }\n'
+                      'old = { version: "1.0.0", schema: 0 }\n')
+        count = configure_workflow({"ci_workflows": ["CI"]}, wf)
+        assert count == 1
+        assert wf.read_text() == ('      python-version: "3.12",\n'
+                                  '    steps: run\n'
+                                  'meta = { version: "0.1.0", schema: 1 }\n'
+                                  'old = { version: "0.1.0", schema: 0 }\n')
+
+    def test_crlf_line_endings_preserved(self, tmp_path):
+        """A CRLF workflow keeps CRLF on every line, edited or not."""
+        wf = tmp_path / "wf.yml"
+        wf.write_bytes(b'on:\r\n'
+                       b'  workflow_run:\r\n'
+                       b'    workflows: ["CI"]\r\n'
+                       b'    types: [completed]\r\n'
+                       b'meta = { version: "2.3.4", schema: 1 }\r\n')
+        assert configure_workflow({"ci_workflows": []}, wf) == 2
+        data = wf.read_bytes()
+        assert b"# workflow_run:" in data
+        assert b'version: "0.1.0"' in data
+        assert data.count(b"\n") == data.count(b"\r\n") == 5
+
     def test_missing_workflow_file(self, tmp_path):
         """Should handle missing workflow file gracefully."""
         config = {"ci_workflows": ["CI"]}
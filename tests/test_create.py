@@ -62,6 +62,20 @@ class TestCreateDryRun:
         assert "Configure project files" in captured.out
 
 
+    def test_display_name_derived_from_repo(self, mock_gh, capsys):
+        """Without --display-name, '-' and '_' become spaces, title-cased."""
+        result = main([
+            "create",
+            "--dry-run",
+            "--non-interactive",
+            "--owner", "testorg",
+            "--repo", "my_cool-repo",
+            "--created", "2026-01-01",
+        ])
+        assert result == 0
+        assert "My Cool Repo" in capsys.readouterr().out
+
+
 class TestCreateConfigure:
     """Test --configure with actual placeholder files."""
 
@@ -180,6 +194,19 @@ class TestCreateValidation:
         ])
         assert result == 1
 
+    @pytest.mark.parametrize("created", ["2026-02-30", "2026-13-01",
+                                         "20260101", "2026-1-1"])
+    def test_impossible_or_compact_date_fails(self, mock_gh, created):
+        """Only real calendar dates in YYYY-MM-DD form are accepted."""
+        result = main([
+            "create",
+            "--non-interactive",
+            "--owner", "testorg",
+            "--repo", "testrepo",
+            "--created", created,
+        ])
+        assert result == 1
+
     def test_created_auto_detects_from_api(self, mock_gh, capsys):
         """Omitting --created should auto-detect from repo API."""
         # mock_gh's get_repo_created_date returns "2026-01-01"
@@ -233,10 +260,188 @@ class TestCreateSkipVariables:
         assert "gh variable set TRAFFIC_GIST_ID" in captured.out
         # Should still have gist creation steps
         assert "badge gist" in captured.out.lower()
+
+    def test_repo_lookup_warmed_with_prerequisites(self, mock_gh, monkeypatch):
+        """With owner/repo flags, the repo lookup starts before config."""
+        import ghtraf.commands.create as create_mod
+        import ghtraf.gh as gh_mod
+        events = []
+        monkeypatch.setattr(gh_mod, "check_repo_exists",
+                            lambda gh_repo: events.append(("repo", gh_repo)))
+        real_gather = create_mod._gather_config
+        monkeypatch.setattr(create_mod, "_gather_config",
+                            lambda a: events.append(("gather",)) or real_gather(a))
+        main([
+            "create", "--dry-run", "--non-interactive", "--skip-variables",
+            "--owner", "testorg", "--repo", "testrepo",
+        ])
+        assert events[:2] == [("repo", "testorg/testrepo"), ("gather",)]
+
+    def test_skip_variables_skips_repo_check(self, mock_gh, monkeypatch):
+        """--skip-variables should not spend a round trip on the repo check."""
+        import ghtraf.gh as gh_mod
+        checked = []
+        monkeypatch.setattr(gh_mod, "check_repo_exists", checked.append)
+        main([
+            "create", "--dry-run", "--non-interactive", "--skip-variables",
+            "--owner", "testorg", "--repo", "testrepo",
+            "--created", "2026-01-01",
+        ])
+        assert checked == []
         # No actual variable-setting calls should have been made
         assert len(mock_gh["variables_set"]) == 0
 
 
+class TestCreatePrerequisites:
+    """Prerequisite checks overlap their gh calls but report in order."""
+
+    ARGS = [
+        "create", "--dry-run", "--non-interactive",
+        "--owner", "testorg", "--repo", "testrepo",
+        "--created", "2026-01-01",
+    ]
+
+    def test_messages_in_order(self, mock_gh, capsys):
+        """Prerequisite lines should print in the original sequence."""
+        assert main(self.ARGS) == 0
+        out = capsys.readouterr().out
+        positions = [out.index(text) for text in (
+            "gh CLI found", "Logged in to github.com",
+            "Token has gist access", "GitHub username: testuser",
+        )]
+        assert positions == sorted(positions)
+
+    def test_auth_failure_skips_username_lookup(self, mock_gh, monkeypatch):
+        """A failed auth check should not start the username lookup."""
+        import ghtraf.gh as gh_mod
+        lookups = []
+
+        def fail_auth(use_cache=True):
+            raise SystemExit(1)
+
+        monkeypatch.setattr(gh_mod, "check_gh_authenticated", fail_auth)
+        monkeypatch.setattr(gh_mod, "resolve_github_username",
+                            lambda use_cache=True: lookups.append(1) or "x")
+        assert main(self.ARGS) == 1
+        assert lookups == []
+
+    def test_no_cache_flag_bypasses_cache(self, mock_gh, monkeypatch):
+        """--no-cache should reach every cached gh lookup."""
+        import ghtraf.gh as gh_mod
+        seen = {}
+
+        def record(name, result):
+            def fake(*args, use_cache=True):
+                seen[name] = use_cache
+                return result
+            return fake
+
+        monkeypatch.setattr(gh_mod, "check_gh_authenticated",
+                            record("auth", "Logged in to github.com account x"))
+        monkeypatch.setattr(gh_mod, "check_gh_scopes", record("scope", True))
+        monkeypatch.setattr(gh_mod, "resolve_github_username",
+                            record("user", "x"))
+        assert main(self.ARGS + ["--no-cache"]) == 0
+        assert seen == {"auth": False, "scope": False, "user": False}
+
+
+class TestCreateReviewScreen:
+    """Test the single deferred review screen in interactive mode."""
+
+    ARGS = [
+        "create",
+        "--dry-run",
+        "--owner", "testorg",
+        "--repo", "my-project",
+        "--created", "2026-01-01",
+    ]
+
+    def test_blank_accepts_defaults(self, mock_gh, capsys, monkeypatch):
+        """A single blank answer should accept all derived defaults."""
+        answers = iter([""])
+        monkeypatch.setattr("builtins.input", lambda _="": next(answers))
+        result = main(self.ARGS)
+        assert result == 0
+        captured = capsys.readouterr()
+        assert "Display Name: My Project" in captured.out
+        assert "badge gist" in captured.out.lower()
+
+    def test_edit_field_then_accept(self, mock_gh, capsys, monkeypatch):
+        """Typing a field name should edit it, then re-show the screen."""
+        answers = iter(["display name", "Renamed", ""])
+        monkeypatch.setattr("builtins.input", lambda _="": next(answers))
+        result = main(self.ARGS)
+        assert result == 0
+        captured = capsys.readouterr()
+        assert "Display Name: Renamed" in captured.out
+
+    def test_edit_ci_workflows(self, mock_gh, capsys, monkeypatch):
+        """CI workflows are entered as a comma-separated list."""
+        answers = iter(["ci_workflows", "CI, Tests", ""])
+        monkeypatch.setattr("builtins.input", lambda _="": next(answers))
+        result = main(self.ARGS)
+        assert result == 0
+        captured = capsys.readouterr()
+        assert "CI Workflows: CI, Tests" in captured.out
+
+    def test_unknown_field_reprompts(self, mock_gh, capsys, monkeypatch):
+        """An unknown field name should list valid fields and ask again."""
+        answers = iter(["bogus", ""])
+        monkeypatch.setattr("builtins.input", lambda _="": next(answers))
+        result = main(self.ARGS)
+        assert result == 0
+        captured = capsys.readouterr()
+        assert "Unknown field 'bogus'" in captured.out
+
+    def test_repo_edit_redetects_created(self, mock_gh, capsys, monkeypatch):
+        """Without --created, editing the repo looks up its date again."""
+        from ghtraf import gh as gh_mod
+        looked_up = []
+
+        def fake_created(gh_repo):
+            looked_up.append(gh_repo)
+            return "2020-02-02" if gh_repo == "testorg/other" else "2026-01-01"
+
+        monkeypatch.setattr(gh_mod, "get_repo_created_date", fake_created)
+        answers = iter(["repo", "other", ""])
+        monkeypatch.setattr("builtins.input", lambda _="": next(answers))
+        argv = [a for a in self.ARGS if a not in ("--created", "2026-01-01")]
+        assert main(argv) == 0
+        assert looked_up[-1] == "testorg/other"
+        assert "Created:      2020-02-02" in capsys.readouterr().out
+
+    def test_repo_edit_keeps_explicit_created(self, mock_gh, capsys,
+                                              monkeypatch):
+        """An explicit --created survives an owner/repo edit."""
+        from ghtraf import gh as gh_mod
+        looked_up = []
+        monkeypatch.setattr(gh_mod, "get_repo_created_date",
+                            lambda gh_repo: looked_up.append(gh_repo) or "2020-02-02")
+        answers = iter(["owner", "otherorg", ""])
+        monkeypatch.setattr("builtins.input", lambda _="": next(answers))
+        assert main(self.ARGS) == 0
+        assert "otherorg/my-project" not in looked_up
+        assert "2020-02-02" not in capsys.readouterr().out
+
+    def test_invalid_created_reprompts(self, mock_gh, capsys, monkeypatch):
+        """A mistyped date is re-asked on the review screen, not fatal."""
+        answers = iter(["created", "2026-13-01", "2025-06-07", ""])
+        monkeypatch.setattr("builtins.input", lambda _="": next(answers))
+        assert main(self.ARGS) == 0
+        captured = capsys.readouterr()
+        assert "Invalid date format '2026-13-01'" in captured.err + captured.out
+        assert "Created:      2025-06-07" in captured.out
+
+    def test_q_cancels(self, mock_gh, capsys, monkeypatch):
+        """'q' should cancel before any gist is created."""
+        monkeypatch.setattr("builtins.input", lambda _="": "q")
+        result = main(self.ARGS)
+        assert result == 0
+        captured = capsys.readouterr()
+        assert "Setup cancelled." in captured.out
+        assert "badge gist" not in captured.out.lower()
+
+
 class TestFilesOnlyDispatch:
     """Test that --files-only dispatches to template deployment, not cloud setup."""
 
@@ -460,6 +665,17 @@ class TestPlanFiles:
         for rel in TEMPLATE_FILES[2:]:
             assert ops[str(rel)] == "copy"
 
+    def test_missing_template_warned(self, tmp_path, template_src, capsys):
+        """A template missing from the package is reported, not planned."""
+        (template_src / TEMPLATE_FILES[-1]).unlink()
+        dest = tmp_path / "repo"
+        dest.mkdir()
+        plan = plan_files(dest, template_src)
+
+        assert len(plan.actions) == len(TEMPLATE_FILES) - 1
+        out = capsys.readouterr()
+        assert TEMPLATE_FILES[-1].name in out.out + out.err
+
 
 class TestFilesExecutor:
     """Test make_files_executor() behavior."""
@@ -482,6 +698,35 @@ class TestFilesExecutor:
         assert not result.skipped
         assert (dest / "docs" / "stats" / "favicon.svg").exists()
 
+    def test_shared_parent_created_once(self, tmp_path, template_src,
+                                        monkeypatch):
+        """Templates sharing docs/stats/ trigger a single mkdir."""
+        dest = tmp_path / "repo"
+        dest.mkdir()
+        executor = make_files_executor(template_src, dest)
+        targets = ["docs/stats/favicon.svg", "docs/stats/README.md"]
+
+        made = []
+        real_mkdir = Path.mkdir
+
+        def counting_mkdir(self, *args, **kwargs):
+            made.append(self)
+            return real_mkdir(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "mkdir", counting_mkdir)
+        calls_after = []
+        for target in targets:
+            executor(Action(id=f"file:copy:{target}", category="file",
+                            operation="copy", target=target,
+                            description="New template file"))
+            calls_after.append(len(made))
+        monkeypatch.undo()
+
+        assert calls_after[0] > 0
+        assert calls_after[1] == calls_after[0]
+        for target in targets:
+            assert (dest / target).exists()
+
     def test_skip_action(self, tmp_path, template_src):
         """Executor returns skipped result for skip action."""
         dest = tmp_path / "repo"
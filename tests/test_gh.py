@@ -0,0 +1,333 @@
+"""Tests for ghtraf.gh — gh CLI wrapper utilities."""
+
+import json
+import os
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+import ghtraf.gh as gh_mod
+
+
+def _completed(args, stdout="", returncode=0, stderr=""):
+    """Build a fake CompletedProcess for subprocess.run patches."""
+    return subprocess.CompletedProcess(args, returncode, stdout, stderr)
+
+
+@pytest.fixture
+def cache_home(tmp_path):
+    """Point XDG_CACHE_HOME at a temporary directory.
+
+    Also resets the per-process token fingerprint, so each test starts
+    as a fresh run.
+    """
+    cache = tmp_path / "cache"
+    gh_mod._get_token_fingerprint.cache_clear()
+    with patch.dict(os.environ, {"XDG_CACHE_HOME": str(cache)}):
+        yield cache
+    gh_mod._get_token_fingerprint.cache_clear()
+
+
+def _fake_gh(token="tok-1", login="octocat", auth_rc=0, gists_rc=0,
+             gists_err=""):
+    """Return a subprocess.run fake and the list of argv it saw."""
+    seen = []
+
+    def fake_run(args, **kwargs):
+        seen.append(args)
+        if args[:3] == ["gh", "auth", "token"]:
+            return _completed(args, stdout=token + "\n")
+        if args[:3] == ["gh", "auth", "status"]:
+            return _completed(args, returncode=auth_rc,
+                              stdout="Logged in to github.com account x\n")
+        if args[:3] == ["gh", "api", "user"]:
+            return _completed(args, stdout=login + "\n")
+        if args[:3] == ["gh", "api", "gists"]:
+            return _completed(args, returncode=gists_rc, stderr=gists_err)
+        return _completed(args)
+
+    return fake_run, seen
+
+
+def _calls(seen, *prefix):
+    """Return the recorded argv lists starting with prefix."""
+    return [a for a in seen if a[:len(prefix)] == list(prefix)]
+
+
+class TestUsernameCache:
+    """Test the on-disk cache for resolve_github_username()."""
+
+    def test_first_call_fetches_and_writes_cache(self, cache_home):
+        """A cold cache should hit the API and persist the result."""
+        fake_run, seen = _fake_gh()
+        with patch("subprocess.run", fake_run):
+            assert gh_mod.resolve_github_username() == "octocat"
+        assert len(_calls(seen, "gh", "api", "user")) == 1
+        data = json.loads((cache_home / "ghtraf" / "auth.json").read_text())
+        assert data["github.com"]["username"] == "octocat"
+
+    def test_second_call_uses_cache(self, cache_home):
+        """A warm cache should skip the `gh api user` call."""
+        fake_run, seen = _fake_gh()
+        with patch("subprocess.run", fake_run):
+            gh_mod.resolve_github_username()
+            assert gh_mod.resolve_github_username() == "octocat"
+        assert len(_calls(seen, "gh", "api", "user")) == 1
+
+    def test_token_change_invalidates(self, cache_home):
+        """A different gh token should force a fresh lookup."""
+        fake_run, seen = _fake_gh(token="tok-1", login="alice")
+        with patch("subprocess.run", fake_run):
+            gh_mod.resolve_github_username()
+        gh_mod._get_token_fingerprint.cache_clear()  # next run
+        fake_run, seen = _fake_gh(token="tok-2", login="bob")
+        with patch("subprocess.run", fake_run):
+            assert gh_mod.resolve_github_username() == "bob"
+        assert len(_calls(seen, "gh", "api", "user")) == 1
+
+    def test_expired_entry_refetches(self, cache_home):
+        """Entries older than USERNAME_CACHE_TTL should be ignored."""
+        fake_run, seen = _fake_gh()
+        with patch("subprocess.run", fake_run):
+            gh_mod.resolve_github_username()
+            later = gh_mod.time.time() + gh_mod.USERNAME_CACHE_TTL + 1
+            with patch.object(gh_mod.time, "time", return_value=later):
+                gh_mod.resolve_github_username()
+        assert len(_calls(seen, "gh", "api", "user")) == 2
+
+    def test_no_token_skips_cache(self, cache_home):
+        """Without a readable token, nothing is cached."""
+        fake_run, seen = _fake_gh(token="")
+        with patch("subprocess.run", fake_run):
+            assert gh_mod.resolve_github_username() == "octocat"
+        assert not (cache_home / "ghtraf" / "auth.json").exists()
+
+    def test_corrupt_cache_is_ignored(self, cache_home):
+        """A malformed cache file should fall back to the API."""
+        cache_file = cache_home / "ghtraf" / "auth.json"
+        cache_file.parent.mkdir(parents=True)
+        cache_file.write_text("{not json")
+        fake_run, seen = _fake_gh()
+        with patch("subprocess.run", fake_run):
+            assert gh_mod.resolve_github_username() == "octocat"
+        assert len(_calls(seen, "gh", "api", "user")) == 1
+
+
+class TestAuthCache:
+    """Auth status and gist scope share the per-token cache entry."""
+
+    def test_auth_status_cached(self, cache_home):
+        """A second check_gh_authenticated() should skip `gh auth status`."""
+        fake_run, seen = _fake_gh()
+        with patch("subprocess.run", fake_run):
+            first = gh_mod.check_gh_authenticated()
+            assert gh_mod.check_gh_authenticated() == first
+        assert len(_calls(seen, "gh", "auth", "status")) == 1
+
+    def test_use_cache_false_rechecks(self, cache_home):
+        """use_cache=False should always run `gh auth status`."""
+        fake_run, seen = _fake_gh()
+        with patch("subprocess.run", fake_run):
+            gh_mod.check_gh_authenticated()
+            gh_mod.check_gh_authenticated(use_cache=False)
+        assert len(_calls(seen, "gh", "auth", "status")) == 2
+
+    def test_auth_failure_clears_entry(self, cache_home):
+        """A failed auth check should drop the cached entry for the host."""
+        fake_run, _ = _fake_gh()
+        with patch("subprocess.run", fake_run):
+            gh_mod.resolve_github_username()
+        fake_run, _ = _fake_gh(auth_rc=1)
+        with patch("subprocess.run", fake_run):
+            with pytest.raises(SystemExit):
+                gh_mod.check_gh_authenticated(use_cache=False)
+        data = json.loads((cache_home / "ghtraf" / "auth.json").read_text())
+        assert "github.com" not in data
+
+    def test_scope_cached_when_confirmed(self, cache_home):
+        """A confirmed gist scope should skip the gists probe next time."""
+        fake_run, seen = _fake_gh()
+        with patch("subprocess.run", fake_run):
+            assert gh_mod.check_gh_scopes() is True
+            assert gh_mod.check_gh_scopes() is True
+        assert len(_calls(seen, "gh", "api", "gists")) == 1
+
+    def test_missing_scope_not_cached(self, cache_home):
+        """A 403 should be rechecked on the next call."""
+        fake_run, seen = _fake_gh(gists_rc=1, gists_err="HTTP 403")
+        with patch("subprocess.run", fake_run):
+            assert gh_mod.check_gh_scopes() is False
+            assert gh_mod.check_gh_scopes() is False
+        assert len(_calls(seen, "gh", "api", "gists")) == 2
+
+    def test_lookups_share_one_entry(self, cache_home):
+        """Username, auth and scope results land in the same host entry."""
+        fake_run, _ = _fake_gh()
+        with patch("subprocess.run", fake_run):
+            gh_mod.check_gh_authenticated()
+            gh_mod.check_gh_scopes()
+            gh_mod.resolve_github_username()
+        entry = json.loads(
+            (cache_home / "ghtraf" / "auth.json").read_text())["github.com"]
+        assert entry["username"] == "octocat"
+        assert entry["gist_scope"] is True
+        assert "Logged in" in entry["auth_status"]
+
+    def test_cache_write_is_atomic(self, cache_home):
+        """A failed write leaves the previous cache file intact."""
+        fake_run, _ = _fake_gh()
+        with patch("subprocess.run", fake_run):
+            gh_mod.resolve_github_username()
+        cache_file = cache_home / "ghtraf" / "auth.json"
+        before = cache_file.read_text()
+        with patch("os.replace", side_effect=OSError("disk full")):
+            gh_mod._write_auth_cache({"github.com": {}})
+        assert cache_file.read_text() == before
+        assert list(cache_file.parent.iterdir()) == [cache_file]
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX permission bits")
+    def test_cache_file_owner_only(self, cache_home):
+        """auth.json holds auth output, so it is not group/world-readable."""
+        fake_run, _ = _fake_gh()
+        with patch("subprocess.run", fake_run):
+            gh_mod.check_gh_authenticated()
+        cache_file = cache_home / "ghtraf" / "auth.json"
+        assert cache_file.stat().st_mode & 0o777 == 0o600
+
+    def test_token_read_once_per_process(self, cache_home):
+        """All three lookups share a single `gh auth token` spawn."""
+        fake_run, seen = _fake_gh()
+        with patch("subprocess.run", fake_run):
+            gh_mod.check_gh_authenticated()
+            gh_mod.check_gh_scopes()
+            gh_mod.resolve_github_username()
+            gh_mod.check_gh_authenticated(use_cache=False)
+        assert len(_calls(seen, "gh", "auth", "token")) == 1
+
+    def test_auth_failure_rereads_token(self, cache_home):
+        """After an auth failure the token is fingerprinted afresh."""
+        fake_run, seen = _fake_gh(auth_rc=1)
+        with patch("subprocess.run", fake_run):
+            with pytest.raises(SystemExit):
+                gh_mod.check_gh_authenticated()
+            gh_mod.resolve_github_username()
+        assert len(_calls(seen, "gh", "auth", "token")) == 2
+
+
+class TestStdinHandling:
+    """gh subprocesses should not inherit the parent's TTY stdin."""
+
+    def test_run_gh_without_input_uses_devnull(self):
+        """run_gh() with no input_data should close stdin."""
+        with patch("subprocess.run",
+                   return_value=_completed([], stdout="ok")) as mock:
+            assert gh_mod.run_gh(["api", "user"]) == "ok"
+        kwargs = mock.call_args[1]
+        assert kwargs["stdin"] is subprocess.DEVNULL
+        assert "input" not in kwargs
+
+    def test_run_gh_with_input_pipes_it(self):
+        """run_gh() with input_data should pipe it instead."""
+        with patch("subprocess.run",
+                   return_value=_completed([], stdout="ok")) as mock:
+            gh_mod.run_gh(["api", "gists"], input_data="{}")
+        kwargs = mock.call_args[1]
+        assert kwargs["input"] == "{}"
+        assert "stdin" not in kwargs
+
+    def test_set_repo_variable_uses_devnull(self):
+        """Non-input helpers like set_repo_variable() close stdin too."""
+        with patch("subprocess.run", return_value=_completed([])) as mock:
+            assert gh_mod.set_repo_variable("X", "1", "o/r") is True
+        assert mock.call_args[1]["stdin"] is subprocess.DEVNULL
+
+
+class TestSetRepoVariables:
+    """set_repo_variables() batches into one gh call when it can."""
+
+    def test_plain_values_use_one_call(self):
+        """Plain values should be piped as dotenv to a single gh call."""
+        with patch("subprocess.run",
+                   return_value=_completed([])) as mock:
+            results = gh_mod.set_repo_variables({"A": "1", "B": "o/r"}, "o/r")
+        assert results == {"A": True, "B": True}
+        assert mock.call_count == 1
+        assert mock.call_args[0][0][:5] == ["gh", "variable", "set", "-f", "-"]
+        assert mock.call_args[1]["input"] == "A=1\nB=o/r\n"
+
+    def test_quoted_value_sets_each_variable(self):
+        """A value needing dotenv quoting falls back to one call each."""
+        seen = []
+
+        def fake_run(args, **kwargs):
+            seen.append(args)
+            return _completed(args)
+
+        with patch("subprocess.run", fake_run):
+            results = gh_mod.set_repo_variables(
+                {"A": "My Project", "B": "2"}, "o/r")
+        assert results == {"A": True, "B": True}
+        assert sorted(a[3] for a in seen) == ["A", "B"]
+
+    def test_batch_failure_reports_per_name(self):
+        """A failed batch retries per name; only the bad one is False."""
+        def fake_run(args, **kwargs):
+            return _completed(args, returncode=1 if args[3] in ("-f", "B")
+                              else 0)
+
+        with patch("subprocess.run", fake_run):
+            results = gh_mod.set_repo_variables({"A": "1", "B": "2"}, "o/r")
+        assert results == {"A": True, "B": False}
+
+    def test_dry_run_makes_no_calls(self):
+        """Dry run should succeed without spawning gh."""
+        with patch("subprocess.run") as mock:
+            results = gh_mod.set_repo_variables({"A": "1", "B": "2"}, "o/r",
+                                                dry_run=True)
+        assert results == {"A": True, "B": True}
+        mock.assert_not_called()
+
+
+class TestRepoSummary:
+    """check_repo_exists() and get_repo_created_date() share one lookup."""
+
+    @pytest.fixture(autouse=True)
+    def _fresh_cache(self):
+        gh_mod._get_repo_summary.cache_clear()
+        yield
+        gh_mod._get_repo_summary.cache_clear()
+
+    def test_one_call_serves_both(self):
+        """The date lookup and the existence check share a gh call."""
+        with patch("subprocess.run", return_value=_completed(
+                [], stdout="o/r\n2024-05-06T07:08:09Z\n")) as mock:
+            assert gh_mod.get_repo_created_date("o/r") == "2024-05-06"
+            assert gh_mod.check_repo_exists("o/r") == "o/r"
+        assert mock.call_count == 1
+
+    def test_missing_repo(self):
+        """A failed lookup yields None from both helpers."""
+        with patch("subprocess.run",
+                   return_value=_completed([], returncode=1)):
+            assert gh_mod.check_repo_exists("o/nope") is None
+            assert gh_mod.get_repo_created_date("o/nope") is None
+
+    def test_failure_not_memoised(self):
+        """A failed lookup is retried; the later success is kept."""
+        results = iter([
+            _completed([], returncode=1, stderr="HTTP 502"),
+            _completed([], stdout="o/r\n2024-05-06T07:08:09Z\n"),
+        ])
+        with patch("subprocess.run",
+                   side_effect=lambda *a, **k: next(results)) as mock:
+            assert gh_mod.check_repo_exists("o/r") is None
+            assert gh_mod.get_repo_created_date("o/r") == "2024-05-06"
+            assert gh_mod.check_repo_exists("o/r") == "o/r"
+        assert mock.call_count == 2
+
+    def test_malformed_created_at(self):
+        """A created_at that is not a real date yields None."""
+        with patch("subprocess.run", return_value=_completed(
+                [], stdout="o/r\n2024-13-45T00:00:00Z\n")):
+            assert gh_mod.get_repo_created_date("o/r") is None
@@ -3,9 +3,11 @@
 import json
 from unittest.mock import patch
 
+import pytest
+
 from ghtraf.gist import (
-    build_badge, build_initial_state,
-    create_badge_gist, create_archive_gist,
+    BADGE_GIST_FILES, build_badge, build_initial_state,
+    create_badge_gist, create_archive_gist, create_gists,
 )
 
 
@@ -83,6 +85,34 @@ class TestBadge:
         assert required.issubset(set(badge.keys()))
 
 
+class TestBadgeGistFiles:
+    """Test the pre-serialized badge gist file contents."""
+
+    def test_file_names(self):
+        """Should contain state.json plus the four badge files."""
+        assert set(BADGE_GIST_FILES) == {
+            "state.json", "installs.json", "downloads.json",
+            "clones.json", "views.json",
+        }
+
+    def test_matches_builders(self):
+        """Pre-serialized content should round-trip to the builder output."""
+        assert json.loads(BADGE_GIST_FILES["state.json"]) == build_initial_state()
+        for label in ("installs", "downloads", "clones", "views"):
+            assert json.loads(BADGE_GIST_FILES[f"{label}.json"]) == build_badge(label)
+
+    def test_payload_matches_full_dumps(self):
+        """The spliced payload should equal a compact dump of the whole dict."""
+        from ghtraf.gist import _badge_gist_payload
+        description, payload = _badge_gist_payload({"gh_repo": "o/r\"x"})
+        assert payload == json.dumps({
+            "description": description,
+            "public": True,
+            "files": {name: {"content": content}
+                      for name, content in BADGE_GIST_FILES.items()},
+        }, separators=(",", ":"))
+
+
 class TestCreateBadgeGist:
     """Test badge gist creation."""
 
@@ -186,3 +216,46 @@ class TestCreateArchiveGist:
         archive_content = json.loads(payload["files"]["archive.json"]["content"])
         assert "Monthly traffic archive for" in archive_content["description"]
         assert not archive_content["description"].startswith("[GTT]")
+
+
+class TestCreateGists:
+    """Test concurrent creation of both gists."""
+
+    @staticmethod
+    def _fake_run_gh(fail_public=None):
+        """Fake run_gh that answers per payload visibility."""
+        def fake(args, input_data=None, check=True):
+            public = json.loads(input_data)["public"]
+            if fail_public is not None and public == fail_public:
+                raise SystemExit(1)
+            gid = "badge_id" if public else "archive_id"
+            return json.dumps({"id": gid, "html_url": f"https://gist/{gid}"})
+        return fake
+
+    def test_dry_run_returns_placeholders(self):
+        """Dry run should return both placeholders without API calls."""
+        config = {"gh_repo": "testorg/testrepo"}
+        with patch("ghtraf.gist.run_gh") as mock:
+            ids = create_gists(config, dry_run=True)
+        assert ids == ("<DRY_RUN_BADGE_GIST_ID>", "<DRY_RUN_ARCHIVE_GIST_ID>")
+        mock.assert_not_called()
+
+    def test_creates_both_and_returns_ids_in_order(self, capsys):
+        """Should POST both payloads and return (badge, archive) IDs."""
+        config = {"gh_repo": "testorg/testrepo"}
+        with patch("ghtraf.gist.run_gh", side_effect=self._fake_run_gh()) as mock:
+            ids = create_gists(config)
+        assert ids == ("badge_id", "archive_id")
+        assert mock.call_count == 2
+        out = capsys.readouterr().out
+        assert out.index("Badge gist created") < out.index("Archive gist created")
+
+    def test_partial_failure_names_created_gist(self, capsys):
+        """If one POST fails, the other gist's ID should be reported."""
+        config = {"gh_repo": "testorg/testrepo"}
+        with patch("ghtraf.gist.run_gh",
+                   side_effect=self._fake_run_gh(fail_public=False)):
+            with pytest.raises(SystemExit):
+                create_gists(config)
+        out = capsys.readouterr().out
+        assert "Badge gist badge_id was created" in out
@@ -0,0 +1,194 @@
+"""
+Tests for ghtraf.lib.help_lib — help content rendering.
+
+Tests cover:
+- HelpContent.get_command placeholder substitution and precedence
+- Section and minimal-help rendering call get_command once per item
+- HelpSection lookups by context, id and category
+- HelpSection keeps items in priority order
+- HelpBuilder.get_random_tip candidate selection
+- DetailedHelpContent padding
+- HelpBuilder.build_standard_help displayed-item tracking
+"""
+
+from ghtraf.lib.help_lib.core import (
+    DetailedHelpContent,
+    HelpBuilder,
+    HelpContent,
+    HelpSection,
+)
+
+
+class TestGetCommand:
+    """Test HelpContent.get_command() rendering."""
+
+    def test_substitutes_prog_kwargs_and_defaults(self):
+        """prog, kwargs and default variables are all substituted."""
+        item = HelpContent("x", "{prog} {path} -o {out}", "desc",
+                           variables={"path": "a.txt", "out": "b.txt"})
+        assert item.get_command("ghtraf", out="c.txt") == "ghtraf a.txt -o c.txt"
+
+    def test_unknown_placeholder_left_verbatim(self):
+        """A placeholder with no value is kept as written."""
+        item = HelpContent("x", "{prog} {missing}", "desc")
+        assert item.get_command("ghtraf") == "ghtraf {missing}"
+
+    def test_static_command_unchanged(self):
+        """A command without placeholders renders as-is."""
+        item = HelpContent("x", "ghtraf --help", "desc")
+        assert item.get_command("other") == "ghtraf --help"
+
+    def test_substituted_value_not_rescanned(self):
+        """Braces inside a substituted value are not treated as placeholders."""
+        item = HelpContent("x", "{prog} {a}", "desc", variables={"b": "B"})
+        assert item.get_command("p", a="{b}") == "p {b}"
+
+
+class TestRenderOnce:
+    """Formatters reuse the command rendered for width measurement."""
+
+    @staticmethod
+    def _counting_section(monkeypatch):
+        calls = []
+        real = HelpContent.get_command
+
+        def counting(self, prog='app', **kwargs):
+            calls.append(self.id)
+            return real(self, prog, **kwargs)
+
+        monkeypatch.setattr(HelpContent, "get_command", counting)
+        section = HelpSection("basic", "Basic")
+        section.add_items(HelpContent("a", "{prog} one", "First"),
+                          HelpContent("b", "{prog} two --long", "Second"))
+        return section, calls
+
+    def test_format_section(self, monkeypatch):
+        """format_section renders each command once and aligns comments."""
+        section, calls = self._counting_section(monkeypatch)
+        text = section.format_section(prog="ghtraf")
+        assert sorted(calls) == ["a", "b"]
+        assert text.splitlines()[1] == "  ghtraf one         # First"
+
+    def test_build_minimal_help(self, monkeypatch):
+        """build_minimal_help renders each command once across both passes."""
+        section, calls = self._counting_section(monkeypatch)
+        builder = HelpBuilder(prog="ghtraf")
+        builder.add_section(section)
+        builder.build_minimal_help()
+        assert sorted(calls) == ["a", "b"]
+
+
+class TestSectionLookups:
+    """HelpSection getters return fresh lists from its indexes."""
+
+    @staticmethod
+    def _section():
+        section = HelpSection("basic", "Basic")
+        section.add_items(
+            HelpContent("a", "one", "A", category="setup", contexts={"minimal"}),
+            HelpContent("b", "two", "B", contexts={"standard"}),
+            HelpContent("c", "three", "C", category="setup"),
+        )
+        return section
+
+    def test_by_context(self):
+        """Equal-priority items are returned per context in insertion order."""
+        section = self._section()
+        assert [i.id for i in section.get_items_for_context("standard")] == ["b", "c"]
+        assert section.get_items_for_context("verbose") == []
+
+    def test_by_ids(self):
+        """Items come back in the requested order, without duplicates."""
+        section = self._section()
+        got = section.get_items_by_ids(["c", "a", "c", "zzz"])
+        assert [i.id for i in got] == ["c", "a"]
+
+    def test_by_category(self):
+        """Items are grouped by category."""
+        section = self._section()
+        assert [i.id for i in section.get_items_by_category("setup")] == ["a", "c"]
+
+    def test_results_are_copies(self):
+        """Mutating a returned list does not affect later lookups."""
+        section = self._section()
+        section.get_items_for_context("standard").clear()
+        assert len(section.get_items_for_context("standard")) == 2
+
+
+class TestPriorityOrder:
+    """Items are kept sorted by priority as they are added."""
+
+    def test_items_and_lookups_sorted(self):
+        """items and context lookups are priority-ordered, ties stable."""
+        section = HelpSection("basic", "Basic")
+        section.add_items(HelpContent("late", "x", "X", priority=90),
+                          HelpContent("first", "y", "Y", priority=10),
+                          HelpContent("tie", "z", "Z", priority=90))
+        assert [i.id for i in section.items] == ["first", "late", "tie"]
+        assert [i.id for i in section.get_items_for_context("minimal")] == \
+            ["first", "late", "tie"]
+
+    def test_minimal_help_shows_top_priority(self):
+        """build_minimal_help's per-section cap keeps the top priorities."""
+        section = HelpSection("basic", "Basic")
+        section.add_items(HelpContent("low", "{prog} low", "Low", priority=90),
+                          HelpContent("high", "{prog} high", "High", priority=1))
+        builder = HelpBuilder(prog="ghtraf")
+        builder.add_section(section)
+        text = builder.build_minimal_help(max_per_section=1)
+        assert "High" in text and "Low" not in text
+
+
+class TestRandomTip:
+    """get_random_tip() picks from items not yet displayed."""
+
+    def test_skips_displayed_items(self):
+        """Displayed items are excluded until the pool runs out."""
+        section = HelpSection("basic", "Basic")
+        section.add_items(HelpContent("a", "{prog} a", "A"),
+                          HelpContent("b", "{prog} b", "B"))
+        builder = HelpBuilder(prog="ghtraf")
+        builder.add_section(section)
+        builder.displayed_ids.add("a")
+        assert builder.get_random_tip() == "TIP: B: ghtraf b"
+        assert builder.get_random_tip() == ""
+
+    def test_sees_items_added_after_add_section(self):
+        """Items added to a section after registration are candidates."""
+        section = HelpSection("basic", "Basic")
+        builder = HelpBuilder(prog="ghtraf")
+        builder.add_section(section)
+        section.add_item(HelpContent("late", "{prog} late", "Late"))
+        assert builder.get_random_tip(exclude_displayed=False) == \
+            "TIP: Late: ghtraf late"
+
+
+class TestFormattedContent:
+    """DetailedHelpContent.get_formatted_content() padding."""
+
+    def test_pads_text_lines_and_empties_blank_ones(self):
+        """Lines with text get padding; whitespace-only lines become empty."""
+        item = DetailedHelpContent("d", "topic", "brief",
+                                   "first\n   \n  indented\n", "detailed")
+        assert item.get_formatted_content(padding="> ") == \
+            "> first\n\n>   indented\n"
+
+    def test_padding_taken_literally(self):
+        """Backslashes in the padding are not treated as group references."""
+        item = DetailedHelpContent("d", "topic", "brief", "x", "detailed")
+        assert item.get_formatted_content(padding="\\1 ") == "\\1 x"
+
+
+class TestStandardHelp:
+    """build_standard_help() output and displayed-item tracking."""
+
+    def test_records_displayed_ids(self):
+        """Every item shown in standard help is marked as displayed."""
+        section = HelpSection("basic", "Basic")
+        section.add_items(HelpContent("a", "{prog} a", "A"),
+                          HelpContent("m", "{prog} m", "M", contexts={"minimal"}))
+        builder = HelpBuilder(prog="ghtraf")
+        builder.add_section(section)
+        text = builder.build_standard_help()
+        assert text.startswith("Basic:\n  ghtraf a")
+        assert builder.displayed_ids == {"a"}
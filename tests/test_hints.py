@@ -4,7 +4,11 @@ import io
 
 import pytest
 
-from ghtraf.lib.log_lib import get_hint, OutputManager, init_output
+from ghtraf.lib.log_lib import (
+    get_hint, get_hints_by_category, register_hint, Hint,
+    OutputManager, init_output,
+)
+from ghtraf.lib.log_lib import hints as _hints_mod
 from ghtraf.lib.log_lib import manager as _manager_mod
 
 
@@ -50,6 +54,23 @@ class TestHintsRegistered:
     def test_config_hint_has_correct_category(self):
         assert get_hint('config.remember').category == 'config'
 
+    def test_hints_by_category(self):
+        """The category lookup returns every setup hint, in registry order."""
+        ids = [h.id for h in get_hints_by_category('setup')]
+        assert ids == [h.id for h in _hints_mod._HINTS.values()
+                       if h.category == 'setup']
+        assert {'setup.dry_run', 'setup.configure', 'setup.pat'} <= set(ids)
+
+    def test_overwrite_moves_category(self, monkeypatch):
+        """Re-registering an id under a new category updates the index."""
+        monkeypatch.setattr(_hints_mod, '_HINTS', dict(_hints_mod._HINTS))
+        monkeypatch.setattr(_hints_mod, '_HINTS_BY_CATEGORY',
+                            _hints_mod.defaultdict(list))
+        register_hint(Hint(id='test.moved', message='x', category='alpha'))
+        register_hint(Hint(id='test.moved', message='y', category='beta'))
+        assert get_hints_by_category('alpha') == []
+        assert [h.message for h in get_hints_by_category('beta')] == ['y']
+
 
 # ---------------------------------------------------------------------------
 # Context and level tests
@@ -82,10 +103,31 @@ class TestHintFiringInContext:
         """Same hint only fires once per session."""
         buf = io.StringIO()
         out = OutputManager(verbosity=0, file=buf)
+        assert not out.hint_shown('config.remember')
         out.hint('config.remember', 'result')
         first_len = len(buf.getvalue())
         out.hint('config.remember', 'result')
         assert len(buf.getvalue()) == first_len
+        assert out.hint_shown('config.remember')
+
+    def test_hint_registered_after_first_call(self, monkeypatch):
+        """A hint registered after a missed lookup still fires later."""
+        monkeypatch.setattr(_hints_mod, '_HINTS', dict(_hints_mod._HINTS))
+        buf = io.StringIO()
+        out = OutputManager(verbosity=0, file=buf)
+        out.hint('test.late', 'result')
+        register_hint(Hint(id='test.late', message='late hint',
+                           context={'result'}, min_level=0))
+        out.hint('test.late', 'result')
+        assert buf.getvalue() == "late hint\n"
+
+    def test_wrong_context_repeated(self):
+        """A hint outside its context stays silent on repeat calls."""
+        buf = io.StringIO()
+        out = OutputManager(verbosity=3, file=buf)
+        out.hint('config.remember', 'error')
+        out.hint('config.remember', 'error')
+        assert buf.getvalue() == ""
 
     def test_hint_suppressed_at_hard_wall(self):
         """Hints are suppressed at hard wall (-4)."""
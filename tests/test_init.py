@@ -21,9 +21,16 @@ from ghtraf.cli import main
 from ghtraf.commands.create import (
     _discover_repo_dir, TEMPLATE_FILES,
 )
+from ghtraf.config import find_repo_markers
 from ghtraf.lib.log_lib import manager as _manager_mod
 
 
+def _ignore_project_config():
+    """Patch out .ghtraf.json discovery, keeping the .git walk-up."""
+    return patch("ghtraf.commands.create.find_repo_markers",
+                 side_effect=lambda start: (None, find_repo_markers(start)[1]))
+
+
 @pytest.fixture(autouse=True)
 def _reset_manager():
     """Reset OutputManager singleton between tests."""
@@ -189,6 +196,47 @@ class TestInitDefaultPrompts:
 
         assert sentinel.read_text(encoding="utf-8") == "EXISTING"
 
+    @staticmethod
+    def _make_conflicts(tmp_path):
+        paths = [tmp_path / rel for rel in TEMPLATE_FILES[:2]]
+        for path in paths:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("EXISTING", encoding="utf-8")
+        return paths
+
+    def test_several_conflicts_asked_once(self, tmp_path):
+        """Multiple conflicts get a single up-front question."""
+        paths = self._make_conflicts(tmp_path)
+
+        with patch("builtins.input", return_value="y") as mock_input:
+            main(["create", "--files-only", "--repo-dir", str(tmp_path)])
+
+        assert mock_input.call_count == 1
+        for path in paths:
+            assert path.read_text(encoding="utf-8") != "EXISTING"
+
+    def test_several_conflicts_default_skips(self, tmp_path):
+        """Pressing Enter at the up-front question keeps every file."""
+        paths = self._make_conflicts(tmp_path)
+
+        with patch("builtins.input", return_value=""):
+            main(["create", "--files-only", "--repo-dir", str(tmp_path)])
+
+        for path in paths:
+            assert path.read_text(encoding="utf-8") == "EXISTING"
+
+    def test_several_conflicts_each_prompts_per_file(self, tmp_path):
+        """Answering 'e' falls back to the per-file prompt."""
+        first, second = self._make_conflicts(tmp_path)
+        answers = iter(["e", "y", "n"])
+
+        with patch("builtins.input", side_effect=lambda _="": next(answers)):
+            main(["create", "--files-only", "--repo-dir", str(tmp_path)])
+
+        changed = [p.read_text(encoding="utf-8") != "EXISTING"
+                   for p in (first, second)]
+        assert sorted(changed) == [False, True]
+
 
 # ---------------------------------------------------------------------------
 # Repo discovery
@@ -209,8 +257,8 @@ class TestInitRepoDiscovery:
         (tmp_path / ".ghtraf.json").write_text('{"owner":"x"}', encoding="utf-8")
 
         args = argparse.Namespace(repo_dir=None)
-        with patch("ghtraf.commands.create.find_project_config") as mock_find:
-            mock_find.return_value = tmp_path / ".ghtraf.json"
+        with patch("ghtraf.commands.create.find_repo_markers") as mock_find:
+            mock_find.return_value = (tmp_path / ".ghtraf.json", None)
             result = _discover_repo_dir(args)
         assert result == tmp_path
 
@@ -220,7 +268,7 @@ class TestInitRepoDiscovery:
         (tmp_path / ".git").mkdir()
 
         args = argparse.Namespace(repo_dir=None, non_interactive=False)
-        with patch("ghtraf.commands.create.find_project_config", return_value=None):
+        with _ignore_project_config():
             with patch("pathlib.Path.cwd", return_value=tmp_path):
                 result = _discover_repo_dir(args)
         assert result == tmp_path
@@ -235,7 +283,7 @@ class TestInitRepoDiscovery:
         child.mkdir()
 
         args = argparse.Namespace(repo_dir=None, non_interactive=False)
-        with patch("ghtraf.commands.create.find_project_config", return_value=None):
+        with _ignore_project_config():
             with patch("pathlib.Path.cwd", return_value=child):
                 with patch("builtins.input", return_value="y"):
                     result = _discover_repo_dir(args)
@@ -251,7 +299,7 @@ class TestInitRepoDiscovery:
         child.mkdir()
 
         args = argparse.Namespace(repo_dir=None, non_interactive=False)
-        with patch("ghtraf.commands.create.find_project_config", return_value=None):
+        with _ignore_project_config():
             with patch("pathlib.Path.cwd", return_value=child):
                 with patch("builtins.input", return_value="n"):
                     result = _discover_repo_dir(args)
@@ -267,7 +315,7 @@ class TestInitRepoDiscovery:
         child.mkdir()
 
         args = argparse.Namespace(repo_dir=None, non_interactive=True)
-        with patch("ghtraf.commands.create.find_project_config", return_value=None):
+        with _ignore_project_config():
             with patch("pathlib.Path.cwd", return_value=child):
                 result = _discover_repo_dir(args)
         assert result == parent
@@ -281,12 +329,25 @@ class TestInitRepoDiscovery:
         (tmp_path / ".git").mkdir()
 
         args = argparse.Namespace(repo_dir=None, non_interactive=False)
-        with patch("ghtraf.commands.create.find_project_config", return_value=None):
+        with _ignore_project_config():
             with patch("pathlib.Path.cwd", return_value=tmp_path):
                 # If input() were called, it would raise (no mock)
                 result = _discover_repo_dir(args)
         assert result == tmp_path
 
+    def test_ghtraf_json_in_parent_beats_git_in_cwd(self, tmp_path):
+        """.ghtraf.json anywhere up the tree outranks a nearer .git."""
+        import argparse
+        (tmp_path / ".ghtraf.json").write_text('{"owner":"x"}', encoding="utf-8")
+        child = tmp_path / "sub"
+        child.mkdir()
+        (child / ".git").mkdir()
+
+        args = argparse.Namespace(repo_dir=None, non_interactive=True)
+        with patch("pathlib.Path.cwd", return_value=child):
+            result = _discover_repo_dir(args)
+        assert result == tmp_path.resolve()
+
     def test_falls_back_to_cwd(self, tmp_path):
         """Falls back to cwd when no .ghtraf.json or .git found.
 
@@ -296,7 +357,7 @@ class TestInitRepoDiscovery:
         """
         import argparse
         args = argparse.Namespace(repo_dir=None, non_interactive=True)
-        with patch("ghtraf.commands.create.find_project_config", return_value=None):
+        with _ignore_project_config():
             with patch("pathlib.Path.cwd", return_value=tmp_path):
                 result = _discover_repo_dir(args)
         # Should return a valid resolved path (either from .git walk-up or cwd)
@@ -453,7 +514,7 @@ class TestInitLiveRepo:
         import argparse
 
         args = argparse.Namespace(repo_dir=None)
-        with patch("ghtraf.commands.create.find_project_config", return_value=None):
+        with _ignore_project_config():
             with patch("pathlib.Path.cwd", return_value=live_papers_repo):
                 result = _discover_repo_dir(args)
         assert result == live_papers_repo
@@ -14,8 +14,10 @@ from ghtraf.lib.log_lib import (
     OutputManager,
     init_output,
     get_output,
+    trace,
 )
 from ghtraf.lib.log_lib import channels as _channels_mod
+from ghtraf.lib.log_lib import manager as _manager_mod
 from ghtraf.lib.log_lib.channels import (
     ChannelConfig,
     parse_channel_spec,
@@ -127,6 +129,51 @@ class TestPerChannelOverrides:
         out.emit(-3, "even errors", channel='timing')
         assert buf.getvalue() == ""
 
+    def test_raising_verbosity_reopens_gate(self, buf):
+        """Setting verbosity after init is honoured by emit()."""
+        out = OutputManager(verbosity=0, file=buf)
+        out.emit(2, "hidden")
+        out.verbosity = 2
+        out.emit(2, "shown")
+        assert buf.getvalue() == "shown\n"
+
+    def test_set_channel_override(self, buf):
+        """set_channel_override() pins and clears a channel threshold."""
+        out = OutputManager(verbosity=0, file=buf)
+        out.set_channel_override('timing', 3)
+        out.emit(3, "pinned", channel='timing')
+        out.set_channel_override('timing', None)
+        out.emit(3, "cleared", channel='timing')
+        assert buf.getvalue() == "pinned\n"
+        assert 'timing' not in out.channel_overrides
+
+    def test_channel_overrides_read_only(self, buf):
+        """Direct writes fail loudly instead of bypassing the emit gate."""
+        out = OutputManager(verbosity=0, file=buf)
+        with pytest.raises(TypeError):
+            out.channel_overrides['timing'] = 3
+        out.channel_overrides = {'timing': 3}
+        out.emit(3, "shown", channel='timing')
+        assert buf.getvalue() == "shown\n"
+
+    def test_would_emit_matches_emit(self):
+        """would_emit() applies the same override and hard-wall rules."""
+        out = OutputManager(verbosity=0,
+                            channel_overrides={'timing': 2, 'api': -4})
+        assert out.would_emit(0) is True
+        assert out.would_emit(1) is False
+        assert out.would_emit(2, 'timing') is True
+        assert out.would_emit(-3, 'api') is False
+
+    def test_progress_gated_on_channel(self, buf):
+        """progress() prints only when the progress channel allows level 1."""
+        out = OutputManager(verbosity=0, file=buf)
+        out.progress(5, 1.25)
+        assert buf.getvalue() == ""
+        out.set_channel_override('progress', 1)
+        out.progress(5, 1.25)
+        assert buf.getvalue() == "  ... 5 results (1.2s)\n"
+
 
 # =============================================================================
 # THAC0 Composition (verbose - quiet)
@@ -247,6 +294,19 @@ class TestParseChannelSpec:
         cfg = parse_channel_spec("timing:2:file:C:\\logs\\out.log")
         assert cfg.location == "C:\\logs\\out.log"
 
+    def test_drive_letter_with_format(self):
+        """A drive-letter location still leaves the format slot intact."""
+        cfg = parse_channel_spec("timing::file:D:\\out.csv:csv")
+        assert cfg.location == "D:\\out.csv"
+        assert cfg.format == "csv"
+
+    def test_empty_slots_are_none(self):
+        """Empty DEST/LOCATION slots stay None rather than ''."""
+        cfg = parse_channel_spec("timing:1:::json")
+        assert cfg.destination is None
+        assert cfg.location is None
+        assert cfg.format == "json"
+
 
 # =============================================================================
 # Known Channels
@@ -270,6 +330,15 @@ class TestKnownChannels:
         for ch in KNOWN_CHANNELS:
             assert ch in listing
 
+    def test_format_channel_list_follows_replaced_tables(self):
+        """Rebinding the channel tables refreshes the cached listing."""
+        format_channel_list()
+        _channels_mod.KNOWN_CHANNELS = frozenset({'only'})
+        _channels_mod.CHANNEL_DESCRIPTIONS = {'only': 'The only channel'}
+        listing = format_channel_list()
+        assert 'only' in listing
+        assert 'timing' not in listing
+
 
 # =============================================================================
 # Init Output with Channels
@@ -296,6 +365,68 @@ class TestInitOutputChannels:
         assert mgr.channel_overrides.get('vals') == 2
 
 
+# =============================================================================
+# Trace Decorator
+# =============================================================================
+
+@trace
+def _doubled(x):
+    return x * 2
+
+
+@trace
+def _fails():
+    raise ValueError("bad {value}")
+
+
+class TestTrace:
+    """Test the @trace decorator."""
+
+    def test_silent_when_trace_inactive(self, buf, monkeypatch):
+        """With the trace channel off, the call just runs."""
+        monkeypatch.setattr(_manager_mod, '_manager',
+                            OutputManager(verbosity=0, file=buf))
+        assert _doubled(2) == 4
+        assert buf.getvalue() == ""
+
+    def test_entry_and_exit_traced(self, buf, monkeypatch):
+        """With trace at level 3, entry and return value are emitted."""
+        monkeypatch.setattr(_manager_mod, '_manager', OutputManager(
+            verbosity=0, channel_overrides={'trace': 3}, file=buf))
+        assert _doubled(2) == 4
+        lines = buf.getvalue().splitlines()
+        assert lines[0].startswith(f"[TRACE] >> {__name__}._doubled(")
+        assert lines[1] == f"[TRACE] << {__name__}._doubled returned: 4"
+
+    def test_exception_traced(self, buf, monkeypatch):
+        """A raised exception is traced verbatim and re-raised."""
+        monkeypatch.setattr(_manager_mod, '_manager', OutputManager(
+            verbosity=0, channel_overrides={'trace': 3}, file=buf))
+        with pytest.raises(ValueError):
+            _fails()
+        assert buf.getvalue().splitlines()[-1] == \
+            f"[TRACE] !! {__name__}._fails raised: ValueError: bad {{value}}"
+
+    def test_subchannel_pinned_off(self, buf, monkeypatch):
+        """Pinning trace.entry below 3 keeps only the exit record."""
+        monkeypatch.setattr(_manager_mod, '_manager', OutputManager(
+            verbosity=0, channel_overrides={'trace': 3, 'trace.entry': -1},
+            file=buf))
+        assert _doubled(2) == 4
+        assert buf.getvalue() == \
+            f"[TRACE] << {__name__}._doubled returned: 4\n"
+
+    def test_subchannel_on_without_trace(self, buf, monkeypatch):
+        """A sub-channel can be enabled while 'trace' itself stays off."""
+        monkeypatch.setattr(_manager_mod, '_manager', OutputManager(
+            verbosity=0, channel_overrides={'trace': -1, 'trace.exc': 3},
+            file=buf))
+        assert _doubled(2) == 4
+        with pytest.raises(ValueError):
+            _fails()
+        assert buf.getvalue().startswith(f"[TRACE] !! {__name__}._fails")
+
+
 # =============================================================================
 # Vals Channel Integration — PSS-specific (removed)
 # =============================================================================
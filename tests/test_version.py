@@ -69,3 +69,11 @@ def test_pip_version_no_phase():
     if PHASE is None:
         assert re.match(r"^\d+\.\d+\.\d+$", pip_ver), \
             f"No phase should give plain version: {pip_ver}"
+
+
+def test_pip_version_dev_branch(monkeypatch):
+    """Non-main branches should append .devN from the build number."""
+    import ghtraf._version as version_mod
+    monkeypatch.setattr(version_mod, "_PARTS",
+                        "0.3.6-alpha_dev_21-20260303-49968de".split("_"))
+    assert get_pip_version().endswith(".dev21")